@@ -4,10 +4,14 @@ Displays directory contents with navigation, selection, and sorting capabilities
 Includes DirectoryCache integration for 10x performance improvement.
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Set, Any
 from datetime import datetime
 import logging
+import os
+import stat as stat_module
 
 from textual.app import ComposeResult
 from textual.containers import Container
@@ -35,6 +39,25 @@ class FilePanel(Container):
     _dir_cache: Optional[DirectoryCache[List[FileItem]]] = None
     _cache_initialized: bool = False
 
+    # Resolved paths shared across panels, least recently used first;
+    # revisiting a directory skips the per-component lstat() calls of
+    # Path.resolve()
+    _resolve_cache: "OrderedDict[str, Path]" = OrderedDict()
+    RESOLVE_CACHE_SIZE = 512
+
+    # Background loader shared by all panels, started on first navigation;
+    # warms the directory cache for the parent and first few subdirectories
+    _prefetch_pool: Optional[ThreadPoolExecutor] = None
+    PREFETCH_SUBDIRS = 8
+
+    # Sort keys per column: parent entry first, then directories, then files.
+    # Names use FileItem.sort_name, lowercased once when the item is built.
+    _SORT_KEYS = {
+        "name": lambda x: (not x.is_parent, not x.is_dir, x.sort_name),
+        "size": lambda x: (not x.is_parent, not x.is_dir, x.size),
+        "modified": lambda x: (not x.is_parent, not x.is_dir, x.modified),
+    }
+
     DEFAULT_CSS = """
     FilePanel {
         border: solid #00FFFF;
@@ -153,7 +176,7 @@ class FilePanel(Container):
         """
         super().__init__(name=name, id=id, classes=classes)
         if path:
-            self.current_path = path.resolve()
+            self.current_path = self._cached_resolve(path)
         self._file_items: List[FileItem] = []
         self._sorted_items: List[FileItem] = []  # Track currently displayed items
         self._group_selector = GroupSelector()
@@ -173,7 +196,8 @@ class FilePanel(Container):
                 if cache_config.enabled:
                     cls._dir_cache = DirectoryCache[List[FileItem]](
                         maxsize=cache_config.maxsize,
-                        ttl_seconds=cache_config.ttl_seconds
+                        ttl_seconds=cache_config.ttl_seconds,
+                        admission_filter=True
                     )
                     logger.info(
                         f"DirectoryCache initialized: maxsize={cache_config.maxsize}, "
@@ -190,6 +214,55 @@ class FilePanel(Container):
                 cls._dir_cache = None
                 cls._cache_initialized = True
 
+    @classmethod
+    def _cached_resolve(cls, path: Path) -> Path:
+        """Resolve path, reusing earlier results for the same input.
+
+        Args:
+            path: Path to resolve
+
+        Returns:
+            Absolute path with symlinks resolved
+        """
+        # Relative paths depend on the working directory, so never cache them
+        if not path.is_absolute():
+            return path.resolve()
+
+        key = str(path)
+        resolved = cls._resolve_cache.get(key)
+        if resolved is not None:
+            cls._resolve_cache.move_to_end(key)
+            return resolved
+
+        # Entry of an already-canonical directory: only the last component
+        # can be a symlink, so one lstat replaces a full resolve()
+        parent = path.parent
+        if (path.name not in ("", ".", "..")
+                and cls._resolve_cache.get(str(parent)) == parent
+                and not path.is_symlink()):
+            resolved = path
+        else:
+            resolved = path.resolve()
+
+        cls._resolve_cache[key] = resolved
+
+        # A canonical path and all of its ancestors resolve to themselves
+        for canonical in (resolved, *resolved.parents):
+            cls._resolve_cache.setdefault(str(canonical), canonical)
+
+        while len(cls._resolve_cache) > cls.RESOLVE_CACHE_SIZE:
+            cls._resolve_cache.popitem(last=False)
+        return resolved
+
+    @classmethod
+    def _forget_resolved(cls, path: Path) -> None:
+        """Drop a cached resolution so the next lookup resolves afresh.
+
+        Args:
+            path: Path as passed to _cached_resolve
+        """
+        cls._resolve_cache.pop(str(path), None)
+
     @classmethod
     def get_cache_stats(cls) -> Optional[dict]:
         """Get cache statistics.
@@ -204,6 +277,7 @@ class FilePanel(Container):
     @classmethod
     def clear_cache(cls) -> None:
         """Clear the entire directory cache."""
+        cls._resolve_cache.clear()
         if cls._dir_cache is not None:
             cls._dir_cache.clear()
             logger.info("DirectoryCache cleared")
@@ -239,6 +313,7 @@ class FilePanel(Container):
                 header = self.query_one(".panel-header", Static)
                 header.update(str(path))
                 self.refresh_directory()
+                self._schedule_prefetch()
                 self.post_message(self.DirectoryChanged(path))
             except Exception:
                 # Widget not yet composed
@@ -272,7 +347,10 @@ class FilePanel(Container):
             force: If True, bypass cache and force fresh load
         """
         try:
-            # Force refresh invalidates cache
+            # Force refresh invalidates cache; symlinks may have been
+            # re-pointed, so resolved paths are dropped too
+            if force:
+                self._resolve_cache.clear()
             if force and self._dir_cache is not None:
                 self._dir_cache.invalidate(self.current_path)
                 logger.debug(f"Cache invalidated for: {self.current_path}")
@@ -332,23 +410,73 @@ class FilePanel(Container):
                 is_parent=True,
             ))
 
-        # Add directory contents
-        for entry in path.iterdir():
-            try:
-                stat = entry.stat()
-                items.append(FileItem(
-                    name=entry.name,
-                    path=entry,
-                    size=stat.st_size if entry.is_file() else 0,
-                    modified=datetime.fromtimestamp(stat.st_mtime),
-                    is_dir=entry.is_dir(),
-                ))
-            except (PermissionError, OSError):
-                # Skip inaccessible entries
-                continue
+        # Add directory contents in a single scandir pass. One stat per
+        # entry supplies size, mtime and type, instead of separate
+        # stat/is_file/is_dir calls on each Path.
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                    items.append(FileItem(
+                        name=entry.name,
+                        path=Path(entry.path),
+                        size=stat.st_size if stat_module.S_ISREG(stat.st_mode) else 0,
+                        modified=datetime.fromtimestamp(stat.st_mtime),
+                        is_dir=stat_module.S_ISDIR(stat.st_mode),
+                    ))
+                except (PermissionError, OSError):
+                    # Skip inaccessible entries
+                    continue
 
         return items
 
+    def _schedule_prefetch(self) -> None:
+        """Queue likely next directories for background cache loading."""
+        if self._dir_cache is None:
+            return
+
+        subdirs = [item.path for item in self._file_items
+                   if item.is_dir and not item.is_parent]
+        targets = []
+        if self.current_path.parent != self.current_path:
+            targets.append(self.current_path.parent)
+        targets.extend(subdirs[:self.PREFETCH_SUBDIRS])
+
+        pool = self._get_prefetch_pool()
+        for target in targets:
+            pool.submit(self._prefetch_directory, target)
+
+    @classmethod
+    def _get_prefetch_pool(cls) -> ThreadPoolExecutor:
+        """Get the shared prefetch pool, creating it on first use."""
+        if cls._prefetch_pool is None:
+            cls._prefetch_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="dir-prefetch"
+            )
+        return cls._prefetch_pool
+
+    @classmethod
+    def shutdown_prefetch(cls) -> None:
+        """Stop the shared prefetch pool, dropping queued prefetches."""
+        pool, cls._prefetch_pool = cls._prefetch_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _prefetch_directory(self, path: Path) -> None:
+        """Load a directory into the shared cache (runs on prefetch pool).
+
+        Args:
+            path: Directory path to load
+        """
+        cache = self._dir_cache
+        if cache is None:
+            return
+
+        try:
+            cache.prefetch(path, self._load_directory_uncached)
+        except OSError as e:
+            logger.debug(f"Prefetch skipped for {path}: {e}")
+
     def _invalidate_cache_for_path(self, path: Path) -> None:
         """Invalidate cache for a specific path.
 
@@ -363,6 +491,10 @@ class FilePanel(Container):
 
     def _sort_and_display(self) -> None:
         """Sort items and update display."""
+        # Reached after every reload, sort and hidden-files change, so the
+        # quick search index is rebuilt here rather than per keystroke
+        self._quick_search.prime(self._file_items)
+
         # Filter hidden files if needed
         items_to_display = self._file_items
         if not self.show_hidden:
@@ -372,13 +504,7 @@ class FilePanel(Container):
             ]
 
         # Sort items
-        sort_key_map = {
-            "name": lambda x: (not x.is_parent, not x.is_dir, x.name.lower()),
-            "size": lambda x: (not x.is_parent, not x.is_dir, x.size),
-            "modified": lambda x: (not x.is_parent, not x.is_dir, x.modified),
-        }
-
-        key_func = sort_key_map.get(self.sort_column, sort_key_map["name"])
+        key_func = self._SORT_KEYS.get(self.sort_column, self._SORT_KEYS["name"])
         sorted_items = sorted(
             items_to_display,
             key=key_func,
@@ -399,11 +525,13 @@ class FilePanel(Container):
             # Format row based on current view mode
             row_data = ViewModeConfig.format_row(item, self.view_mode)
 
+            # Row key doubles as the selection key
+            row_key = str(item.path)
+
             # Check if file is selected
-            style = "bold yellow" if str(item.path) in self.selected_files else None
+            style = "bold yellow" if row_key in self.selected_files else None
 
             # Add row with duplicate key protection
-            row_key = str(item.path)
             if row_key not in added_keys:
                 try:
                     table.add_row(
@@ -513,7 +641,12 @@ class FilePanel(Container):
             path: Target directory path
         """
         if path.is_dir():
-            self.current_path = path.resolve()
+            resolved = self._cached_resolve(path)
+            if not resolved.is_dir():
+                # Cached target was removed or re-pointed since
+                self._forget_resolved(path)
+                resolved = self._cached_resolve(path)
+            self.current_path = resolved
             self.clear_selection()
 
     def navigate_up(self) -> None:
@@ -100,7 +100,9 @@ class MenuCategory(Vertical):
         """
         super().__init__(name=name, id=id)
         self.title = title
-        self.actions = actions
+        # Fixed once built; the count is kept for wrap-around navigation
+        self.actions: Tuple[MenuAction, ...] = tuple(actions)
+        self._n = len(self.actions)
         self.selected_index = 0
 
     def compose(self) -> ComposeResult:
@@ -127,18 +129,22 @@ class MenuCategory(Vertical):
         Args:
             index: Item index
         """
-        if 0 <= index < len(self.actions):
+        if 0 <= index < self._n:
             self.selected_index = index
             self._update_selection()
 
     def select_next(self) -> None:
         """Select next menu item."""
-        self.selected_index = (self.selected_index + 1) % len(self.actions)
+        if not self._n:
+            return
+        self.selected_index = (self.selected_index + 1) % self._n
         self._update_selection()
 
     def select_previous(self) -> None:
         """Select previous menu item."""
-        self.selected_index = (self.selected_index - 1) % len(self.actions)
+        if not self._n:
+            return
+        self.selected_index = (self.selected_index - 1) % self._n
         self._update_selection()
 
     def get_selected_action(self) -> Optional[MenuAction]:
@@ -147,7 +153,7 @@ class MenuCategory(Vertical):
         Returns:
             Selected MenuAction or None
         """
-        if 0 <= self.selected_index < len(self.actions):
+        if 0 <= self.selected_index < self._n:
             return self.actions[self.selected_index]
         return None
 
@@ -274,12 +274,17 @@ class StatusBar(Horizontal):
                 item.size for item in selected_items if not item.is_dir
             )
 
-        # Update totals
+        # Update totals in a single pass over the listing
         if total_items is not None:
-            self.total_count = sum(1 for item in total_items if not item.is_parent)
-            self.total_size = sum(
-                item.size for item in total_items if not item.is_dir
-            )
+            total_count = 0
+            total_size = 0
+            for item in total_items:
+                if not item.is_parent:
+                    total_count += 1
+                if not item.is_dir:
+                    total_size += item.size
+            self.total_count = total_count
+            self.total_size = total_size
 
         # Update path
         if path is not None:
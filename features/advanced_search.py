@@ -12,6 +12,7 @@ Performance Features:
 - Search history with autocomplete
 """
 
+import os
 import re
 import fnmatch
 from pathlib import Path
@@ -27,6 +28,15 @@ from features.search_indexer import FileIndexer, SearchIndex, IndexEntry
 from features.search_cache import QueryCache, SearchHistoryCache
 
 
+def _entry_result(entry: IndexEntry) -> SearchResult:
+    """Build a search result from an index entry without stat-ing the file"""
+    return SearchResult(
+        path=entry.path,
+        file_size=entry.size,
+        modified_time=datetime.fromtimestamp(entry.modified)
+    )
+
+
 @dataclass
 class AdvancedSearchOptions(SearchOptions):
     """Extended search options with advanced features"""
@@ -155,7 +165,8 @@ class AdvancedFileSearch:
         # Fuzzy search
         fuzzy_results = index.search_fuzzy(
             pattern,
-            max_results=options.max_fuzzy_results
+            max_results=options.max_fuzzy_results,
+            min_score=options.fuzzy_threshold
         )
 
         # Filter by threshold
@@ -167,7 +178,7 @@ class AdvancedFileSearch:
 
         # Convert to SearchResult
         results = [
-            (SearchResult(path=entry.path), score)
+            (_entry_result(entry), score)
             for entry, score in filtered
         ]
 
@@ -361,12 +372,10 @@ class AdvancedFileSearch:
 
         # Apply extension filter if specified
         if options.file_extensions:
-            entries = [
-                e for e in entries
-                if e.extension in [ext.lower() for ext in options.file_extensions]
-            ]
+            extensions = {ext.lower() for ext in options.file_extensions}
+            entries = [e for e in entries if e.extension in extensions]
 
-        return [SearchResult(path=entry.path) for entry in entries]
+        return [_entry_result(entry) for entry in entries]
 
     def _indexed_wildcard_search(
         self,
@@ -382,24 +391,28 @@ class AdvancedFileSearch:
             prefix = pattern[:-1]
             entries = index.search_prefix(prefix, options.case_sensitive)
         else:
-            # Full wildcard matching - iterate entries
+            # Full wildcard matching - translate the pattern once and run
+            # the compiled regex over the names; case-insensitive search
+            # matches the lowercase names stored in the index
             if options.case_sensitive:
-                match_func = lambda name: fnmatch.fnmatch(name, pattern)
+                match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+                entries = [
+                    entry for entry in index.entries
+                    if entry and match(os.path.normcase(entry.name))
+                ]
             else:
-                pattern_lower = pattern.lower()
-                match_func = lambda name: fnmatch.fnmatch(name.lower(), pattern_lower)
-
-            entries = [
-                entry for entry in index.entries
-                if entry and match_func(entry.name)
-            ]
+                match = re.compile(fnmatch.translate(pattern.lower())).match
+                entries = [
+                    entry for entry in index.entries
+                    if entry and match(entry.name_lower)
+                ]
 
         # Apply extension filter
         if options.file_extensions:
-            extensions = [ext.lower() for ext in options.file_extensions]
+            extensions = {ext.lower() for ext in options.file_extensions}
             entries = [e for e in entries if e.extension in extensions]
 
-        return [SearchResult(path=entry.path) for entry in entries]
+        return [_entry_result(entry) for entry in entries]
 
     def _indexed_regex_search(
         self,
@@ -417,20 +430,21 @@ class AdvancedFileSearch:
             raise ValueError(f"Invalid regex pattern: {e}")
 
         # Search all entries
+        search = regex.search
         matching_entries = [
             entry for entry in index.entries
-            if entry and regex.search(entry.name)
+            if entry and search(entry.name)
         ]
 
         # Apply extension filter
         if options.file_extensions:
-            extensions = [ext.lower() for ext in options.file_extensions]
+            extensions = {ext.lower() for ext in options.file_extensions}
             matching_entries = [
                 e for e in matching_entries
                 if e.extension in extensions
             ]
 
-        return [SearchResult(path=entry.path) for entry in matching_entries]
+        return [_entry_result(entry) for entry in matching_entries]
 
     def _traditional_search(
         self,
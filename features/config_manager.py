@@ -7,6 +7,7 @@ Provides type-safe configuration access with validation and defaults.
 
 import json
 import os
+from operator import attrgetter
 from typing import Dict, Any, Optional
 from pathlib import Path
 from dataclasses import dataclass, asdict, field
@@ -156,15 +157,16 @@ class ConfigManager:
             return self._config
 
         try:
-            if self.config_path.exists():
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._config = self._dict_to_config(data)
-            else:
-                # Create default configuration
-                self._config = Config()
-                self._set_default_panel_paths()
-                self.save_config()
+            # Open directly rather than stat first; a missing file is the
+            # rare first-run case
+            data = json.loads(self.config_path.read_bytes())
+            self._config = self._dict_to_config(data)
+
+        except FileNotFoundError:
+            # Create default configuration
+            self._config = Config()
+            self._set_default_panel_paths()
+            self.save_config()
 
         except (json.JSONDecodeError, IOError, ValueError) as e:
             # Log error and use defaults
@@ -184,6 +186,7 @@ class ConfigManager:
         if self._config is None:
             return False
 
+        tmp_path = self.config_path.with_suffix(".json.tmp")
         try:
             # Ensure directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -191,14 +194,21 @@ class ConfigManager:
             # Convert config to dictionary
             config_dict = self._config_to_dict(self._config)
 
-            # Write with pretty formatting
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            # Serialize in one call, then write to a temp file and swap it
+            # in so a crash mid-write never leaves a truncated config
+            content = json.dumps(config_dict, indent=2, ensure_ascii=False)
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, self.config_path)
 
             return True
 
         except (IOError, OSError) as e:
             print(f"Error: Failed to save config to {self.config_path}: {e}")
+            # Don't leave a partial temp file behind
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
             return False
 
     def _set_default_panel_paths(self) -> None:
@@ -382,33 +392,46 @@ class ConfigManager:
         Returns:
             List of validation error messages (empty if valid)
         """
-        issues = []
         config = self.get_config()
 
-        # Validate panel paths exist
-        if config.left_panel.start_path and not Path(config.left_panel.start_path).exists():
-            issues.append(f"Left panel path does not exist: {config.left_panel.start_path}")
+        issues = []
+        for getter, is_valid, message in _VALIDATION_RULES:
+            value = getter(config)
+            if not is_valid(value):
+                issues.append(message.format(value))
 
-        if config.right_panel.start_path and not Path(config.right_panel.start_path).exists():
-            issues.append(f"Right panel path does not exist: {config.right_panel.start_path}")
+        return issues
 
-        # Validate cache settings
-        if config.cache.maxsize < 1 or config.cache.maxsize > 1000:
-            issues.append(f"Invalid cache maxsize: {config.cache.maxsize} (must be 1-1000)")
 
-        if config.cache.ttl_seconds < 1 or config.cache.ttl_seconds > 3600:
-            issues.append(f"Invalid cache TTL: {config.cache.ttl_seconds} (must be 1-3600)")
+def _path_exists_or_unset(path: str) -> bool:
+    """Check a configured start path is empty or exists on disk."""
+    return not path or Path(path).exists()
 
-        # Validate editor settings
-        if config.editor.tab_size < 1 or config.editor.tab_size > 16:
-            issues.append(f"Invalid tab size: {config.editor.tab_size} (must be 1-16)")
 
-        # Validate view settings
-        valid_formats = ["auto", "bytes", "kb", "mb", "gb"]
-        if config.view.file_size_format not in valid_formats:
-            issues.append(f"Invalid file size format: {config.view.file_size_format}")
+# Validation rules as (value getter, predicate, message); the message is
+# formatted with the offending value
+_VALIDATION_RULES = (
+    # Panel paths exist
+    (attrgetter("left_panel.start_path"), _path_exists_or_unset,
+     "Left panel path does not exist: {}"),
+    (attrgetter("right_panel.start_path"), _path_exists_or_unset,
+     "Right panel path does not exist: {}"),
 
-        return issues
+    # Cache settings
+    (attrgetter("cache.maxsize"), lambda v: 1 <= v <= 1000,
+     "Invalid cache maxsize: {} (must be 1-1000)"),
+    (attrgetter("cache.ttl_seconds"), lambda v: 1 <= v <= 3600,
+     "Invalid cache TTL: {} (must be 1-3600)"),
+
+    # Editor settings
+    (attrgetter("editor.tab_size"), lambda v: 1 <= v <= 16,
+     "Invalid tab size: {} (must be 1-16)"),
+
+    # View settings
+    (attrgetter("view.file_size_format"),
+     frozenset(["auto", "bytes", "kb", "mb", "gb"]).__contains__,
+     "Invalid file size format: {}"),
+)
 
 
 # Global configuration manager instance
@@ -0,0 +1,245 @@
+"""
+DC Commander - Content Trigram Index
+
+Persistent per-file bloom filters of byte trigrams, used by content search
+to skip files that cannot contain a literal needle without reading them.
+Only text files up to 10MB are indexed.
+
+Each file's filter is rebuilt when its size or modification time changes,
+so the index stays correct as files are edited; only the first search over
+a tree pays for reading every file.
+"""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from threading import RLock
+from typing import Dict, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Bloom filter sizing: bits per distinct trigram and bounds on filter size
+_BITS_PER_TRIGRAM = 8
+_MIN_BITS = 512
+_MAX_BITS = 1 << 20
+
+# Files larger than this are never indexed; content search streams them
+_MAX_FILE_SIZE = 10 * 1024 * 1024
+
+# Bumped whenever the saved format changes; other versions are ignored
+_INDEX_VERSION = 2
+
+# Multipliers deriving the hash positions of a trigram (stable across runs,
+# unlike hash() on bytes)
+_HASH_MULTIPLIERS = (0x9E3779B1, 0x85EBCA6B, 0xC2B2AE35)
+
+
+def _trigram_values(data: bytes) -> set:
+    """Get the distinct trigrams of data as 24-bit integers"""
+    return {
+        (data[i] << 16) | (data[i + 1] << 8) | data[i + 2]
+        for i in range(len(data) - 2)
+    }
+
+
+def _bit_positions(trigram: int, num_bits: int):
+    """Yield the filter bits set for a trigram"""
+    for multiplier in _HASH_MULTIPLIERS:
+        yield ((trigram * multiplier) & 0xFFFFFFFF) % num_bits
+
+
+def build_filter(data: bytes) -> Tuple[bytes, int]:
+    """
+    Build a bloom filter of the trigrams in data
+
+    Args:
+        data: File contents
+
+    Returns:
+        Tuple of (filter bits, number of bits)
+    """
+    trigrams = _trigram_values(data)
+
+    num_bits = _MIN_BITS
+    while num_bits < len(trigrams) * _BITS_PER_TRIGRAM and num_bits < _MAX_BITS:
+        num_bits <<= 1
+
+    bits = bytearray(num_bits >> 3)
+    for trigram in trigrams:
+        for position in _bit_positions(trigram, num_bits):
+            bits[position >> 3] |= 1 << (position & 7)
+    return bytes(bits), num_bits
+
+
+def filter_may_contain(bits: bytes, num_bits: int, needle: bytes) -> bool:
+    """
+    Check a bloom filter for every trigram of needle
+
+    Args:
+        bits: Filter bits
+        num_bits: Filter size
+        needle: Byte string searched for
+
+    Returns:
+        False only if the data the filter was built from cannot contain needle
+    """
+    for trigram in _trigram_values(needle):
+        for position in _bit_positions(trigram, num_bits):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+    return True
+
+
+class _IndexUnpickler(pickle.Unpickler):
+    """Unpickler that only accepts builtin containers and scalars"""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Unexpected object in content index: {module}.{name}")
+
+
+class ContentIndex:
+    """
+    Persistent map of file path to trigram bloom filter
+
+    Entries record the file's size and mtime when the filter was built and
+    are rebuilt whenever either changes.
+    """
+
+    def __init__(self, index_path: Path):
+        """
+        Initialize content index
+
+        Args:
+            index_path: File the index is loaded from and saved to
+        """
+        self.index_path = Path(index_path)
+        # path -> (size, mtime_ns, filter bits, filter size)
+        self._filters: Dict[str, Tuple[int, int, bytes, int]] = {}
+        # Paths asked about since the last prune; known to exist
+        self._seen: Set[str] = set()
+        self._dirty = False
+        self._lock = RLock()
+        self._load()
+
+    def may_contain(
+        self,
+        file_path: Path,
+        file_stat: os.stat_result,
+        needle: bytes
+    ) -> bool:
+        """
+        Check whether a file may contain needle
+
+        Builds the file's filter first if it is missing or out of date.
+        Files over the size limit are never indexed and always may match;
+        callers should skip binary files before asking.
+
+        Args:
+            file_path: File to check
+            file_stat: Current stat of the file
+            needle: Byte string searched for
+
+        Returns:
+            False only if the file definitely doesn't contain needle
+        """
+        # Shorter needles have no trigrams to check
+        if len(needle) < 3 or file_stat.st_size > _MAX_FILE_SIZE:
+            return True
+
+        key = str(file_path)
+        with self._lock:
+            self._seen.add(key)
+            entry = self._filters.get(key)
+
+        if (entry is None or entry[0] != file_stat.st_size
+                or entry[1] != file_stat.st_mtime_ns):
+            try:
+                data = file_path.read_bytes()
+            except OSError:
+                return True
+            bits, num_bits = build_filter(data)
+            entry = (file_stat.st_size, file_stat.st_mtime_ns, bits, num_bits)
+            with self._lock:
+                self._filters[key] = entry
+                self._dirty = True
+
+        return filter_may_contain(entry[2], entry[3], needle)
+
+    def prune(self, root_path: Path) -> int:
+        """
+        Drop filters for files under root_path that no longer exist
+
+        Files asked about since the last prune are known to exist; only the
+        others under root_path are stat-ed, so a walk that stopped early or
+        skipped files by filter doesn't discard their filters.
+
+        Args:
+            root_path: Directory that was just walked
+
+        Returns:
+            Number of filters dropped
+        """
+        prefix = os.path.join(str(root_path), '')
+        with self._lock:
+            seen, self._seen = self._seen, set()
+            stale = []
+            for key in self._filters:
+                if key in seen or not key.startswith(prefix):
+                    continue
+                try:
+                    os.stat(key)
+                except OSError:
+                    stale.append(key)
+            for key in stale:
+                del self._filters[key]
+            if stale:
+                self._dirty = True
+            return len(stale)
+
+    def save(self) -> None:
+        """Write the index to disk if it changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.index_path.with_suffix(
+                    self.index_path.suffix + '.tmp'
+                )
+                with open(temp_path, 'wb') as f:
+                    pickle.dump(
+                        (_INDEX_VERSION, self._filters),
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                os.replace(temp_path, self.index_path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Failed to save content index: {e}")
+
+    def clear(self) -> None:
+        """Forget all filters"""
+        with self._lock:
+            self._filters.clear()
+            self._dirty = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._filters)
+
+    def _load(self) -> None:
+        """Load a previously saved index, starting empty on any error"""
+        try:
+            with open(self.index_path, 'rb') as f:
+                state = _IndexUnpickler(f).load()
+            if (isinstance(state, tuple) and len(state) == 2
+                    and state[0] == _INDEX_VERSION and isinstance(state[1], dict)):
+                self._filters = state[1]
+            else:
+                logger.warning("Ignoring content index with unknown format")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable content index: {e}")
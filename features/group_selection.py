@@ -3,12 +3,31 @@
 Provides wildcard-based group selection (Gray +/-/*) similar to Norton Commander.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Any
+from typing import List, Set, Any, Pattern
 import fnmatch
+import re
 from components.file_panel import FileItem
 
 
+@lru_cache(maxsize=64)
+def _compile_glob(pattern: str, case_sensitive: bool) -> Pattern[str]:
+    """Translate a wildcard pattern to a compiled regex.
+
+    Cached so repeated selections such as "*.txt" skip translation.
+
+    Args:
+        pattern: Wildcard pattern
+        case_sensitive: Whether matching is case-sensitive
+
+    Returns:
+        Compiled regular expression matching whole names
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
 class GroupSelector:
     """Handles group selection operations with wildcard patterns."""
 
@@ -28,21 +47,14 @@ class GroupSelector:
         Returns:
             List of items that match the pattern
         """
-        matching = []
-        
-        for item in items:
-            # Skip parent directory entry
-            if item.is_parent:
-                continue
-            
-            # Apply pattern matching
-            name = item.name if case_sensitive else item.name.lower()
-            check_pattern = pattern if case_sensitive else pattern.lower()
-            
-            if fnmatch.fnmatch(name, check_pattern):
-                matching.append(item)
-        
-        return matching
+        if not pattern:
+            return []
+
+        # Translate the pattern once instead of once per item
+        match = _compile_glob(pattern, case_sensitive).match
+
+        # Skip parent directory entry
+        return [item for item in items if not item.is_parent and match(item.name)]
 
     def deselect_matching(self, items: List[FileItem], pattern: str,
                          selected: Set[str], case_sensitive: bool = False) -> Set[str]:
@@ -76,21 +88,9 @@ class GroupSelector:
         Returns:
             New set with selection inverted
         """
-        new_selection = set()
-        
-        for item in items:
-            # Skip parent directory
-            if item.is_parent:
-                continue
-            
-            path_str = str(item.path)
-            
-            # If not selected, add to new selection
-            # If selected, don't add (effectively deselecting)
-            if path_str not in selected:
-                new_selection.add(path_str)
-        
-        return new_selection
+        # Everything selectable (parent entry excluded) minus what is selected
+        universe = {str(item.path) for item in items if not item.is_parent}
+        return universe - selected
 
     def select_all(self, items: List[FileItem]) -> Set[str]:
         """Select all files (except parent directory).
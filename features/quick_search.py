@@ -3,6 +3,7 @@
 Provides incremental search as you type, similar to Norton Commander.
 """
 
+from bisect import bisect_left
 from pathlib import Path
 from typing import List, Optional, Any
 from dataclasses import dataclass
@@ -26,6 +27,60 @@ class QuickSearch:
         self.search_text: str = ""
         self.is_active: bool = False
 
+        # Prefix index over the last primed item list
+        self._indexed_items: Optional[List[Any]] = None
+        self._indexed_len: int = 0
+        self._sorted_names: List[str] = []
+        self._sorted_indices: List[int] = []
+
+    def prime(self, items: List[Any]) -> None:
+        """Build the prefix index for an item list.
+
+        Lowercased names are kept sorted so each keystroke locates its
+        matches with a binary search instead of scanning every item.
+        Owners call this whenever they assign or change their item list;
+        searching a different list, or one of another length, primes it
+        automatically, but in-place renames and re-sorts are not detected.
+
+        Args:
+            items: List of items to index (must have 'name' attribute)
+        """
+        entries = sorted(
+            (item.name.lower(), i) for i, item in enumerate(items)
+            if not getattr(item, 'is_parent', False)
+        )
+        self._sorted_names = [name for name, _ in entries]
+        self._sorted_indices = [i for _, i in entries]
+        self._indexed_items = items
+        self._indexed_len = len(items)
+
+    def _prefix_matches(self, items: List[Any], case_sensitive: bool) -> List[int]:
+        """Get indices of items whose name starts with the search text.
+
+        Args:
+            items: List of items to search
+            case_sensitive: Whether search is case-sensitive
+
+        Returns:
+            Matching item indices in index-order
+        """
+        if items is not self._indexed_items or len(items) != self._indexed_len:
+            self.prime(items)
+
+        prefix = self.search_text.lower()
+        names = self._sorted_names
+        matches = []
+
+        pos = bisect_left(names, prefix)
+        while pos < len(names) and names[pos].startswith(prefix):
+            index = self._sorted_indices[pos]
+            if not case_sensitive or items[index].name.startswith(self.search_text):
+                matches.append(index)
+            pos += 1
+
+        matches.sort()
+        return matches
+
     def activate(self) -> None:
         """Activate quick search mode."""
         self.is_active = True
@@ -66,31 +121,13 @@ class QuickSearch:
         if not self.search_text or not items:
             return None
 
-        search_lower = self.search_text if case_sensitive else self.search_text.lower()
-
-        # Search forward from current position
-        for i in range(current_index + 1, len(items)):
-            item_name = items[i].name if case_sensitive else items[i].name.lower()
-
-            # Skip parent directory entry
-            if hasattr(items[i], 'is_parent') and items[i].is_parent:
-                continue
-
-            if item_name.startswith(search_lower):
-                return i
-
-        # Wrap around to beginning
-        for i in range(0, current_index + 1):
-            item_name = items[i].name if case_sensitive else items[i].name.lower()
-
-            # Skip parent directory entry
-            if hasattr(items[i], 'is_parent') and items[i].is_parent:
-                continue
-
-            if item_name.startswith(search_lower):
-                return i
+        matches = self._prefix_matches(items, case_sensitive)
+        if not matches:
+            return None
 
-        return None
+        # Search forward from current position, wrapping to the beginning
+        pos = bisect_left(matches, current_index + 1)
+        return matches[pos] if pos < len(matches) else matches[0]
 
     def find_all_matches(
         self, items: List[Any], case_sensitive: bool = False
@@ -107,27 +144,18 @@ class QuickSearch:
         if not self.search_text or not items:
             return []
 
-        results = []
-        search_lower = self.search_text if case_sensitive else self.search_text.lower()
-        match_len = len(search_lower)
-
-        for i, item in enumerate(items):
-            # Skip parent directory entry
-            if hasattr(item, 'is_parent') and item.is_parent:
-                continue
-
-            item_name = item.name if case_sensitive else item.name.lower()
-
-            if item_name.startswith(search_lower):
-                results.append(SearchResult(
-                    index=i,
-                    name=item.name,
-                    path=item.path,
-                    match_start=0,
-                    match_end=match_len
-                ))
-
-        return results
+        match_len = len(self.search_text)
+
+        return [
+            SearchResult(
+                index=i,
+                name=items[i].name,
+                path=items[i].path,
+                match_start=0,
+                match_end=match_len
+            )
+            for i in self._prefix_matches(items, case_sensitive)
+        ]
 
     def clear(self) -> None:
         """Clear search text."""
@@ -9,32 +9,54 @@ Features:
 - LRU eviction policy
 - Memory usage limits
 - Thread-safe operations
+- Background cleanup of expired entries
 """
 
+import os
+import sys
 import time
 import hashlib
+import heapq
+import weakref
+from array import array
+from bisect import bisect_left
 from pathlib import Path
-from typing import List, Optional, Any, Dict, Tuple
+from typing import List, Optional, Any, Dict, Set, Tuple
 from dataclasses import dataclass, field
-from collections import OrderedDict
-from threading import RLock
+from collections import OrderedDict, defaultdict
+from threading import RLock, Timer
 from datetime import datetime, timedelta
 
 
-@dataclass
+_NS_PER_SECOND = 1_000_000_000
+_EVICTION_BATCH_DIVISOR = 20
+_L1_SLOTS = 16  # Must be a power of two
+
+
+@dataclass(slots=True)
 class CacheEntry:
-    """Single cache entry with metadata"""
+    """Single cache entry with metadata
+
+    Expiry uses time.monotonic_ns() so wall-clock adjustments can't expire
+    entries early or keep them alive; last_access stays a wall-clock time
+    for reporting.
+    """
     key: str
     value: Any
-    created_at: float
-    ttl: float  # Time to live in seconds
+    created_at_ns: int  # time.monotonic_ns() at creation
+    ttl_ns: int  # Time to live in nanoseconds
     access_count: int = 0
     last_access: float = field(default_factory=time.time)
     size_bytes: int = 0
 
+    @property
+    def expires_at(self) -> int:
+        """Monotonic expiry time in nanoseconds"""
+        return self.created_at_ns + self.ttl_ns
+
     def is_expired(self) -> bool:
         """Check if entry has expired"""
-        return (time.time() - self.created_at) > self.ttl
+        return time.monotonic_ns() - self.created_at_ns > self.ttl_ns
 
     def touch(self) -> None:
         """Update access metadata"""
@@ -57,7 +79,8 @@ class SearchResultCache:
         self,
         max_entries: int = 1000,
         default_ttl: float = 300.0,  # 5 minutes
-        max_memory_mb: float = 50.0
+        max_memory_mb: float = 50.0,
+        cleanup_interval: Optional[float] = None
     ):
         """
         Initialize search result cache
@@ -66,19 +89,47 @@ class SearchResultCache:
             max_entries: Maximum number of cached entries
             default_ttl: Default time-to-live in seconds
             max_memory_mb: Maximum memory usage in MB
+            cleanup_interval: Seconds between background sweeps of expired
+                entries, or None (default) to disable them; a cache with
+                sweeps runs a timer thread until close() is called
         """
         self.max_entries = max_entries
         self.default_ttl = default_ttl
         self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
 
+        # Entries evicted at once when the cache overflows (5% of capacity)
+        self._eviction_batch = max(1, max_entries // _EVICTION_BATCH_DIVISOR)
+
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = RLock()
 
+        # Min-heap of (expires_at ns, key); entries for keys that were since
+        # replaced or removed are skipped lazily during cleanup
+        self._expiry_heap: List[Tuple[int, str]] = []
+
+        # Keys in sorted order for prefix invalidation, built on demand:
+        # None after a new key is added, and may still hold removed keys
+        self._sorted_keys: Optional[List[str]] = []
+
+        # Direct-mapped front cache of recent hits, indexed by key hash; a
+        # hit here skips the OrderedDict reordering
+        self._l1: List[Optional[Tuple[str, CacheEntry]]] = [None] * _L1_SLOTS
+
         # Statistics
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._expirations = 0
         self._current_memory = 0
+        self._ttl_total_ns = 0  # Sum of live entries' TTLs, for avg_ttl
+
+        # Expired entries can be swept off the hot path by a daemon timer;
+        # without one they are dropped when read or when the cache is full
+        self._cleanup_interval = cleanup_interval
+        self._cleanup_timer: Optional[Timer] = None
+        self._closed = False
+        if cleanup_interval:
+            self._schedule_cleanup()
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -90,16 +141,26 @@ class SearchResultCache:
         Returns:
             Cached value or None if not found/expired
         """
+        slot = hash(key) & (_L1_SLOTS - 1)
+
         with self._lock:
-            if key not in self._cache:
+            hit = self._l1[slot]
+            if hit is not None and hit[0] == key and not hit[1].is_expired():
+                entry = hit[1]
+                entry.touch()
+                self._hits += 1
+                return entry.value
+
+            # Single lookup; stored values are CacheEntry, never None
+            entry = self._cache.get(key)
+            if entry is None:
                 self._misses += 1
                 return None
 
-            entry = self._cache[key]
-
             # Check expiration
             if entry.is_expired():
                 self._remove_entry(key)
+                self._expirations += 1
                 self._misses += 1
                 return None
 
@@ -107,6 +168,7 @@ class SearchResultCache:
             self._cache.move_to_end(key)
             entry.touch()
             self._hits += 1
+            self._l1[slot] = (key, entry)
 
             return entry.value
 
@@ -124,33 +186,57 @@ class SearchResultCache:
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
         """
+        # Stored keys are interned so lookups with the same key object skip
+        # the string comparison; already-interned keys come back unchanged
+        key = sys.intern(key)
+
         with self._lock:
             # Estimate size (rough approximation)
             size_bytes = self._estimate_size(value)
 
-            # Check if we need to evict
-            while (
-                (len(self._cache) >= self.max_entries or
-                 self._current_memory + size_bytes > self.max_memory_bytes)
-                and self._cache
-            ):
-                self._evict_lru()
-
-            # Remove old entry if exists
+            # Remove old entry first so replacing a key never evicts another;
+            # a replaced key is still in the sorted key index
             if key in self._cache:
                 self._remove_entry(key)
+            else:
+                self._sorted_keys = None
+
+            # A value larger than the whole budget would flush every entry
+            # and still overshoot the limit, so don't cache it at all
+            if size_bytes > self.max_memory_bytes:
+                return
+
+            # On overflow reclaim expired entries first, then evict a batch
+            # of live entries, not just one, so the following inserts have
+            # room and don't each pay for eviction
+            if self._over_limit(size_bytes):
+                self._remove_expired()
+
+            if self._over_limit(size_bytes):
+                for _ in range(self._eviction_batch):
+                    if not self._cache:
+                        break
+                    self._evict_lru()
+
+                while self._cache and self._over_limit(size_bytes):
+                    self._evict_lru()
 
             # Add new entry
             entry = CacheEntry(
                 key=key,
                 value=value,
-                created_at=time.time(),
-                ttl=ttl or self.default_ttl,
+                created_at_ns=time.monotonic_ns(),
+                ttl_ns=int((ttl or self.default_ttl) * _NS_PER_SECOND),
                 size_bytes=size_bytes
             )
 
             self._cache[key] = entry
             self._current_memory += size_bytes
+            self._ttl_total_ns += entry.ttl_ns
+
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+            if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                self._rebuild_expiry_heap()
 
     def invalidate(self, key: str) -> bool:
         """
@@ -189,39 +275,141 @@ class SearchResultCache:
 
             return len(keys_to_remove)
 
+    def invalidate_prefix(self, prefix: str) -> int:
+        """
+        Invalidate all entries whose key starts with prefix
+
+        Uses the sorted key index, so only matching keys are visited; the
+        index is sorted here if keys were added since it was last used.
+
+        Args:
+            prefix: Key prefix (e.g. 'filename:')
+
+        Returns:
+            Number of entries invalidated
+        """
+        with self._lock:
+            keys = self._sorted_keys
+            if keys is None:
+                keys = self._sorted_keys = sorted(self._cache)
+
+            start = bisect_left(keys, prefix)
+            end = start
+            while end < len(keys) and keys[end].startswith(prefix):
+                end += 1
+
+            matched = keys[start:end]
+            del keys[start:end]
+
+            removed = 0
+            for key in matched:
+                # Keys removed since the index was built are skipped
+                entry = self._cache.pop(key, None)
+                if entry is None:
+                    continue
+                self._drop_l1(key)
+                self._current_memory -= entry.size_bytes
+                self._ttl_total_ns -= entry.ttl_ns
+                removed += 1
+
+            return removed
+
     def clear(self) -> None:
         """Clear all cache entries"""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._sorted_keys = []
+            self._l1 = [None] * _L1_SLOTS
             self._current_memory = 0
+            self._ttl_total_ns = 0
             self._evictions = 0
+            self._expirations = 0
 
     def cleanup_expired(self) -> int:
         """
         Remove expired entries
 
+        Only entries at the front of the expiry heap are inspected, so the
+        cost depends on how many entries expired, not on cache size.
+
         Returns:
             Number of entries removed
         """
         with self._lock:
-            expired_keys = [
-                k for k, v in self._cache.items()
-                if v.is_expired()
-            ]
+            return self._remove_expired()
 
-            for key in expired_keys:
+    def close(self) -> None:
+        """Stop background cleanup"""
+        with self._lock:
+            self._closed = True
+            if self._cleanup_timer is not None:
+                self._cleanup_timer.cancel()
+                self._cleanup_timer = None
+
+    def _schedule_cleanup(self) -> None:
+        """Arm the timer for the next background cleanup"""
+        # The timer only holds a weak reference, so an abandoned cache can
+        # still be garbage collected
+        timer = Timer(
+            self._cleanup_interval, _background_cleanup, (weakref.ref(self),)
+        )
+        timer.daemon = True
+        self._cleanup_timer = timer
+        timer.start()
+
+    def _rebuild_expiry_heap(self) -> None:
+        """Drop stale heap items once they outnumber live entries"""
+        self._expiry_heap = [(e.expires_at, k) for k, e in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
+
+    def _remove_expired(self) -> int:
+        """Pop expired entries off the expiry heap (must hold lock)"""
+        now = time.monotonic_ns()
+        heap = self._expiry_heap
+        removed = 0
+
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+
+            # Skip stale heap items left by overwrites and removals
+            if entry is not None and entry.expires_at == expires_at:
                 self._remove_entry(key)
+                removed += 1
 
-            return len(expired_keys)
+        self._expirations += removed
+        return removed
+
+    def _over_limit(self, size_bytes: int) -> bool:
+        """Check if adding size_bytes would exceed the entry or memory limit"""
+        return (len(self._cache) >= self.max_entries or
+                self._current_memory + size_bytes > self.max_memory_bytes)
 
     def _evict_lru(self) -> None:
         """Evict least recently used entry"""
-        if not self._cache:
+        cache = self._cache
+        l1 = self._l1
+
+        # Entries served from L1 were never moved to the end, so give them
+        # a second chance instead of evicting them; each chance empties a
+        # slot, so this loops at most _L1_SLOTS times
+        while cache:
+            key = next(iter(cache))
+            slot = hash(key) & (_L1_SLOTS - 1)
+            hit = l1[slot]
+            if hit is None or hit[0] != key:
+                break
+            l1[slot] = None
+            cache.move_to_end(key)
+        else:
             return
 
-        # Remove first item (least recently used)
-        key = next(iter(self._cache))
-        self._remove_entry(key)
+        # Pop first item (least recently used)
+        key, entry = cache.popitem(last=False)
+        self._current_memory -= entry.size_bytes
+        self._ttl_total_ns -= entry.ttl_ns
+        self._drop_l1(key)
         self._evictions += 1
 
     def _remove_entry(self, key: str) -> None:
@@ -229,7 +417,16 @@ class SearchResultCache:
         if key in self._cache:
             entry = self._cache[key]
             self._current_memory -= entry.size_bytes
+            self._ttl_total_ns -= entry.ttl_ns
             del self._cache[key]
+            self._drop_l1(key)
+
+    def _drop_l1(self, key: str) -> None:
+        """Empty the L1 slot holding key, if any"""
+        slot = hash(key) & (_L1_SLOTS - 1)
+        hit = self._l1[slot]
+        if hit is not None and hit[0] == key:
+            self._l1[slot] = None
 
     @staticmethod
     def _estimate_size(value: Any) -> int:
@@ -260,11 +457,25 @@ class SearchResultCache:
                 'misses': self._misses,
                 'hit_rate': hit_rate,
                 'evictions': self._evictions,
-                'avg_ttl': sum(e.ttl for e in self._cache.values()) / len(self._cache)
+                'expirations': self._expirations,
+                'avg_ttl': self._ttl_total_ns / len(self._cache) / _NS_PER_SECOND
                 if self._cache else 0
             }
 
 
+def _background_cleanup(cache_ref: "weakref.ref[SearchResultCache]") -> None:
+    """Timer callback: sweep expired entries and reschedule"""
+    cache = cache_ref()
+    if cache is None:
+        return
+
+    with cache._lock:
+        if cache._closed:
+            return
+        cache.cleanup_expired()
+        cache._schedule_cleanup()
+
+
 class QueryCache:
     """
     High-level cache for search queries
@@ -276,7 +487,8 @@ class QueryCache:
         self,
         max_entries: int = 1000,
         default_ttl: float = 300.0,
-        max_memory_mb: float = 50.0
+        max_memory_mb: float = 50.0,
+        cleanup_interval: Optional[float] = None
     ):
         """
         Initialize query cache
@@ -285,8 +497,18 @@ class QueryCache:
             max_entries: Maximum cached queries
             default_ttl: Default TTL in seconds
             max_memory_mb: Maximum memory usage in MB
+            cleanup_interval: Seconds between background sweeps of expired
+                entries, or None (default) to disable them
         """
-        self.cache = SearchResultCache(max_entries, default_ttl, max_memory_mb)
+        self.cache = SearchResultCache(
+            max_entries, default_ttl, max_memory_mb, cleanup_interval
+        )
+
+        # Cache keys per search root, so a path can be invalidated without
+        # scanning every key (keys are hashes and don't contain the path)
+        self._by_path: Dict[Path, Set[str]] = defaultdict(set)
+        self._indexed_keys = 0
+        self._lock = RLock()
 
     def make_key(
         self,
@@ -305,21 +527,23 @@ class QueryCache:
             **options: Additional search options
 
         Returns:
-            Cache key string
+            Cache key string (interned, so repeated lookups compare by identity)
         """
-        # Create deterministic key from parameters
-        key_parts = [
-            str(root_path),
-            pattern,
-            search_type,
-            str(sorted(options.items()))
-        ]
-
-        key_str = '|'.join(key_parts)
-        # Use hash for shorter keys
-        key_hash = hashlib.md5(key_str.encode()).hexdigest()
-
-        return f"{search_type}:{key_hash}"
+        # Hash parameters directly, NUL-separated, in a fixed order
+        h = hashlib.blake2b(digest_size=16)
+        h.update(os.fsencode(root_path))
+        h.update(b'\0')
+        h.update(pattern.encode())
+        h.update(b'\0')
+        h.update(search_type.encode())
+
+        for name in sorted(options):
+            h.update(b'\0')
+            h.update(name.encode())
+            h.update(b'\0')
+            h.update(repr(options[name]).encode())
+
+        return sys.intern(f"{search_type}:{h.hexdigest()}")
 
     def get_results(
         self,
@@ -366,6 +590,16 @@ class QueryCache:
         key = self.make_key(root_path, pattern, search_type, **options)
         self.cache.set(key, results, ttl)
 
+        with self._lock:
+            keys = self._by_path[root_path]
+            if key not in keys:
+                keys.add(key)
+                self._indexed_keys += 1
+
+            # Forget keys the underlying cache has evicted or expired
+            if self._indexed_keys > 2 * self.cache.max_entries:
+                self._prune_path_index()
+
     def invalidate_path(self, root_path: Path) -> int:
         """
         Invalidate all cache entries for a path
@@ -376,12 +610,42 @@ class QueryCache:
         Returns:
             Number of entries invalidated
         """
-        return self.cache.invalidate_pattern(str(root_path))
+        with self._lock:
+            keys = self._by_path.pop(root_path, ())
+            self._indexed_keys -= len(keys)
+
+        return sum(1 for key in keys if self.cache.invalidate(key))
+
+    def _prune_path_index(self) -> None:
+        """Drop index entries for keys no longer in the cache"""
+        live = self.cache._cache
+        pruned: Dict[Path, Set[str]] = defaultdict(set)
+        for path, keys in self._by_path.items():
+            alive = {k for k in keys if k in live}
+            if alive:
+                pruned[path] = alive
+
+        self._by_path = pruned
+        self._indexed_keys = sum(len(keys) for keys in pruned.values())
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         return self.cache.get_stats()
 
+    def close(self) -> None:
+        """Stop background cleanup of the underlying cache"""
+        self.cache.close()
+
+
+class _TrieNode:
+    """Completion trie node keyed by lowercased characters"""
+
+    __slots__ = ('children', 'queries')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.queries: List[Tuple[int, str]] = []  # (insertion order, original-case query)
+
 
 class SearchHistoryCache:
     """
@@ -398,28 +662,44 @@ class SearchHistoryCache:
             max_history: Maximum history entries to keep
         """
         self.max_history = max_history
-        self._history: List[Tuple[str, datetime]] = []
+
+        # History as parallel arrays (oldest first); trimmed in bulk once it
+        # holds twice max_history entries rather than on every add
+        self._queries: List[str] = []
+        self._timestamps = array('d')  # time.time() of each search
         self._frequency: Dict[str, int] = {}
+        self._trie = _TrieNode()
         self._lock = RLock()
 
-    def add_search(self, query: str) -> None:
+    def add_search(self, query: str, _ts: Optional[float] = None) -> None:
         """
         Add search to history
 
         Args:
             query: Search query string
+            _ts: Wall-clock timestamp to record instead of time.time()
+                (for tests)
         """
         with self._lock:
             # Add to history
-            self._history.append((query, datetime.now()))
+            self._queries.append(query)
+            self._timestamps.append(time.time() if _ts is None else _ts)
 
             # Track frequency
-            self._frequency[query] = self._frequency.get(query, 0) + 1
+            count = self._frequency.get(query, 0)
+            self._frequency[query] = count + 1
+
+            # Index new queries for prefix completion
+            if count == 0:
+                node = self._trie
+                for char in query.lower():
+                    node = node.children.setdefault(char, _TrieNode())
+                node.queries.append((len(self._frequency), query))
 
             # Trim history if needed
-            if len(self._history) > self.max_history:
-                # Remove oldest, excluding frequent queries
-                self._history = self._history[-self.max_history:]
+            if len(self._queries) > 2 * self.max_history:
+                del self._queries[:-self.max_history]
+                del self._timestamps[:-self.max_history]
 
     def get_completions(
         self,
@@ -437,19 +717,26 @@ class SearchHistoryCache:
             List of completion suggestions sorted by frequency
         """
         with self._lock:
-            prefix_lower = prefix.lower()
-
-            # Find matching queries
-            matches = [
-                (query, freq)
-                for query, freq in self._frequency.items()
-                if query.lower().startswith(prefix_lower)
-            ]
-
-            # Sort by frequency (descending) and recency
-            matches.sort(key=lambda x: x[1], reverse=True)
-
-            return [query for query, _ in matches[:max_results]]
+            # Walk down to the prefix node
+            node = self._trie
+            for char in prefix.lower():
+                node = node.children.get(char)
+                if node is None:
+                    return []
+
+            # Collect every query below it
+            matches = []
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                matches.extend(node.queries)
+                stack.extend(node.children.values())
+
+            # Sort by frequency (descending), ties in order first searched
+            frequency = self._frequency
+            matches.sort(key=lambda x: (-frequency[x[1]], x[0]))
+
+            return [query for _, query in matches[:max_results]]
 
     def get_recent(self, limit: int = 10) -> List[Tuple[str, datetime]]:
         """
@@ -462,10 +749,17 @@ class SearchHistoryCache:
             List of (query, timestamp) tuples
         """
         with self._lock:
-            return list(reversed(self._history[-limit:]))
+            count = len(self._queries)
+            start = max(count - min(limit, self.max_history), 0)
+            return [
+                (self._queries[i], datetime.fromtimestamp(self._timestamps[i]))
+                for i in range(count - 1, start - 1, -1)
+            ]
 
     def clear(self) -> None:
         """Clear search history"""
         with self._lock:
-            self._history.clear()
+            self._queries.clear()
+            del self._timestamps[:]
             self._frequency.clear()
+            self._trie = _TrieNode()
@@ -11,17 +11,30 @@ Architecture:
 - Comprehensive error handling and validation
 """
 
+import asyncio
+import io
+import os
 import re
 import fnmatch
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, List, Dict, Any, Optional, Callable, Set
-from dataclasses import dataclass, field
+from typing import (
+    Generator, List, Dict, Any, Optional, Callable, Set, Tuple, FrozenSet, Union,
+    Deque
+)
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, fields, InitVar
 from datetime import datetime
 from enum import Enum
 import threading
 import queue
 import mmap
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import aiofiles
+
+from features.content_index import ContentIndex
 
 
 class SearchType(Enum):
@@ -50,6 +63,14 @@ class LogicalOperator(Enum):
     NOT = "not"
 
 
+# Directory names skipped by default; each SearchOptions gets its own
+# mutable copy
+_DEFAULT_EXCLUDED_DIRS = frozenset({
+    '.git', '.svn', '.hg', '__pycache__', 'node_modules', '.venv', 'venv',
+    '.mypy_cache', '.pytest_cache'
+})
+
+
 @dataclass
 class SearchOptions:
     """Configuration options for search operations"""
@@ -58,30 +79,144 @@ class SearchOptions:
     search_subdirectories: bool = True
     follow_symlinks: bool = False
     exclude_patterns: List[str] = field(default_factory=list)
-    exclude_directories: Set[str] = field(default_factory=lambda: {
-        '.git', '.svn', '__pycache__', 'node_modules', '.venv', 'venv'
-    })
+    exclude_directories: Set[str] = field(
+        default_factory=lambda: set(_DEFAULT_EXCLUDED_DIRS)
+    )
     max_file_size: Optional[int] = None  # bytes
     max_depth: Optional[int] = None
     file_extensions: Optional[List[str]] = None
     max_results: Optional[int] = None
 
+    # (patterns, compiled alternation) for should_exclude_file
+    _exclude_regex: Tuple[Tuple[str, ...], Optional[re.Pattern]] = field(
+        default=((), None), init=False, repr=False, compare=False
+    )
+
+    # (extensions, lowercased set) for matches_extension_filter
+    _extension_set: Tuple[Tuple[str, ...], FrozenSet[str]] = field(
+        default=((), frozenset()), init=False, repr=False, compare=False
+    )
+
+    # ((patterns, extensions), name check) for the directory walk
+    _name_filter: Tuple[Tuple, Optional[Callable[[str], bool]]] = field(
+        default=(((), None), None), init=False, repr=False, compare=False
+    )
+
+    def cache_key(self) -> Tuple:
+        """
+        Get a hashable snapshot of the options
+
+        Returns:
+            Tuple of all public option values, with lists and sets frozen
+        """
+        key = []
+        for f in fields(self):
+            if f.name.startswith('_'):
+                continue
+            value = getattr(self, f.name)
+            if isinstance(value, list):
+                value = tuple(value)
+            elif isinstance(value, set):
+                value = frozenset(value)
+            key.append(value)
+        return tuple(key)
+
     def should_exclude_directory(self, dir_name: str) -> bool:
         """Check if directory should be excluded from search"""
         return dir_name in self.exclude_directories
 
     def should_exclude_file(self, file_path: Path) -> bool:
         """Check if file should be excluded based on patterns"""
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return True
-        return False
+        return self._excludes_name(file_path.name)
+
+    def _excludes_name(self, name: str) -> bool:
+        """Check a bare file name against the exclude patterns"""
+        if not self.exclude_patterns:
+            return False
+
+        # All patterns are compiled into one regex, rebuilt only when the
+        # pattern list changes; normcase keeps fnmatch's case rules
+        patterns = tuple(self.exclude_patterns)
+        cached_patterns, regex = self._exclude_regex
+        if regex is None or cached_patterns != patterns:
+            regex = re.compile('|'.join(
+                fnmatch.translate(os.path.normcase(p)) for p in patterns
+            ))
+            self._exclude_regex = (patterns, regex)
+
+        return regex.match(os.path.normcase(name)) is not None
 
     def matches_extension_filter(self, file_path: Path) -> bool:
         """Check if file matches extension filter"""
+        return self._extension_matches_name(file_path.name)
+
+    def _extension_matches_name(self, name: str) -> bool:
+        """Check a bare file name against the extension filter"""
         if not self.file_extensions:
             return True
-        return file_path.suffix.lower() in [ext.lower() for ext in self.file_extensions]
+
+        # Lowercased set built once, rebuilt only when the list changes
+        extensions = tuple(self.file_extensions)
+        cached_extensions, extension_set = self._extension_set
+        if cached_extensions != extensions:
+            extension_set = frozenset(ext.lower() for ext in extensions)
+            self._extension_set = (extensions, extension_set)
+
+        return _name_suffix(name).lower() in extension_set
+
+    def _file_name_filter(self) -> Optional[Callable[[str], bool]]:
+        """
+        Get one check combining exclude patterns and extension filter
+
+        Both filters are compiled into a single regex, a negative lookahead
+        for the excludes followed by the allowed suffixes, so the walk makes
+        one match call per file. Extensions Path.suffix can never equal
+        (no leading dot, inner dots, empty) fall back to the separate checks.
+
+        Returns:
+            Function accepting names of files to keep, or None if all pass
+        """
+        if not self.exclude_patterns and not self.file_extensions:
+            return None
+
+        key = (tuple(self.exclude_patterns), tuple(self.file_extensions or ()))
+        cached_key, name_filter = self._name_filter
+        if name_filter is not None and cached_key == key:
+            return name_filter
+
+        patterns, extensions = key
+        if all(len(ext) > 1 and ext[0] == '.' and '.' not in ext[1:]
+               for ext in extensions):
+            regex_parts = []
+            if patterns:
+                regex_parts.append('(?!' + '|'.join(
+                    fnmatch.translate(os.path.normcase(p)) for p in patterns
+                ) + ')')
+            if extensions:
+                regex_parts.append('(?s:.+)(?i:' + '|'.join(
+                    re.escape(ext) for ext in extensions
+                ) + r')\Z')
+            match = re.compile(''.join(regex_parts)).match
+            normcase = os.path.normcase
+            name_filter = lambda name: match(normcase(name)) is not None
+        else:
+            name_filter = lambda name: (
+                not self._excludes_name(name)
+                and self._extension_matches_name(name)
+            )
+
+        self._name_filter = (key, name_filter)
+        return name_filter
+
+
+# Filter attributes that are read from the file's stat result
+_STAT_ATTRIBUTES = frozenset({'size', 'modified', 'created'})
+
+# Relative cost of evaluating a filter: string checks, then regex, then
+# anything that needs a stat() call
+_FILTER_COST_STAT = 3
+_FILTER_COST_REGEX = 2
+_FILTER_COST_STRING = 1
 
 
 @dataclass
@@ -91,6 +226,25 @@ class FileFilter:
     operator: FilterOperator
     value: Any
 
+    # (value, operand) - value converted for comparison, reused across files
+    _prepared: Optional[Tuple[Any, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def needs_stat(self) -> bool:
+        """Whether matching this filter reads file metadata"""
+        return self.attribute in _STAT_ATTRIBUTES
+
+    @property
+    def cost(self) -> int:
+        """Relative evaluation cost, used to order filters"""
+        if self.attribute in _STAT_ATTRIBUTES:
+            return _FILTER_COST_STAT
+        if self.operator == FilterOperator.REGEX:
+            return _FILTER_COST_REGEX
+        return _FILTER_COST_STRING
+
     def matches(self, file_path: Path, file_stat: Optional[Any] = None) -> bool:
         """
         Check if file matches this filter criteria
@@ -115,24 +269,51 @@ class FileFilter:
         except (OSError, PermissionError):
             return False
 
+    def _operand(self) -> Any:
+        """
+        Get the filter value converted for comparison
+
+        The conversion (regex compile, int or date parsing, lowercasing)
+        runs once and is reused for every file, until value changes.
+        """
+        prepared = self._prepared
+        if prepared is None or prepared[0] is not self.value:
+            prepared = (self.value, self._convert_value())
+            self._prepared = prepared
+        return prepared[1]
+
+    def _convert_value(self) -> Any:
+        """Convert value to the form the matcher compares against"""
+        value = self.value
+        if self.attribute == 'name':
+            return re.compile(value) if self.operator == FilterOperator.REGEX else value
+        elif self.attribute == 'size':
+            return int(value)
+        elif self.attribute in ('modified', 'created'):
+            return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+        elif self.attribute == 'extension':
+            return value.lower() if isinstance(value, str) else value
+        return value
+
     def _match_name(self, file_path: Path) -> bool:
         """Match against filename"""
         name = file_path.name
+        value = self._operand()
 
         if self.operator == FilterOperator.EQUALS:
-            return name == self.value
+            return name == value
         elif self.operator == FilterOperator.CONTAINS:
-            return self.value in name
+            return value in name
         elif self.operator == FilterOperator.REGEX:
-            return bool(re.search(self.value, name))
+            return value.search(name) is not None
         elif self.operator == FilterOperator.NOT_EQUAL:
-            return name != self.value
+            return name != value
         return False
 
     def _match_size(self, file_path: Path, file_stat: Optional[Any]) -> bool:
         """Match against file size"""
         size = file_stat.st_size if file_stat else file_path.stat().st_size
-        value = int(self.value)
+        value = self._operand()
 
         if self.operator == FilterOperator.EQUALS:
             return size == value
@@ -157,7 +338,7 @@ class FileFilter:
         else:  # created
             file_time = datetime.fromtimestamp(stat.st_ctime)
 
-        compare_time = self.value if isinstance(self.value, datetime) else datetime.fromisoformat(self.value)
+        compare_time = self._operand()
 
         if self.operator == FilterOperator.EQUALS:
             return file_time.date() == compare_time.date()
@@ -174,7 +355,7 @@ class FileFilter:
     def _match_extension(self, file_path: Path) -> bool:
         """Match against file extension"""
         ext = file_path.suffix.lower()
-        value = self.value.lower() if isinstance(self.value, str) else self.value
+        value = self._operand()
 
         if self.operator == FilterOperator.EQUALS:
             return ext == value
@@ -190,6 +371,7 @@ class FilterCriteria:
     """Combined filter criteria with logical operators"""
     filters: List[FileFilter] = field(default_factory=list)
     operator: LogicalOperator = LogicalOperator.AND
+    preserve_order: bool = False  # Evaluate filters in the given order
 
     def matches(self, file_path: Path, file_stat: Optional[Any] = None) -> bool:
         """
@@ -205,7 +387,7 @@ class FilterCriteria:
         if not self.filters:
             return True
 
-        results = [f.matches(file_path, file_stat) for f in self.filters]
+        results = self._evaluate(self._ordered_filters(), file_path, file_stat)
 
         if self.operator == LogicalOperator.AND:
             return all(results)
@@ -216,6 +398,32 @@ class FilterCriteria:
 
         return False
 
+    def _ordered_filters(self) -> List[FileFilter]:
+        """Get filters cheapest first, so AND/OR usually stop before stat()"""
+        if self.preserve_order:
+            return self.filters
+
+        # Sorted on every call: the lists are tiny, and filters is a public
+        # list callers may change in place
+        return sorted(self.filters, key=lambda f: f.cost)
+
+    @staticmethod
+    def _evaluate(
+        filters: List[FileFilter],
+        file_path: Path,
+        file_stat: Optional[Any]
+    ) -> Generator[bool, None, None]:
+        """Yield each filter's result, statting the file at most once"""
+        stat_tried = file_stat is not None
+        for f in filters:
+            if f.needs_stat and not stat_tried:
+                stat_tried = True
+                try:
+                    file_stat = file_path.stat()
+                except (OSError, PermissionError):
+                    pass
+            yield f.matches(file_path, file_stat)
+
 
 @dataclass
 class SearchResult:
@@ -226,11 +434,19 @@ class SearchResult:
     match_context: Optional[str] = None
     file_size: Optional[int] = None
     modified_time: Optional[datetime] = None
+    stat_result: InitVar[Optional[os.stat_result]] = None
+
+    def __post_init__(self, stat_result: Optional[os.stat_result]):
+        """Populate file metadata on initialization
+
+        Args:
+            stat_result: Already fetched stat of path, saves a stat() call
+        """
+        if self.file_size is not None and self.modified_time is not None:
+            return
 
-    def __post_init__(self):
-        """Populate file metadata on initialization"""
         try:
-            stat = self.path.stat()
+            stat = stat_result if stat_result is not None else self.path.stat()
             if self.file_size is None:
                 self.file_size = stat.st_size
             if self.modified_time is None:
@@ -239,22 +455,201 @@ class SearchResult:
             pass
 
 
+# Constructs whose meaning changes when a pattern runs over a whole file
+# instead of a single line: absolute anchors and lookbehind/negative
+# lookahead can see (or miss) text across line boundaries
+_LINE_SENSITIVE_SYNTAX = ('\\A', '\\Z', '(?<', '(?!')
+
+
+@lru_cache(maxsize=32)
+def _whole_text_scanner(pattern: re.Pattern) -> Optional[re.Pattern]:
+    """
+    Get a MULTILINE variant of a line pattern for scanning whole files
+
+    Args:
+        pattern: Pattern applied to individual lines
+
+    Returns:
+        Compiled scanner, or None if the pattern must be run line by line
+    """
+    if not isinstance(pattern.pattern, str):
+        return None
+    if any(token in pattern.pattern for token in _LINE_SENSITIVE_SYNTAX):
+        return None
+    return re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+
+
+def _text_context(text: str, line_start: int, line_end: int, context_lines: int) -> str:
+    """Extract a line span plus context_lines lines either side from text"""
+    start = line_start
+    for _ in range(context_lines):
+        if start == 0:
+            break
+        start = text.rfind('\n', 0, start - 1) + 1
+
+    end = line_end
+    for _ in range(context_lines):
+        if end >= len(text):
+            break
+        newline = text.find('\n', end)
+        end = len(text) if newline == -1 else newline + 1
+
+    return text[start:end]
+
+
+# Extensions never searched for content
+_BINARY_EXTENSIONS = frozenset({
+    '.exe', '.dll', '.so', '.dylib', '.bin', '.obj', '.o',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg',
+    '.mp3', '.mp4', '.avi', '.mov', '.wav', '.flac',
+    '.zip', '.tar', '.gz', '.7z', '.rar', '.bz2',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'
+})
+
+# Bytes sampled from the start of a file to decide whether it is text
+_TEXT_SAMPLE_SIZE = 8192
+
+# Files above this size are streamed line by line instead of read whole
+_LARGE_FILE_SIZE = 10 * 1024 * 1024
+
+
+def _looks_like_text(sample: bytes) -> bool:
+    """Check a file's leading bytes for signs of binary content"""
+    # Check for null bytes (common in binary files)
+    if b'\x00' in sample:
+        return False
+
+    # Try to decode as UTF-8
+    try:
+        sample.decode('utf-8')
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _compile_content_pattern(
+    pattern: str,
+    options: SearchOptions
+) -> Tuple[re.Pattern, Optional[bytes]]:
+    """
+    Compile a content search pattern
+
+    Args:
+        pattern: Search pattern, a regex if options.use_regex
+        options: Search options
+
+    Returns:
+        Tuple of (compiled pattern, raw bytes every matching file must
+        contain or None when no such literal applies)
+
+    Raises:
+        ValueError: If the regex is invalid
+    """
+    flags = 0 if options.case_sensitive else re.IGNORECASE
+
+    if options.use_regex:
+        try:
+            return re.compile(pattern, flags), None
+        except re.error as e:
+            raise ValueError(f"Invalid regex pattern: {e}")
+
+    # Convert simple pattern to regex
+    regex_pattern = re.compile(re.escape(pattern), flags)
+
+    # Raw bytes that any matching file must contain, for skipping files
+    # without decoding them; only exact when case can't matter
+    literal = None
+    if (pattern and '\n' not in pattern and '\r' not in pattern
+            and (options.case_sensitive or pattern.lower() == pattern.upper())):
+        literal = pattern.encode('utf-8')
+
+    return regex_pattern, literal
+
+
+def _name_suffix(name: str) -> str:
+    """Get the suffix of a file name the way Path.suffix does"""
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ''
+
+
+def _dir_mtime_ns(path: Path) -> Optional[int]:
+    """Get directory modification time, or None if it cannot be read"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _compile_wildcard(pattern: str, case_sensitive: bool) -> Callable[[str], bool]:
+    """
+    Build a filename matcher for a wildcard pattern
+
+    The pattern is translated once per search rather than per file; a
+    pattern without wildcards becomes a plain string comparison.
+
+    Args:
+        pattern: Pattern with optional * ? [...] wildcards
+        case_sensitive: Whether matching respects case
+
+    Returns:
+        Function returning True for matching names
+    """
+    if not any(char in pattern for char in '*?['):
+        if case_sensitive:
+            return pattern.__eq__
+        pattern_lower = pattern.lower()
+        return lambda name: name.lower() == pattern_lower
+
+    regex = re.compile(
+        fnmatch.translate(pattern),
+        0 if case_sensitive else re.IGNORECASE
+    )
+    return lambda name: regex.match(name) is not None
+
+
 class FileSearch:
     """
     High-performance file search engine with support for wildcards,
     regex patterns, and content search.
     """
 
-    def __init__(self, max_workers: int = 4):
+    # Number of search_files result lists kept when caching is enabled
+    RESULT_CACHE_SIZE = 32
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        cache_ttl: float = 0.0,
+        index_path: Optional[Path] = None
+    ):
         """
         Initialize search engine
 
         Args:
             max_workers: Maximum number of worker threads for parallel search
+            cache_ttl: Seconds to reuse search_files results for an identical
+                search, 0 to disable
+            index_path: File for a persistent trigram index that lets literal
+                content searches skip files without opening them, None to
+                disable
         """
         self.max_workers = max_workers
+        self.cache_ttl = cache_ttl
+        self.content_index = ContentIndex(index_path) if index_path else None
         self._stop_event = threading.Event()
 
+        # Directory listing pool, created the first time a walk branches
+        self._walk_pool: Optional[ThreadPoolExecutor] = None
+        self._walk_pool_lock = threading.Lock()
+
+        # (root, pattern, options key) -> (monotonic time, root mtime, results)
+        self._result_cache: OrderedDict[
+            Tuple, Tuple[float, Optional[int], List[SearchResult]]
+        ] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def search_files(
         self,
         root_path: Path,
@@ -272,6 +667,31 @@ class FileSearch:
         Yields:
             SearchResult objects for matching files
         """
+        for batch in self.search_files_batched(root_path, pattern, options):
+            yield from batch
+
+    def search_files_batched(
+        self,
+        root_path: Path,
+        pattern: str,
+        options: Optional[SearchOptions] = None,
+        batch_size: int = 64
+    ) -> Generator[List[SearchResult], None, None]:
+        """
+        Search for files matching pattern, yielding results in lists
+
+        Resuming the generator once per batch rather than once per result
+        cuts overhead when callers collect everything anyway.
+
+        Args:
+            root_path: Root directory to search
+            pattern: Search pattern (supports wildcards * and ?)
+            options: Search configuration options
+            batch_size: Maximum number of results per list
+
+        Yields:
+            Non-empty lists of SearchResult objects for matching files
+        """
         if options is None:
             options = SearchOptions()
 
@@ -290,27 +710,108 @@ class FileSearch:
                 raise ValueError(f"Invalid regex pattern: {e}")
             match_func = lambda name: bool(regex_pattern.search(name))
         else:
-            # Use fnmatch for wildcard patterns
-            if options.case_sensitive:
-                match_func = lambda name: fnmatch.fnmatch(name, pattern)
-            else:
-                pattern_lower = pattern.lower()
-                match_func = lambda name: fnmatch.fnmatch(name.lower(), pattern_lower)
+            match_func = _compile_wildcard(pattern, options.case_sensitive)
+
+        if self.cache_ttl <= 0:
+            yield from self._match_files(root_path, match_func, options, batch_size)
+            return
+
+        key = (str(root_path), pattern, options.cache_key())
+        root_mtime = _dir_mtime_ns(root_path)
+
+        cached = self._get_cached_results(key, root_mtime)
+        if cached is not None:
+            for start in range(0, len(cached), batch_size):
+                yield cached[start:start + batch_size]
+            return
+
+        results = []
+        for batch in self._match_files(root_path, match_func, options, batch_size):
+            results.extend(batch)
+            yield batch
+
+        # Only complete searches are reused; a closed generator never gets here
+        if not self._stop_event.is_set():
+            self._put_cached_results(key, root_mtime, results)
 
+    def _match_files(
+        self,
+        root_path: Path,
+        match_func: Callable[[str], bool],
+        options: SearchOptions,
+        batch_size: int
+    ) -> Generator[List[SearchResult], None, None]:
+        """Walk tree yielding batches of results for names accepted by match_func"""
         result_count = 0
+        batch: List[SearchResult] = []
 
         # Walk directory tree
-        for file_path in self._walk_directory(root_path, options):
+        for entry in self._iter_files(root_path, options):
             if self._stop_event.is_set():
                 break
 
-            if match_func(file_path.name):
-                yield SearchResult(path=file_path)
+            if match_func(entry.name):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    stat = None
+                batch.append(SearchResult(path=Path(entry.path), stat_result=stat))
                 result_count += 1
 
                 if options.max_results and result_count >= options.max_results:
                     break
 
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+
+        if batch:
+            yield batch
+
+    def _get_cached_results(
+        self,
+        key: Tuple,
+        root_mtime: Optional[int]
+    ) -> Optional[List[SearchResult]]:
+        """
+        Get results of an identical recent search
+
+        An entry is stale once cache_ttl has passed or the root directory's
+        mtime has changed; changes deeper in the tree are only picked up
+        when the TTL runs out.
+        """
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                return None
+
+            stored_at, stored_mtime, results = cached
+            if (time.monotonic() - stored_at > self.cache_ttl
+                    or stored_mtime != root_mtime or root_mtime is None):
+                del self._result_cache[key]
+                return None
+
+            self._result_cache.move_to_end(key)
+            return results
+
+    def _put_cached_results(
+        self,
+        key: Tuple,
+        root_mtime: Optional[int],
+        results: List[SearchResult]
+    ) -> None:
+        """Store results of a completed search"""
+        with self._cache_lock:
+            self._result_cache[key] = (time.monotonic(), root_mtime, results)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Forget cached search results"""
+        with self._cache_lock:
+            self._result_cache.clear()
+
     def search_content(
         self,
         root_path: Path,
@@ -337,42 +838,169 @@ class FileSearch:
         if not root_path.exists():
             raise ValueError(f"Search path does not exist: {root_path}")
 
-        # Compile search pattern
-        if options.use_regex:
-            try:
-                regex_pattern = re.compile(
-                    pattern,
-                    0 if options.case_sensitive else re.IGNORECASE
-                )
-            except re.error as e:
-                raise ValueError(f"Invalid regex pattern: {e}")
-        else:
-            # Convert simple pattern to regex
-            regex_pattern = re.compile(
-                re.escape(pattern),
-                0 if options.case_sensitive else re.IGNORECASE
-            )
+        regex_pattern, literal = _compile_content_pattern(pattern, options)
+        content_index = self.content_index if literal is not None else None
 
         result_count = 0
 
-        # Search files
-        for file_path in self._walk_directory(root_path, options):
-            if self._stop_event.is_set():
-                break
+        try:
+            # Search files
+            for entry in self._iter_files(root_path, options):
+                if self._stop_event.is_set():
+                    break
 
-            # Skip binary files and large files
-            if not self._is_text_file(file_path):
-                continue
+                file_path = Path(entry.path)
 
-            # Search file content
-            for result in self._search_file_content(
-                file_path, regex_pattern, context_lines
-            ):
-                yield result
-                result_count += 1
+                # Skip binary files; these are never indexed
+                if not self._is_text_file(file_path):
+                    continue
 
-                if options.max_results and result_count >= options.max_results:
+                # Skip files the index proves can't contain the literal
+                if content_index is not None:
+                    try:
+                        if not content_index.may_contain(file_path, entry.stat(), literal):
+                            continue
+                    except OSError:
+                        continue
+
+                # Search file content
+                for result in self._search_file_content(
+                    file_path, regex_pattern, context_lines, literal
+                ):
+                    yield result
+                    result_count += 1
+
+                    if options.max_results and result_count >= options.max_results:
+                        return
+        finally:
+            if content_index is not None:
+                # Saved only if a filter was built or dropped
+                content_index.prune(root_path)
+                content_index.save()
+
+    async def search_content_async(
+        self,
+        root_path: Path,
+        pattern: str,
+        options: Optional[SearchOptions] = None,
+        context_lines: int = 0,
+        max_open_files: int = 64
+    ) -> List[SearchResult]:
+        """
+        Search file contents with file reads overlapped via aiofiles
+
+        For trees of many small files, where open/read latency dominates,
+        this keeps up to max_open_files reads in flight instead of reading
+        one file at a time. Results match search_content, and no more files
+        are read once options.max_results are found.
+
+        Args:
+            root_path: Root directory to search
+            pattern: Search pattern (supports regex if options.use_regex=True)
+            options: Search configuration options
+            context_lines: Number of context lines to include before/after match
+            max_open_files: Maximum files open at once
+
+        Returns:
+            List of SearchResult objects with matched content
+        """
+        if options is None:
+            options = SearchOptions()
+
+        root_path = Path(root_path)
+        if not root_path.exists():
+            raise ValueError(f"Search path does not exist: {root_path}")
+
+        regex_pattern, literal = _compile_content_pattern(pattern, options)
+
+        def collect_files() -> List[Tuple[Path, os.stat_result]]:
+            files = []
+            for entry in self._iter_files(root_path, options):
+                if _name_suffix(entry.name).lower() in _BINARY_EXTENSIONS:
+                    continue
+                try:
+                    files.append((Path(entry.path), entry.stat()))
+                except OSError:
+                    continue
+            return files
+
+        files = await asyncio.to_thread(collect_files)
+        max_results = options.max_results
+        results: List[SearchResult] = []
+
+        # Up to max_open_files reads run at once; results are taken in walk
+        # order, so once max_results are in hand the reads still in flight
+        # are cancelled and no further files are opened
+        remaining = iter(files)
+        in_flight: Deque[asyncio.Task] = deque()
+
+        def start_reads() -> None:
+            while len(in_flight) < max_open_files:
+                next_file = next(remaining, None)
+                if next_file is None:
                     return
+                file_path, file_stat = next_file
+                in_flight.append(asyncio.ensure_future(
+                    self._search_file_content_async(
+                        file_path, file_stat, regex_pattern, context_lines, literal
+                    )
+                ))
+
+        try:
+            start_reads()
+            while in_flight and not self._stop_event.is_set():
+                await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                while in_flight and in_flight[0].done():
+                    results.extend(in_flight.popleft().result())
+                if max_results and len(results) >= max_results:
+                    break
+                start_reads()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+        if max_results:
+            del results[max_results:]
+        return results
+
+    async def _search_file_content_async(
+        self,
+        file_path: Path,
+        file_stat: os.stat_result,
+        pattern: re.Pattern,
+        context_lines: int,
+        literal: Optional[bytes]
+    ) -> List[SearchResult]:
+        """Read one file asynchronously and search its text"""
+        # Large files are streamed on a thread rather than read whole
+        if file_stat.st_size > _LARGE_FILE_SIZE:
+            def search_large_file() -> List[SearchResult]:
+                if not self._is_text_file(file_path):
+                    return []
+                return list(self._search_large_file(
+                    file_path, pattern, context_lines, file_stat
+                ))
+
+            return await asyncio.to_thread(search_large_file)
+
+        try:
+            async with aiofiles.open(file_path, 'rb') as f:
+                data = await f.read()
+        except (OSError, PermissionError):
+            return []
+
+        if not _looks_like_text(data[:_TEXT_SAMPLE_SIZE]):
+            return []
+        if literal is not None and literal not in data:
+            return []
+
+        # Same decoding as text mode: drop invalid bytes, universal newlines
+        text = data.decode('utf-8', errors='ignore')
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return list(self._search_text(
+            file_path, text, pattern, context_lines, file_stat
+        ))
 
     def get_matching_files(
         self,
@@ -400,13 +1028,15 @@ class FileSearch:
 
         result_count = 0
 
-        for file_path in self._walk_directory(root_path, options):
+        for entry in self._iter_files(root_path, options):
             if self._stop_event.is_set():
                 break
 
             try:
-                file_stat = file_path.stat()
-                if criteria.matches(file_path, file_stat):
+                # No stat up front: criteria stat lazily, only once the
+                # cheaper name filters have passed
+                file_path = Path(entry.path)
+                if criteria.matches(file_path):
                     yield file_path
                     result_count += 1
 
@@ -432,59 +1062,221 @@ class FileSearch:
         Yields:
             Path objects for files in tree
         """
-        try:
-            for item in root_path.iterdir():
-                if self._stop_event.is_set():
-                    break
+        for entry in self._scan_directory(root_path, options, current_depth):
+            yield Path(entry.path)
 
-                try:
-                    if item.is_dir(follow_symlinks=options.follow_symlinks):
-                        # Check directory exclusions
-                        if options.should_exclude_directory(item.name):
-                            continue
+    def _iter_files(
+        self,
+        root_path: Path,
+        options: SearchOptions
+    ) -> Generator[os.DirEntry, None, None]:
+        """
+        Walk directory tree, listing directories in parallel when the
+        engine has more than one worker; files come in the same order
+        either way
 
-                        # Check depth limit
-                        if options.max_depth and current_depth >= options.max_depth:
-                            continue
+        Entries cache their type and stat() from the moment they are first
+        read and are never refreshed, so use them right away; anything kept
+        past the search should stat the path again.
 
-                        # Recurse if enabled
-                        if options.search_subdirectories:
-                            yield from self._walk_directory(
-                                item, options, current_depth + 1
-                            )
+        Args:
+            root_path: Directory to walk
+            options: Search options for filtering
 
-                    elif item.is_file():
-                        # Check file exclusions
-                        if options.should_exclude_file(item):
-                            continue
+        Yields:
+            DirEntry objects for files in tree
+        """
+        if self.max_workers > 1 and options.search_subdirectories:
+            return self._scan_directory_parallel(root_path, options)
+        return self._scan_directory(root_path, options)
 
-                        # Check extension filter
-                        if not options.matches_extension_filter(item):
-                            continue
+    def _scan_directory(
+        self,
+        root_path: Union[str, Path],
+        options: SearchOptions,
+        current_depth: int = 0
+    ) -> Generator[os.DirEntry, None, None]:
+        """
+        Walk directory tree using os.scandir
 
-                        # Check size limit
-                        if options.max_file_size:
-                            try:
-                                if item.stat().st_size > options.max_file_size:
-                                    continue
-                            except (OSError, PermissionError):
-                                continue
+        File type checks reuse the type returned with the directory listing,
+        and DirEntry caches its stat(), so callers needing size or mtime
+        don't stat the file again. Filters work on entry names; callers
+        build a Path only for the files they keep.
 
-                        yield item
+        Args:
+            root_path: Directory to walk
+            options: Search options for filtering
+            current_depth: Current recursion depth
 
-                except (OSError, PermissionError):
-                    # Skip inaccessible items
-                    continue
+        Yields:
+            DirEntry objects for files in tree
+        """
+        files, subdirs = self._list_directory(root_path, options, current_depth)
+
+        for item in files:
+            if self._stop_event.is_set():
+                return
+            yield item
+
+        for subdir in subdirs:
+            if self._stop_event.is_set():
+                return
+            yield from self._scan_directory(subdir, options, current_depth + 1)
+
+    def _scan_directory_parallel(
+        self,
+        root_path: Path,
+        options: SearchOptions
+    ) -> Generator[os.DirEntry, None, None]:
+        """
+        Walk directory tree with directories listed on a thread pool
+
+        Directories are listed on the calling thread until one has more
+        than one subdirectory; those siblings are then submitted to the
+        engine's pool together, so listings overlap while filesystem calls
+        block and shallow walks never touch the pool. Files are still
+        yielded in the same depth-first order as _scan_directory, so
+        results and max_results cut-offs don't depend on thread timing.
 
+        Args:
+            root_path: Directory to walk
+            options: Search options for filtering
+
+        Yields:
+            DirEntry objects for files in tree
+        """
+        cancelled = threading.Event()
+
+        def list_directory(
+            dir_path: Union[str, Path],
+            depth: int
+        ) -> Tuple[List[os.DirEntry], List[str]]:
+            if cancelled.is_set():
+                return [], []
+            return self._list_directory(dir_path, options, depth)
+
+        # Directories still to yield, next one last; each is either being
+        # listed on the pool or, with no future, listed when popped
+        stack: List[Tuple[Optional[Future], Union[str, Path], int]] = [
+            (None, root_path, 0)
+        ]
+        try:
+            while stack:
+                future, dir_path, depth = stack.pop()
+                if future is None:
+                    files, subdirs = self._list_directory(dir_path, options, depth)
+                else:
+                    files, subdirs = future.result()
+
+                if self._stop_event.is_set():
+                    return
+
+                if len(subdirs) > 1:
+                    pool = self._get_walk_pool()
+                    children = [
+                        (pool.submit(list_directory, subdir, depth + 1), subdir, depth + 1)
+                        for subdir in subdirs
+                    ]
+                else:
+                    children = [(None, subdir, depth + 1) for subdir in subdirs]
+                stack.extend(reversed(children))
+
+                for item in files:
+                    if self._stop_event.is_set():
+                        return
+                    yield item
+        finally:
+            # Also reached when the caller stops iterating early
+            cancelled.set()
+            for future, _, _ in stack:
+                if future is not None:
+                    future.cancel()
+
+    def _get_walk_pool(self) -> ThreadPoolExecutor:
+        """Get the directory listing pool, creating it on first use"""
+        with self._walk_pool_lock:
+            if self._walk_pool is None:
+                self._walk_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="search-walk"
+                )
+            return self._walk_pool
+
+    def shutdown(self) -> None:
+        """Stop the directory listing threads, if any were started"""
+        with self._walk_pool_lock:
+            pool, self._walk_pool = self._walk_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _list_directory(
+        self,
+        dir_path: Union[str, Path],
+        options: SearchOptions,
+        depth: int
+    ) -> Tuple[List[os.DirEntry], List[str]]:
+        """
+        List one directory, applying the search filters
+
+        Args:
+            dir_path: Directory to list
+            options: Search options for filtering
+            depth: Depth of dir_path below the search root
+
+        Returns:
+            Tuple of (matching DirEntry files, subdirectory paths to walk)
+        """
+        files: List[os.DirEntry] = []
+        subdirs: List[str] = []
+
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
         except (OSError, PermissionError):
             # Skip inaccessible directories
-            pass
+            return files, subdirs
+
+        # Resolve options once per directory so the entry loop only runs
+        # the checks this search uses; default options reduce it to the
+        # type check and excluded-directory lookup
+        follow_symlinks = options.follow_symlinks
+        excluded_dirs = options.exclude_directories
+        descend = options.search_subdirectories and not (
+            options.max_depth and depth >= options.max_depth
+        )
+        name_filter = options._file_name_filter()
+        max_file_size = options.max_file_size
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    # Check directory exclusions, depth limit and recursion
+                    if descend and entry.name not in excluded_dirs:
+                        subdirs.append(entry.path)
+
+                elif entry.is_file():
+                    # Check file exclusions and extension filter
+                    if name_filter is not None and not name_filter(entry.name):
+                        continue
+
+                    # Check size limit
+                    if max_file_size and entry.stat().st_size > max_file_size:
+                        continue
+
+                    files.append(entry)
+
+            except (OSError, PermissionError):
+                # Skip inaccessible items
+                continue
+
+        return files, subdirs
 
     def _search_file_content(
         self,
         file_path: Path,
         pattern: re.Pattern,
-        context_lines: int
+        context_lines: int,
+        literal: Optional[bytes] = None
     ) -> Generator[SearchResult, None, None]:
         """
         Search for pattern in single file content
@@ -493,51 +1285,150 @@ class FileSearch:
             file_path: File to search
             pattern: Compiled regex pattern
             context_lines: Number of context lines
+            literal: Bytes every match contains; files without them are
+                skipped before decoding
 
         Yields:
             SearchResult objects for matches
         """
         try:
-            # Use memory mapping for large files
-            file_size = file_path.stat().st_size
+            # One stat per file, shared by every result it produces
+            file_stat = file_path.stat()
+
+            if literal is not None and not self._file_contains(
+                file_path, literal, file_stat.st_size
+            ):
+                return
 
-            if file_size > 10 * 1024 * 1024:  # 10MB threshold
-                yield from self._search_large_file(file_path, pattern, context_lines)
+            # Use memory mapping for large files
+            if file_stat.st_size > _LARGE_FILE_SIZE:
+                yield from self._search_large_file(
+                    file_path, pattern, context_lines, file_stat
+                )
             else:
-                yield from self._search_small_file(file_path, pattern, context_lines)
+                yield from self._search_small_file(
+                    file_path, pattern, context_lines, file_stat
+                )
 
         except (OSError, PermissionError, UnicodeDecodeError):
             # Skip files that can't be read
             pass
 
+    @staticmethod
+    def _file_contains(file_path: Path, needle: bytes, file_size: int) -> bool:
+        """
+        Check for a byte string in a file without decoding it
+
+        mmap.find runs in C over the mapped file, so files without the
+        needle are rejected without building any str objects.
+        """
+        if file_size == 0:
+            return False
+
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(needle) != -1
+
     def _search_small_file(
         self,
         file_path: Path,
         pattern: re.Pattern,
-        context_lines: int
+        context_lines: int,
+        file_stat: Optional[os.stat_result] = None
     ) -> Generator[SearchResult, None, None]:
         """Search small file by reading into memory"""
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-
-            for line_num, line in enumerate(lines, 1):
-                if pattern.search(line):
-                    context = self._get_context(lines, line_num - 1, context_lines)
-                    yield SearchResult(
-                        path=file_path,
-                        matched_line=line.rstrip('\n'),
-                        line_number=line_num,
-                        match_context=context
-                    )
+                text = f.read()
+            yield from self._search_text(
+                file_path, text, pattern, context_lines, file_stat
+            )
         except Exception:
             pass
 
+    def _search_text(
+        self,
+        file_path: Path,
+        text: str,
+        pattern: re.Pattern,
+        context_lines: int,
+        file_stat: Optional[os.stat_result]
+    ) -> Generator[SearchResult, None, None]:
+        """Search decoded file text, with newlines normalized to \\n"""
+        scanner = _whole_text_scanner(pattern)
+        if scanner is not None:
+            yield from self._scan_text(
+                file_path, text, pattern, scanner, context_lines, file_stat
+            )
+            return
+
+        lines = io.StringIO(text).readlines()
+        for line_num, line in enumerate(lines, 1):
+            if pattern.search(line):
+                context = self._get_context(lines, line_num - 1, context_lines)
+                yield SearchResult(
+                    path=file_path,
+                    matched_line=line.rstrip('\n'),
+                    line_number=line_num,
+                    match_context=context,
+                    stat_result=file_stat
+                )
+
+    def _scan_text(
+        self,
+        file_path: Path,
+        text: str,
+        pattern: re.Pattern,
+        scanner: re.Pattern,
+        context_lines: int,
+        file_stat: Optional[os.stat_result]
+    ) -> Generator[SearchResult, None, None]:
+        """
+        Search whole file text, producing the same results as a per-line scan
+
+        The scanner runs over the whole text in one regex call per match,
+        skipping non-matching lines without a Python-level loop. Each
+        candidate line is confirmed with the original pattern, since a
+        match found across line boundaries may not exist within the line.
+        """
+        size = len(text)
+        pos = 0
+        line_num = 1
+        counted_to = 0
+
+        while pos < size:
+            match = scanner.search(text, pos)
+            if match is None:
+                break
+
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            if line_start == size:
+                break  # Empty match after the final newline, not a line
+            line_end = text.find('\n', match.start())
+            next_start = size if line_end == -1 else line_end + 1
+            line = text[line_start:next_start]
+
+            if pattern.search(line):
+                line_num += text.count('\n', counted_to, line_start)
+                counted_to = line_start
+                yield SearchResult(
+                    path=file_path,
+                    matched_line=line.rstrip('\n'),
+                    line_number=line_num,
+                    match_context=_text_context(
+                        text, line_start, next_start, context_lines
+                    ),
+                    stat_result=file_stat
+                )
+
+            pos = next_start
+
     def _search_large_file(
         self,
         file_path: Path,
         pattern: re.Pattern,
-        context_lines: int
+        context_lines: int,
+        file_stat: Optional[os.stat_result] = None
     ) -> Generator[SearchResult, None, None]:
         """Search large file using memory mapping"""
         try:
@@ -559,7 +1450,8 @@ class FileSearch:
                             path=file_path,
                             matched_line=line.rstrip('\n'),
                             line_number=line_num,
-                            match_context=context
+                            match_context=context,
+                            stat_result=file_stat
                         )
         except Exception:
             pass
@@ -586,32 +1478,14 @@ class FileSearch:
             True if file appears to be text
         """
         # Check extension blacklist
-        binary_extensions = {
-            '.exe', '.dll', '.so', '.dylib', '.bin', '.obj', '.o',
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg',
-            '.mp3', '.mp4', '.avi', '.mov', '.wav', '.flac',
-            '.zip', '.tar', '.gz', '.7z', '.rar', '.bz2',
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'
-        }
-
-        if file_path.suffix.lower() in binary_extensions:
+        if file_path.suffix.lower() in _BINARY_EXTENSIONS:
             return False
 
         # Sample first bytes to check for binary content
         try:
             with open(file_path, 'rb') as f:
-                sample = f.read(8192)
-
-            # Check for null bytes (common in binary files)
-            if b'\x00' in sample:
-                return False
-
-            # Try to decode as UTF-8
-            try:
-                sample.decode('utf-8')
-                return True
-            except UnicodeDecodeError:
-                return False
+                sample = f.read(_TEXT_SAMPLE_SIZE)
+            return _looks_like_text(sample)
 
         except (OSError, PermissionError):
             return False
@@ -696,10 +1570,11 @@ class AsyncFileSearch:
     ) -> List[SearchResult]:
         """Search single path and return results"""
         results = []
-        for result in self.base_search.search_files(path, pattern, options):
-            results.append(result)
+        for batch in self.base_search.search_files_batched(path, pattern, options):
+            results.extend(batch)
             if callback:
-                callback(result)
+                for result in batch:
+                    callback(result)
         return results
 
     def shutdown(self):
@@ -727,16 +1602,8 @@ def filter_files(
     Returns:
         Filtered list of files
     """
-    filtered = []
-    for file_path in files:
-        try:
-            file_stat = file_path.stat()
-            if criteria.matches(file_path, file_stat):
-                filtered.append(file_path)
-        except (OSError, PermissionError):
-            continue
-
-    return filtered
+    # criteria stats each file only if a filter reached needs it
+    return [file_path for file_path in files if criteria.matches(file_path)]
 
 
 # Convenience functions for common operations
@@ -758,7 +1625,10 @@ def search_files(
         List of search results
     """
     searcher = FileSearch()
-    return list(searcher.search_files(Path(path), pattern, options))
+    results: List[SearchResult] = []
+    for batch in searcher.search_files_batched(Path(path), pattern, options):
+        results.extend(batch)
+    return results
 
 
 def search_content(
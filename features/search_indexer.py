@@ -11,19 +11,28 @@ Performance Targets:
 - Incremental updates: <10ms per file change
 """
 
+import math
+import os
 import pickle
 import hashlib
+import sys
 import time
+import zlib
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Set, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
+from itertools import chain
 from threading import RLock
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import queue
+from bisect import bisect_left, insort
 import mmap
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IndexEntry:
     """Single file index entry with metadata"""
     path: Path
@@ -32,13 +41,18 @@ class IndexEntry:
     size: int
     modified: float
     extension: str
-    # Trigram index for fuzzy matching
-    trigrams: Set[str] = field(default_factory=set)
+    # Distinct trigram count for fuzzy scoring, set by SearchIndex from the
+    # trigrams it indexes; the trigrams themselves live in its trigram_index
+    trigram_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def trigrams(self) -> Set[str]:
+        """Trigram set of the lowercase filename, generated on each access"""
+        return self._generate_trigrams(self.name_lower)
 
-    def __post_init__(self):
-        """Generate trigrams from filename for fuzzy matching"""
-        if not self.trigrams:
-            self.trigrams = self._generate_trigrams(self.name_lower)
+    def _set_trigram_count(self, count: int) -> None:
+        """Record the distinct trigram count computed while indexing"""
+        object.__setattr__(self, 'trigram_count', count)
 
     @staticmethod
     def _generate_trigrams(text: str) -> Set[str]:
@@ -58,11 +72,55 @@ class IndexEntry:
                 name_lower=file_path.name.lower(),
                 size=stat.st_size,
                 modified=stat.st_mtime,
-                extension=file_path.suffix.lower()
+                extension=sys.intern(file_path.suffix.lower())
             )
         except (OSError, PermissionError) as e:
             raise ValueError(f"Cannot index file {file_path}: {e}")
 
+    @classmethod
+    def from_dir_entry(cls, dir_entry: os.DirEntry) -> 'IndexEntry':
+        """Create index entry from a directory listing entry
+
+        Uses the stat cached on the DirEntry, so a directory walk doesn't
+        stat each file again.
+        """
+        try:
+            stat = dir_entry.stat()
+        except (OSError, PermissionError) as e:
+            raise ValueError(f"Cannot index file {dir_entry.path}: {e}")
+
+        file_path = Path(dir_entry.path)
+        name = dir_entry.name
+        return cls(
+            path=file_path,
+            name=name,
+            name_lower=name.lower(),
+            size=stat.st_size,
+            modified=stat.st_mtime,
+            extension=sys.intern(file_path.suffix.lower())
+        )
+
+
+# Layout of pickled SearchIndex state; older caches are rebuilt
+_INDEX_STATE_VERSION = 3
+
+# zlib level for cache files: names compress well even at low levels
+_CACHE_COMPRESSION_LEVEL = 3
+
+
+# Directory names skipped when build_index is given none
+_DEFAULT_EXCLUDED_DIRS = frozenset({
+    '.git', '.svn', '__pycache__', 'node_modules', '.venv', 'venv'
+})
+
+# Recent prefix and fuzzy query results kept per index
+_QUERY_CACHE_SIZE = 256
+
+
+def _new_posting() -> array:
+    """Create an empty trigram posting list of entry indices"""
+    return array('I')
+
 
 @dataclass
 class SearchIndex:
@@ -74,12 +132,23 @@ class SearchIndex:
     # Fast lookup indices
     name_index: Dict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
     extension_index: Dict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
-    trigram_index: Dict[str, Set[int]] = field(default_factory=lambda: defaultdict(set))
+    # Trigram -> sorted entry indices, 4 bytes per posting
+    trigram_index: Dict[str, array] = field(
+        default_factory=lambda: defaultdict(_new_posting)
+    )
 
     # Metadata
     root_path: Optional[Path] = None
     indexed_at: Optional[datetime] = None
     file_count: int = 0
+    # Walked directory -> st_mtime_ns when listed, for cache validation
+    dir_mtimes: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    # Sorted name_index keys for prefix lookups, rebuilt after new names
+    _sorted_names: Optional[List[str]] = field(default=None, repr=False)
+
+    # Query key -> results, cleared whenever entries change
+    _query_cache: OrderedDict = field(default_factory=OrderedDict, repr=False)
 
     # Thread safety
     _lock: RLock = field(default_factory=RLock)
@@ -87,12 +156,14 @@ class SearchIndex:
     def add_entry(self, entry: IndexEntry) -> None:
         """Add or update entry in index"""
         with self._lock:
+            self._query_cache.clear()
+
             # Update or add entry
             if entry.path in self.path_map:
                 idx = self.path_map[entry.path]
                 old_entry = self.entries[idx]
-                # Remove old indices
-                self._remove_indices(old_entry, idx)
+                # Touch only the indices whose keys changed
+                self._update_indices(old_entry, entry, idx)
                 self.entries[idx] = entry
             else:
                 idx = len(self.entries)
@@ -100,8 +171,14 @@ class SearchIndex:
                 self.path_map[entry.path] = idx
                 self.file_count += 1
 
-            # Add new indices
-            self._add_indices(entry, idx)
+                # Add new indices
+                self._add_indices(entry, idx)
+
+    def add_entries(self, entries: Iterable[IndexEntry]) -> None:
+        """Add or update many entries under a single lock acquisition"""
+        with self._lock:
+            for entry in entries:
+                self.add_entry(entry)
 
     def remove_entry(self, file_path: Path) -> bool:
         """Remove entry from index"""
@@ -109,6 +186,7 @@ class SearchIndex:
             if file_path not in self.path_map:
                 return False
 
+            self._query_cache.clear()
             idx = self.path_map[file_path]
             entry = self.entries[idx]
 
@@ -124,15 +202,19 @@ class SearchIndex:
     def _add_indices(self, entry: IndexEntry, idx: int) -> None:
         """Add entry to all indices"""
         # Name index (case-insensitive)
+        if entry.name_lower not in self.name_index:
+            self._sorted_names = None
         self.name_index[entry.name_lower].append(idx)
 
         # Extension index
         if entry.extension:
             self.extension_index[entry.extension].append(idx)
 
-        # Trigram index for fuzzy search
-        for trigram in entry.trigrams:
-            self.trigram_index[trigram].add(idx)
+        # Trigram index for fuzzy search; the set is generated once here
+        trigrams = entry.trigrams
+        entry._set_trigram_count(len(trigrams))
+        for trigram in trigrams:
+            self._add_posting(trigram, idx)
 
     def _remove_indices(self, entry: IndexEntry, idx: int) -> None:
         """Remove entry from all indices"""
@@ -152,40 +234,152 @@ class SearchIndex:
 
         # Trigram index
         for trigram in entry.trigrams:
-            if trigram in self.trigram_index:
-                self.trigram_index[trigram].discard(idx)
+            self._remove_posting(trigram, idx)
+
+    def _update_indices(self, old_entry: IndexEntry, entry: IndexEntry, idx: int) -> None:
+        """Move an updated entry between indices, touching only changed keys"""
+        if old_entry.name_lower != entry.name_lower:
+            try:
+                self.name_index[old_entry.name_lower].remove(idx)
+            except ValueError:
+                pass
+            if entry.name_lower not in self.name_index:
+                self._sorted_names = None
+            self.name_index[entry.name_lower].append(idx)
+
+            # Trigrams come from the name, so only the difference moves
+            old_trigrams = old_entry.trigrams
+            new_trigrams = entry.trigrams
+            entry._set_trigram_count(len(new_trigrams))
+            for trigram in old_trigrams - new_trigrams:
+                self._remove_posting(trigram, idx)
+            for trigram in new_trigrams - old_trigrams:
+                self._add_posting(trigram, idx)
+        else:
+            entry._set_trigram_count(old_entry.trigram_count)
+
+        if old_entry.extension != entry.extension:
+            if old_entry.extension:
+                try:
+                    self.extension_index[old_entry.extension].remove(idx)
+                except ValueError:
+                    pass
+            if entry.extension:
+                self.extension_index[entry.extension].append(idx)
+
+    def _add_posting(self, trigram: str, idx: int) -> None:
+        """Insert idx into a trigram posting, keeping it sorted"""
+        posting = self.trigram_index[trigram]
+        # New entries get the highest index, so appending keeps order
+        if not posting or posting[-1] < idx:
+            posting.append(idx)
+        else:
+            insort(posting, idx)
+
+    def _remove_posting(self, trigram: str, idx: int) -> None:
+        """Delete idx from a trigram posting if present"""
+        posting = self.trigram_index.get(trigram)
+        if posting is None:
+            return
+        pos = bisect_left(posting, idx)
+        if pos < len(posting) and posting[pos] == idx:
+            del posting[pos]
 
     def search_exact(self, filename: str, case_sensitive: bool = False) -> List[IndexEntry]:
         """Search for exact filename match"""
         with self._lock:
-            search_name = filename if case_sensitive else filename.lower()
+            # Exact names always share their lowercase key, so both modes
+            # use the index; case-sensitive search then compares the name
+            indices = self.name_index.get(filename.lower(), [])
+            entries = [self.entries[i] for i in indices if self.entries[i]]
 
             if case_sensitive:
-                # Linear search for case-sensitive
-                return [e for e in self.entries if e and e.name == filename]
-            else:
-                # Use index for case-insensitive
-                indices = self.name_index.get(search_name, [])
-                return [self.entries[i] for i in indices if self.entries[i]]
+                return [e for e in entries if e.name == filename]
+            return entries
+
+    def _memoized(self, key: Tuple, search, *args) -> list:
+        """
+        Run a query through the recent-results cache
+
+        Repeated queries, as while typing into a search box, skip the
+        lookup entirely; any add or remove empties the cache.
+        """
+        with self._lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return list(cached)
+
+            results = search(*args)
+            self._query_cache[key] = list(results)
+            if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+            return results
 
     def search_prefix(self, prefix: str, case_sensitive: bool = False) -> List[IndexEntry]:
         """Search for filenames starting with prefix"""
+        return self._memoized(
+            ('prefix', prefix, case_sensitive),
+            self._search_prefix, prefix, case_sensitive
+        )
+
+    def _search_prefix(self, prefix: str, case_sensitive: bool) -> List[IndexEntry]:
+        """Search for filenames starting with prefix, bypassing the cache"""
         with self._lock:
             search_prefix = prefix if case_sensitive else prefix.lower()
             results = []
 
-            for name, indices in self.name_index.items():
-                if name.startswith(search_prefix):
-                    results.extend([self.entries[i] for i in indices if self.entries[i]])
+            # Names sharing the prefix form one contiguous run of the sorted
+            # names, found by bisection instead of scanning every name
+            names = self._sorted_names
+            if names is None:
+                names = self._sorted_names = sorted(self.name_index)
+
+            for pos in range(bisect_left(names, search_prefix), len(names)):
+                name = names[pos]
+                if not name.startswith(search_prefix):
+                    break
+                results.extend([self.entries[i] for i in self.name_index[name] if self.entries[i]])
 
             return results
 
-    def search_fuzzy(self, pattern: str, max_results: int = 100) -> List[Tuple[IndexEntry, float]]:
+    def search_fuzzy(
+        self,
+        pattern: str,
+        max_results: int = 100,
+        min_score: float = 0.0
+    ) -> List[Tuple[IndexEntry, float]]:
         """
         Fuzzy search using trigram matching
 
+        Args:
+            pattern: Name to match approximately
+            max_results: Maximum number of results
+            min_score: Drop entries scoring below this similarity
+
         Returns list of (entry, similarity_score) tuples sorted by score
         """
+        return self._memoized(
+            ('fuzzy', pattern, max_results, min_score),
+            self._search_fuzzy, pattern, max_results, min_score
+        )
+
+    def _search_fuzzy(
+        self,
+        pattern: str,
+        max_results: int,
+        min_score: float
+    ) -> List[Tuple[IndexEntry, float]]:
+        """
+        Fuzzy search bypassing the cache
+
+        An entry sharing c of the pattern's q trigrams scores at most c / q,
+        so min_score (raised when prefix matches alone fill max_results)
+        implies a minimum number of shared trigrams; every
+        qualifying entry then appears in one of the rarest postings. Only
+        those postings are scanned, and candidates are checked against the
+        common ones by bisection.
+        """
         with self._lock:
             pattern_lower = pattern.lower()
             pattern_trigrams = IndexEntry._generate_trigrams(pattern_lower)
@@ -193,13 +387,35 @@ class SearchIndex:
             if not pattern_trigrams:
                 return []
 
-            # Count trigram matches for each file
-            match_counts = defaultdict(int)
-            for trigram in pattern_trigrams:
-                if trigram in self.trigram_index:
-                    for idx in self.trigram_index[trigram]:
-                        if self.entries[idx]:
-                            match_counts[idx] += 1
+            # Names starting with the pattern score at least 0.9 and exact
+            # names 1.0; when those alone fill max_results nothing scoring
+            # lower can make the cut, so raise the floor before scanning
+            if len(pattern_lower) >= 3:
+                prefix_hits = self._search_prefix(pattern_lower, True)
+                if len(prefix_hits) >= max_results:
+                    exact_hits = sum(1 for e in prefix_hits if e.name_lower == pattern_lower)
+                    floor = 1.0 if exact_hits >= max_results else 0.9
+                    min_score = max(min_score, floor)
+
+            # Postings from rarest to most common
+            postings = sorted(
+                (p for p in map(self.trigram_index.get, pattern_trigrams) if p),
+                key=len
+            )
+            required = max(1, math.ceil(min_score * len(pattern_trigrams) - 1e-9))
+            if len(postings) < required:
+                return []
+
+            # Candidates must share a trigram from the rarest postings
+            split = len(postings) - required + 1
+            match_counts = Counter(chain.from_iterable(postings[:split]))
+
+            for posting in postings[split:]:
+                size = len(posting)
+                for idx in match_counts:
+                    pos = bisect_left(posting, idx)
+                    if pos < size and posting[pos] == idx:
+                        match_counts[idx] += 1
 
             # Calculate similarity scores (Jaccard similarity)
             results = []
@@ -209,7 +425,7 @@ class SearchIndex:
                     continue
 
                 # Jaccard similarity: |intersection| / |union|
-                union_size = len(pattern_trigrams) + len(entry.trigrams) - count
+                union_size = len(pattern_trigrams) + entry.trigram_count - count
                 similarity = count / union_size if union_size > 0 else 0
 
                 # Boost exact matches and prefix matches
@@ -218,7 +434,8 @@ class SearchIndex:
                 elif entry.name_lower.startswith(pattern_lower):
                     similarity = max(similarity, 0.9)
 
-                results.append((entry, similarity))
+                if similarity >= min_score:
+                    results.append((entry, similarity))
 
             # Sort by similarity (descending) and limit results
             results.sort(key=lambda x: x[1], reverse=True)
@@ -233,6 +450,78 @@ class SearchIndex:
             indices = self.extension_index.get(ext, [])
             return [self.entries[i] for i in indices if self.entries[i]]
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get picklable state with entries stored column-wise
+
+        Names, directory ids, sizes and mtimes go into flat lists and arrays
+        instead of one pickled object per entry, with each directory stored
+        once; the lock and derived caches are left out.
+        """
+        with self._lock:
+            entries = self.entries
+            dir_ids: Dict[Path, int] = {}
+            for e in entries:
+                if e:
+                    dir_ids.setdefault(e.path.parent, len(dir_ids))
+            return {
+                'version': _INDEX_STATE_VERSION,
+                'dirs': [str(d) for d in dir_ids],
+                'dir_ids': array('I', (dir_ids[e.path.parent] if e else 0 for e in entries)),
+                'names': [e.name if e else None for e in entries],
+                'sizes': array('q', (e.size if e else 0 for e in entries)),
+                'mtimes': array('d', (e.modified if e else 0.0 for e in entries)),
+                'trigram_counts': array('I', (e.trigram_count if e else 0 for e in entries)),
+                'name_index': dict(self.name_index),
+                'extension_index': dict(self.extension_index),
+                'trigram_index': dict(self.trigram_index),
+                'root_path': self.root_path,
+                'indexed_at': self.indexed_at,
+                'file_count': self.file_count,
+                'dir_mtimes': self.dir_mtimes,
+            }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore index from column-wise state"""
+        if state.get('version') != _INDEX_STATE_VERSION:
+            raise ValueError("Unsupported index cache format")
+
+        # Joining a name onto its parsed directory is much cheaper than
+        # parsing every full path
+        dirs = [Path(d) for d in state['dirs']]
+        entries: List[Optional[IndexEntry]] = []
+        for name, dir_id, size, mtime, trigram_count in zip(
+            state['names'], state['dir_ids'], state['sizes'], state['mtimes'],
+            state['trigram_counts']
+        ):
+            if name is None:
+                entries.append(None)
+                continue
+            file_path = dirs[dir_id] / name
+            entry = IndexEntry(
+                path=file_path,
+                name=name,
+                name_lower=name.lower(),
+                size=size,
+                modified=mtime,
+                extension=sys.intern(file_path.suffix.lower())
+            )
+            entry._set_trigram_count(trigram_count)
+            entries.append(entry)
+
+        self.entries = entries
+        self.path_map = {e.path: i for i, e in enumerate(entries) if e}
+        self.name_index = defaultdict(list, state['name_index'])
+        self.extension_index = defaultdict(list, state['extension_index'])
+        self.trigram_index = defaultdict(_new_posting, state['trigram_index'])
+        self.root_path = state['root_path']
+        self.indexed_at = state['indexed_at']
+        self.file_count = state['file_count']
+        self.dir_mtimes = state['dir_mtimes']
+        self._sorted_names = None
+        self._query_cache = OrderedDict()
+        self._lock = RLock()
+
     def get_statistics(self) -> Dict[str, any]:
         """Get index statistics"""
         with self._lock:
@@ -268,15 +557,18 @@ class FileIndexer:
     - Persistent index caching
     """
 
-    def __init__(self, cache_dir: Optional[Path] = None):
+    def __init__(self, cache_dir: Optional[Path] = None, max_workers: int = 4):
         """
         Initialize file indexer
 
         Args:
             cache_dir: Directory for index cache (default: system temp)
+            max_workers: Threads listing and stat-ing directories during a
+                build; 1 walks on the calling thread
         """
         self.cache_dir = cache_dir or Path.home() / '.dc_commander' / 'index_cache'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
         self._indices: Dict[Path, SearchIndex] = {}
         self._lock = RLock()
 
@@ -301,9 +593,15 @@ class FileIndexer:
         """
         root_path = Path(root_path).resolve()
 
+        # Frozen so worker threads share one immutable set
+        exclude_dirs = (
+            frozenset(exclude_dirs) if exclude_dirs else _DEFAULT_EXCLUDED_DIRS
+        )
+        cache_path = self._get_cache_path(root_path, exclude_dirs, max_depth)
+
         # Check cache first
         if not force_rebuild:
-            cached_index = self._load_cached_index(root_path)
+            cached_index = self._load_cached_index(cache_path)
             if cached_index and self._is_index_valid(cached_index, root_path):
                 with self._lock:
                     self._indices[root_path] = cached_index
@@ -313,17 +611,22 @@ class FileIndexer:
         start_time = time.time()
         index = SearchIndex(root_path=root_path, indexed_at=datetime.now())
 
-        exclude_dirs = exclude_dirs or {
-            '.git', '.svn', '__pycache__', 'node_modules', '.venv', 'venv'
-        }
-
-        # Walk directory and build index
-        self._walk_and_index(root_path, index, exclude_dirs, max_depth)
+        # Walk directory, then add everything in one batch
+        entries: List[IndexEntry] = []
+        if self.max_workers > 1:
+            self._walk_and_index_parallel(
+                root_path, entries, index.dir_mtimes, exclude_dirs, max_depth
+            )
+        else:
+            self._walk_and_index(
+                root_path, entries, index.dir_mtimes, exclude_dirs, max_depth
+            )
+        index.add_entries(entries)
 
         build_time = time.time() - start_time
 
         # Cache the index
-        self._save_index_cache(root_path, index)
+        self._save_index_cache(cache_path, index)
 
         with self._lock:
             self._indices[root_path] = index
@@ -335,31 +638,111 @@ class FileIndexer:
 
     def _walk_and_index(
         self,
-        path: Path,
-        index: SearchIndex,
+        path: Union[str, Path],
+        entries: List[IndexEntry],
+        dir_mtimes: Dict[str, int],
         exclude_dirs: Set[str],
         max_depth: Optional[int],
         current_depth: int = 0
     ) -> None:
-        """Recursively walk directory and add to index"""
+        """Recursively walk directory with os.scandir, collecting entries"""
         if max_depth is not None and current_depth > max_depth:
             return
 
-        try:
-            for item in path.iterdir():
-                try:
-                    if item.is_dir():
-                        if item.name not in exclude_dirs:
-                            self._walk_and_index(
-                                item, index, exclude_dirs, max_depth, current_depth + 1
-                            )
-                    elif item.is_file():
-                        entry = IndexEntry.from_path(item)
-                        index.add_entry(entry)
-                except (OSError, PermissionError, ValueError):
+        files, subdirs, mtime_ns = self._index_directory(path, exclude_dirs)
+        entries.extend(files)
+        if mtime_ns is not None:
+            dir_mtimes[str(path)] = mtime_ns
+
+        for subdir in subdirs:
+            self._walk_and_index(
+                subdir, entries, dir_mtimes, exclude_dirs, max_depth,
+                current_depth + 1
+            )
+
+    def _walk_and_index_parallel(
+        self,
+        root_path: Path,
+        entries: List[IndexEntry],
+        dir_mtimes: Dict[str, int],
+        exclude_dirs: Set[str],
+        max_depth: Optional[int]
+    ) -> None:
+        """
+        Walk directory tree with directories indexed on a thread pool
+
+        Listing and stat calls release the GIL, so workers overlap their
+        filesystem waits; each hands back one directory's entries and
+        subdirectories and this thread merges them, leaving the index
+        itself single-threaded.
+        """
+        listings: "queue.SimpleQueue" = queue.SimpleQueue()
+
+        def index_directory(dir_path: Union[str, Path], depth: int) -> None:
+            files: List[IndexEntry] = []
+            subdirs: List[str] = []
+            mtime_ns = None
+            try:
+                files, subdirs, mtime_ns = self._index_directory(dir_path, exclude_dirs)
+            finally:
+                # Always report back, or the merge loop would wait forever
+                listings.put((dir_path, files, subdirs, mtime_ns, depth))
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="index-walk"
+        ) as executor:
+            executor.submit(index_directory, root_path, 0)
+            pending = 1
+
+            while pending:
+                dir_path, files, subdirs, mtime_ns, depth = listings.get()
+                pending -= 1
+                entries.extend(files)
+                if mtime_ns is not None:
+                    dir_mtimes[str(dir_path)] = mtime_ns
+
+                if max_depth is not None and depth >= max_depth:
                     continue
+                for subdir in subdirs:
+                    executor.submit(index_directory, subdir, depth + 1)
+                    pending += 1
+
+    def _index_directory(
+        self,
+        path: Union[str, Path],
+        exclude_dirs: Set[str]
+    ) -> Tuple[List[IndexEntry], List[str], Optional[int]]:
+        """
+        List one directory, building entries for its files
+
+        The directory is stat-ed before listing, so a change made while
+        it's listed still leaves a newer mtime than the one recorded.
+
+        Returns:
+            Tuple of (entries for files, subdirectories to walk, directory
+            st_mtime_ns or None if it couldn't be read)
+        """
+        files: List[IndexEntry] = []
+        subdirs: List[str] = []
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                dir_entries = list(it)
         except (OSError, PermissionError):
-            pass
+            return files, subdirs, None
+
+        for dir_entry in dir_entries:
+            try:
+                if dir_entry.is_dir():
+                    if dir_entry.name not in exclude_dirs:
+                        subdirs.append(dir_entry.path)
+                elif dir_entry.is_file():
+                    files.append(IndexEntry.from_dir_entry(dir_entry))
+            except (OSError, PermissionError, ValueError):
+                continue
+
+        return files, subdirs, mtime_ns
 
     def update_file(self, root_path: Path, file_path: Path) -> bool:
         """
@@ -393,30 +776,42 @@ class FileIndexer:
         with self._lock:
             return self._indices.get(Path(root_path).resolve())
 
-    def _get_cache_path(self, root_path: Path) -> Path:
-        """Get cache file path for root directory"""
-        # Use hash of path for cache filename
+    def _get_cache_path(
+        self,
+        root_path: Path,
+        exclude_dirs: Optional[Set[str]] = None,
+        max_depth: Optional[int] = None
+    ) -> Path:
+        """Get cache file path for root directory and walk options"""
+        # Use hash of path for cache filename; walk options get their own
+        # hash so indexes built with other exclusions or depth don't mix
         path_hash = hashlib.md5(str(root_path).encode()).hexdigest()
-        return self.cache_dir / f'index_{path_hash}.pkl'
+        options = repr((sorted(exclude_dirs or ()), max_depth))
+        options_hash = hashlib.md5(options.encode()).hexdigest()[:8]
+        return self.cache_dir / f'index_{path_hash}_{options_hash}.pkl'
 
-    def _save_index_cache(self, root_path: Path, index: SearchIndex) -> None:
-        """Save index to cache"""
+    def _save_index_cache(self, cache_path: Path, index: SearchIndex) -> None:
+        """Save index to cache as one compressed pickle blob"""
         try:
-            cache_path = self._get_cache_path(root_path)
-            with open(cache_path, 'wb') as f:
-                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            data = zlib.compress(
+                pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL),
+                _CACHE_COMPRESSION_LEVEL
+            )
+            temp_path = cache_path.with_suffix('.tmp')
+            temp_path.write_bytes(data)
+            os.replace(temp_path, cache_path)
         except Exception as e:
             print(f"Warning: Failed to cache index: {e}")
 
-    def _load_cached_index(self, root_path: Path) -> Optional[SearchIndex]:
+    def _load_cached_index(self, cache_path: Path) -> Optional[SearchIndex]:
         """Load index from cache"""
         try:
-            cache_path = self._get_cache_path(root_path)
             if not cache_path.exists():
                 return None
 
-            with open(cache_path, 'rb') as f:
-                index = pickle.load(f)
+            index = pickle.loads(zlib.decompress(cache_path.read_bytes()))
+            if not isinstance(index, SearchIndex):
+                return None
 
             return index
         except Exception as e:
@@ -427,14 +822,24 @@ class FileIndexer:
         """
         Check if cached index is still valid
 
-        Uses sampling approach: check a few files to detect changes
+        Files added, removed or renamed anywhere in the tree change their
+        directory's mtime, so every walked directory is checked; edits to
+        existing files don't, so a sample of files is checked as well
         """
-        if not index.indexed_at or index.file_count == 0:
+        if not index.indexed_at or index.file_count == 0 or not index.dir_mtimes:
             return False
 
+        for dir_path, mtime_ns in index.dir_mtimes.items():
+            try:
+                if os.stat(dir_path).st_mtime_ns != mtime_ns:
+                    return False
+            except (OSError, PermissionError):
+                return False
+
         # Sample 10% of files (max 100) to validate
         sample_size = min(100, max(10, index.file_count // 10))
-        sample_indices = range(0, len(index.entries), len(index.entries) // sample_size)
+        step = max(1, len(index.entries) // sample_size)
+        sample_indices = range(0, len(index.entries), step)
 
         for idx in sample_indices:
             entry = index.entries[idx]
@@ -456,10 +861,12 @@ class FileIndexer:
     def clear_cache(self, root_path: Optional[Path] = None) -> None:
         """Clear index cache"""
         if root_path:
-            cache_path = self._get_cache_path(Path(root_path).resolve())
-            cache_path.unlink(missing_ok=True)
+            root_path = Path(root_path).resolve()
+            path_hash = hashlib.md5(str(root_path).encode()).hexdigest()
+            for cache_file in self.cache_dir.glob(f'index_{path_hash}_*.pkl'):
+                cache_file.unlink(missing_ok=True)
             with self._lock:
-                self._indices.pop(Path(root_path).resolve(), None)
+                self._indices.pop(root_path, None)
         else:
             # Clear all caches
             for cache_file in self.cache_dir.glob('index_*.pkl'):
@@ -7,6 +7,7 @@ Manages theme loading, validation, and CSS generation for Textual applications.
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict, field
@@ -88,6 +89,17 @@ class ThemeMetadata:
         )
 
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+_KEYWORD_COLORS = frozenset(['transparent', 'inherit', 'currentcolor'])
+
+# Textual color names accepted in theme files
+_NAMED_COLORS = frozenset([
+    'black', 'white', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan',
+    'gray', 'grey', 'darkgray', 'darkgrey', 'lightgray', 'lightgrey'
+])
+
+
 @dataclass
 class Theme:
     """
@@ -124,6 +136,11 @@ class Theme:
     selection_text: str
     metadata: Optional[ThemeMetadata] = None
 
+    COLOR_FIELDS = (
+        'primary', 'accent', 'surface', 'panel', 'text', 'text_muted',
+        'warning', 'error', 'success', 'selection', 'selection_text'
+    )
+
     def to_css_variables(self) -> str:
         """
         Generate CSS variable declarations for this theme.
@@ -232,12 +249,7 @@ class Theme:
         issues = []
 
         # Check all color fields are defined
-        required_fields = [
-            'primary', 'accent', 'surface', 'panel', 'text', 'text_muted',
-            'warning', 'error', 'success', 'selection', 'selection_text'
-        ]
-
-        for field in required_fields:
+        for field in self.COLOR_FIELDS:
             value = getattr(self, field, None)
             if not value:
                 issues.append(f"Missing required color field: {field}")
@@ -261,32 +273,16 @@ class Theme:
             return False
 
         # Support hex colors (#RGB, #RRGGBB, #RRGGBBAA)
-        if color.startswith('#'):
-            hex_part = color[1:]
-            if len(hex_part) in (3, 6, 8):
-                try:
-                    int(hex_part, 16)
-                    return True
-                except ValueError:
-                    pass
-
-        # Support named colors and rgb/rgba
-        if color.lower() in ['transparent', 'inherit', 'currentcolor']:
-            return True
+        if color[0] == '#':
+            return len(color) in (4, 7, 9) and _HEX_DIGITS.issuperset(color[1:])
 
+        # Support rgb/rgba/hsl/hsla functions
         if color.startswith(('rgb(', 'rgba(', 'hsl(', 'hsla(')):
             return True
 
-        # Support Textual color names
-        textual_colors = [
-            'black', 'white', 'red', 'green', 'blue', 'yellow', 'magenta', 'cyan',
-            'gray', 'grey', 'darkgray', 'darkgrey', 'lightgray', 'lightgrey'
-        ]
-
-        if color.lower() in textual_colors:
-            return True
-
-        return False
+        # Support keywords and Textual color names
+        lowered = color.lower()
+        return lowered in _KEYWORD_COLORS or lowered in _NAMED_COLORS
 
 
 class ThemeManager:
@@ -329,6 +325,10 @@ class ThemeManager:
         # Cache loaded themes
         self._themes_cache: Dict[str, Theme] = {}
 
+        # Theme names found in themes_dir, rescanned when its mtime changes
+        self._theme_names: List[str] = []
+        self._themes_dir_mtime: Optional[int] = None
+
         # Current active theme
         self._current_theme: Optional[Theme] = None
 
@@ -548,6 +548,7 @@ class ThemeManager:
 
             # Update cache
             self._themes_cache[slot] = theme
+            self._invalidate_theme_names()
 
             logger.info(f"Saved custom theme to slot '{slot}'")
             return True
@@ -593,6 +594,7 @@ class ThemeManager:
             # Remove from cache
             if slot in self._themes_cache:
                 del self._themes_cache[slot]
+            self._invalidate_theme_names()
 
             logger.info(f"Deleted custom theme from slot '{slot}'")
             return True
@@ -630,17 +632,43 @@ class ThemeManager:
         """
         Get list of available theme names.
 
+        The directory is only rescanned when its modification time changes,
+        so repeated calls while cycling themes avoid filesystem listing.
+
         Returns:
             List of theme identifiers
         """
-        themes = []
+        try:
+            mtime = os.stat(self.themes_dir).st_mtime_ns
+        except OSError:
+            self._theme_names = []
+            self._themes_dir_mtime = None
+            return []
+
+        if mtime != self._themes_dir_mtime:
+            self._rescan_themes_dir()
+            self._themes_dir_mtime = mtime
+
+        return list(self._theme_names)
 
-        if self.themes_dir.exists():
-            for theme_file in self.themes_dir.glob("*.json"):
-                theme_name = theme_file.stem
-                themes.append(theme_name)
+    def _rescan_themes_dir(self) -> None:
+        """Rebuild theme name list and drop cached themes whose file is gone."""
+        names = []
 
-        return sorted(themes)
+        with os.scandir(self.themes_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    names.append(entry.name[:-len(".json")])
+
+        self._theme_names = sorted(names)
+
+        present = set(names)
+        for name in [n for n in self._themes_cache if n not in present]:
+            del self._themes_cache[name]
+
+    def _invalidate_theme_names(self) -> None:
+        """Force rescan on next get_available_themes() call."""
+        self._themes_dir_mtime = None
 
     def load_theme(self, theme_name: str) -> Optional[Theme]:
         """
@@ -747,6 +775,7 @@ class ThemeManager:
 
             # Update cache
             self._themes_cache[theme.name] = theme
+            self._invalidate_theme_names()
 
             logger.info(f"Saved theme '{theme.name}' successfully")
             return True
@@ -1045,11 +1074,16 @@ QuickViewWidget.visible {{
             )
         )
 
-        # Save themes if they don't exist
-        for theme in [norton, modern_dark, solarized, midnight_blue]:
-            theme_file = self.themes_dir / f"{theme.name}.json"
-            if not theme_file.exists():
-                self.save_theme(theme)
+        # Save themes if they don't exist (one directory listing, not a stat per theme)
+        existing = set(self.get_available_themes())
+        missing = [
+            theme for theme in [norton, modern_dark, solarized, midnight_blue]
+            if theme.name not in existing
+        ]
+        # save_theme updates the theme cache, so the few small files are
+        # written one at a time on this thread
+        for theme in missing:
+            if self.save_theme(theme):
                 logger.info(f"Created default theme: {theme.name}")
 
     def _is_valid_theme_id(self, theme_id: str) -> bool:
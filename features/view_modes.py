@@ -4,10 +4,24 @@ Provides different ways to display file information similar to Norton Commander.
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import List, Tuple, Any
 from pathlib import Path
 
 
+@lru_cache(maxsize=4096)
+def _format_mtime(year: int, month: int, day: int, hour: int, minute: int) -> Tuple[str, str]:
+    """Format a modification time as panel date and time cells.
+
+    Keyed by minute, the display resolution, so files written together
+    (archive extracts, build output) share one cached result.
+
+    Returns:
+        Tuple of (date, time) strings, e.g. ("24-03-15", "09:41")
+    """
+    return f"{year % 100:02d}-{month:02d}-{day:02d}", f"{hour:02d}:{minute:02d}"
+
+
 class ViewMode(Enum):
     """File panel view modes."""
     FULL = "full"          # Full details: Name, Size, Date, Time
@@ -103,8 +117,10 @@ class ViewModeConfig:
         size_display = ViewModeConfig._format_size(item.size) if not item.is_dir else "<DIR>"
 
         # Format date and time
-        date_display = item.modified.strftime("%y-%m-%d")
-        time_display = item.modified.strftime("%H:%M")
+        modified = item.modified
+        date_display, time_display = _format_mtime(
+            modified.year, modified.month, modified.day, modified.hour, modified.minute
+        )
 
         return [name_display, size_display, date_display, time_display]
 
@@ -1,16 +1,24 @@
 """File item data model for Modern Commander."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class FileItem:
-    """Represents a file or directory entry."""
+    """Represents a file or directory entry.
+
+    Slotted so large directory listings carry no per-item __dict__.
+    """
     name: str
     path: Path
     size: int
     modified: datetime
     is_dir: bool
     is_parent: bool = False
+    sort_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the case-insensitive name used when sorting."""
+        self.sort_name = self.name.lower()
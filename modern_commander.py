@@ -1155,6 +1155,10 @@ Escape - Clear selection
 
         self.push_screen(config_screen)
 
+    def on_unmount(self) -> None:
+        """Release background resources on exit."""
+        FilePanel.shutdown_prefetch()
+
     def action_quit_app(self) -> None:
         """F10 - Quit application."""
         def handle_confirm(confirmed: bool) -> None:
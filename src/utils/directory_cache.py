@@ -15,15 +15,21 @@ Usage:
     # Invalidate specific path
     cache.invalidate(path)
 
+    # Scan-resistant variant: only admit directories visited more often
+    # than the entry they would evict
+    cache = DirectoryCache(maxsize=100, ttl_seconds=60, admission_filter=True)
+
     # Clear entire cache
     cache.clear()
 """
 
+from array import array
 from pathlib import Path
 from typing import Optional, List, Callable, TypeVar, Generic
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from threading import Lock
+import os
 
 
 T = TypeVar('T')
@@ -31,30 +37,126 @@ T = TypeVar('T')
 
 @dataclass
 class CacheEntry(Generic[T]):
-    """Cache entry with timestamp."""
+    """Cache entry with timestamp.
+
+    mtime_ns records the directory's modification time when the listing
+    was loaded, so a later change to the directory can be detected.
+    """
     data: T
     timestamp: datetime
     path: Path
+    mtime_ns: Optional[int] = None
 
     def is_expired(self, ttl: timedelta) -> bool:
         """Check if entry is expired."""
         return datetime.now() - self.timestamp > ttl
 
 
+class FrequencySketch:
+    """
+    Approximate access counter used for TinyLFU admission.
+
+    A count-min sketch: every key increments one counter in each of four
+    rows and its frequency is the minimum of those counters. Counters are
+    halved periodically so that old popularity fades over time.
+    """
+
+    _SEEDS = (0x9E3779B9, 0x85EBCA6B, 0xC2B2AE35, 0x27D4EB2F)
+    _MAX_COUNT = 0xFFFF
+
+    def __init__(self, width: int = 1024):
+        """
+        Initialize frequency sketch.
+
+        Args:
+            width: Counters per row, rounded up to a power of two
+        """
+        width = max(16, 1 << (width - 1).bit_length())
+        self._mask = width - 1
+        self._rows = [array('I', bytes(4 * width)) for _ in self._SEEDS]
+        self._additions = 0
+        self._reset_at = width * 10
+
+    def _indexes(self, key: object) -> List[int]:
+        """Get the counter index of key in each row."""
+        h = hash(key)
+        return [hash((seed, h)) & self._mask for seed in self._SEEDS]
+
+    def increment(self, key: object) -> None:
+        """
+        Record one access to key.
+
+        Args:
+            key: Accessed key
+        """
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._reset_at:
+            self._age()
+
+    def frequency(self, key: object) -> int:
+        """
+        Estimate how often key has been accessed.
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            Estimated access count (never an underestimate before aging)
+        """
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def clear(self) -> None:
+        """Reset all counters."""
+        for row in self._rows:
+            for index in range(len(row)):
+                row[index] = 0
+        self._additions = 0
+
+    def _age(self) -> None:
+        """Halve all counters so stale popularity decays."""
+        for row in self._rows:
+            for index in range(len(row)):
+                row[index] >>= 1
+        self._additions //= 2
+
+
+def _dir_mtime_ns(path: Path) -> Optional[int]:
+    """Get directory modification time, or None if it cannot be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 class DirectoryCache(Generic[T]):
     """
     LRU cache with TTL for directory listings.
 
+    With admission_filter enabled the cache uses TinyLFU admission: when
+    full, a new directory is only stored if it has been requested more
+    often than the least recently used entry it would evict. A one-off
+    scan through many cold directories then cannot flush the hot ones.
+
     Thread-safe implementation using Lock.
     """
 
-    def __init__(self, maxsize: int = 100, ttl_seconds: int = 60):
+    def __init__(
+        self,
+        maxsize: int = 100,
+        ttl_seconds: int = 60,
+        admission_filter: bool = False
+    ):
         """
         Initialize directory cache.
 
         Args:
             maxsize: Maximum number of cached directories
             ttl_seconds: Time-to-live for cache entries in seconds
+            admission_filter: Use TinyLFU admission instead of plain LRU
         """
         self.maxsize = maxsize
         self.ttl = timedelta(seconds=ttl_seconds)
@@ -63,26 +165,38 @@ class DirectoryCache(Generic[T]):
         self._lock = Lock()
         self._hits = 0
         self._misses = 0
+        self._sketch: Optional[FrequencySketch] = (
+            FrequencySketch(max(1024, maxsize * 4)) if admission_filter else None
+        )
 
-    def get(self, path: Path) -> Optional[T]:
+    def get(self, path: Path, mtime_ns: Optional[int] = None) -> Optional[T]:
         """
         Get cached directory listing.
 
         Args:
             path: Directory path
+            mtime_ns: Current directory mtime; a cached entry recorded with
+                a different mtime is treated as stale
 
         Returns:
             Cached data if exists and not expired, None otherwise
         """
         with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(path)
+
             if path not in self._cache:
                 self._misses += 1
                 return None
 
             entry = self._cache[path]
 
-            # Check if expired
-            if entry.is_expired(self.ttl):
+            # Check if expired or modified since it was cached
+            if entry.is_expired(self.ttl) or (
+                mtime_ns is not None
+                and entry.mtime_ns is not None
+                and entry.mtime_ns != mtime_ns
+            ):
                 self._remove(path)
                 self._misses += 1
                 return None
@@ -94,13 +208,17 @@ class DirectoryCache(Generic[T]):
             self._hits += 1
             return entry.data
 
-    def put(self, path: Path, data: T) -> None:
+    def put(self, path: Path, data: T, mtime_ns: Optional[int] = None) -> bool:
         """
         Store directory listing in cache.
 
         Args:
             path: Directory path
             data: Directory listing data
+            mtime_ns: Directory mtime at the time data was loaded
+
+        Returns:
+            True if stored, False if rejected by the admission filter
         """
         with self._lock:
             # If already exists, update
@@ -108,18 +226,27 @@ class DirectoryCache(Generic[T]):
                 self._access_order.remove(path)
 
             # Evict least recently used if at capacity
-            if len(self._cache) >= self.maxsize:
-                lru_path = self._access_order.pop(0)
+            elif len(self._cache) >= self.maxsize:
+                lru_path = self._access_order[0]
+
+                # TinyLFU: keep the victim if it is at least as popular
+                if (self._sketch is not None and
+                        self._sketch.frequency(path) <= self._sketch.frequency(lru_path)):
+                    return False
+
+                self._access_order.pop(0)
                 del self._cache[lru_path]
 
             # Add new entry
             entry = CacheEntry(
                 data=data,
                 timestamp=datetime.now(),
-                path=path
+                path=path,
+                mtime_ns=mtime_ns
             )
             self._cache[path] = entry
             self._access_order.append(path)
+            return True
 
     def get_or_load(
         self,
@@ -129,6 +256,10 @@ class DirectoryCache(Generic[T]):
         """
         Get from cache or load fresh data.
 
+        The directory's mtime is checked on every call, so entries added,
+        removed or renamed since the listing was cached force a reload
+        without waiting for the TTL.
+
         Args:
             path: Directory path
             loader: Function to load data if not cached
@@ -136,15 +267,42 @@ class DirectoryCache(Generic[T]):
         Returns:
             Cached or freshly loaded data
         """
-        cached = self.get(path)
+        mtime_ns = _dir_mtime_ns(path)
+
+        cached = self.get(path, mtime_ns)
         if cached is not None:
             return cached
 
         # Load fresh data
         data = loader(path)
-        self.put(path, data)
+        self.put(path, data, mtime_ns)
         return data
 
+    def prefetch(self, path: Path, loader: Callable[[Path], T]) -> bool:
+        """
+        Load a directory into the cache ahead of an expected visit.
+
+        Unlike get_or_load, this does not count as a hit or miss and does
+        not record an access for the admission filter, so speculative
+        loads neither skew statistics nor displace popular entries.
+
+        Args:
+            path: Directory path
+            loader: Function to load data if not cached
+
+        Returns:
+            True if fresh data was loaded and stored
+        """
+        mtime_ns = _dir_mtime_ns(path)
+
+        with self._lock:
+            entry = self._cache.get(path)
+            if (entry is not None and not entry.is_expired(self.ttl)
+                    and (mtime_ns is None or entry.mtime_ns == mtime_ns)):
+                return False
+
+        return self.put(path, loader(path), mtime_ns)
+
     def invalidate(self, path: Path) -> bool:
         """
         Invalidate specific cache entry.
@@ -189,6 +347,8 @@ class DirectoryCache(Generic[T]):
             self._access_order.clear()
             self._hits = 0
             self._misses = 0
+            if self._sketch is not None:
+                self._sketch.clear()
 
     def _remove(self, path: Path) -> None:
         """Remove entry (must be called with lock held)."""
@@ -211,10 +371,14 @@ class DirectoryCache(Generic[T]):
             Hit rate as percentage (0-100)
         """
         with self._lock:
-            total = self._hits + self._misses
-            if total == 0:
-                return 0.0
-            return (self._hits / total) * 100.0
+            return self._hit_rate()
+
+    def _hit_rate(self) -> float:
+        """Calculate hit rate (must be called with lock held)."""
+        total = self._hits + self._misses
+        if total == 0:
+            return 0.0
+        return (self._hits / total) * 100.0
 
     def get_stats(self) -> dict:
         """
@@ -229,7 +393,7 @@ class DirectoryCache(Generic[T]):
                 "maxsize": self.maxsize,
                 "hits": self._hits,
                 "misses": self._misses,
-                "hit_rate": self.hit_rate,
+                "hit_rate": self._hit_rate(),
                 "ttl_seconds": self.ttl.total_seconds()
             }
 
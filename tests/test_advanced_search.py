@@ -71,6 +71,19 @@ class TestAdvancedFileSearch(unittest.TestCase):
         self.assertIn('test1.txt', result_names)
         self.assertIn('test2.txt', result_names)
 
+    def test_indexed_results_use_index_metadata(self):
+        """Test indexed results take size and mtime from the index"""
+        results = self.searcher.search_files(
+            self.root,
+            'test*.txt',
+            AdvancedSearchOptions(use_index=True)
+        )
+
+        for result in results:
+            stat = result.path.stat()
+            self.assertEqual(result.file_size, stat.st_size)
+            self.assertAlmostEqual(result.modified_time.timestamp(), stat.st_mtime, places=5)
+
     def test_prefix_search(self):
         """Test prefix search optimization"""
         results = self.searcher.search_files(
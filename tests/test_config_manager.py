@@ -9,6 +9,7 @@ import tempfile
 import json
 import os
 from pathlib import Path
+from unittest import mock
 import sys
 
 # Add parent directory to path
@@ -213,6 +214,26 @@ class TestConfigManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertTrue(os.path.exists(nested_path))
 
+    def test_save_replaces_file_atomically(self):
+        """Test that save leaves no temp file and overwrites existing config"""
+        config = self.config_mgr.load_config()
+        config.editor.tab_size = 2
+        self.assertTrue(self.config_mgr.save_config())
+
+        self.assertFalse(os.path.exists(self.config_path + ".tmp"))
+        with open(self.config_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["editor"]["tab_size"], 2)
+
+
+    def test_failed_save_removes_temp_file(self):
+        """Test a failed save doesn't leave the temp file behind"""
+        self.config_mgr.load_config()
+
+        with mock.patch("features.config_manager.os.replace", side_effect=OSError("disk full")):
+            self.assertFalse(self.config_mgr.save_config())
+
+        self.assertFalse(os.path.exists(self.config_path + ".tmp"))
+
 
 class TestConfigDataClasses(unittest.TestCase):
     """Test configuration dataclasses"""
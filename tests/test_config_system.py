@@ -394,6 +394,21 @@ class TestThemeManager:
         assert (themes_dir / "modern_dark.json").exists()
         assert (themes_dir / "solarized.json").exists()
 
+    def test_theme_manager_create_defaults_keeps_existing(self, tmp_path):
+        """Test default themes do not overwrite an existing theme file."""
+        themes_dir = tmp_path / "themes"
+        manager = ThemeManager(themes_dir)
+        manager.create_default_themes()
+
+        existing = themes_dir / "solarized.json"
+        existing.write_text("{}")
+        (themes_dir / "modern_dark.json").unlink()
+
+        manager.create_default_themes()
+
+        assert existing.read_text() == "{}"
+        assert (themes_dir / "modern_dark.json").exists()
+
     def test_theme_manager_load_theme(self, tmp_path):
         """Test loading a theme."""
         themes_dir = tmp_path / "themes"
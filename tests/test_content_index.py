@@ -0,0 +1,185 @@
+"""
+Unit tests for the content trigram index
+
+Tests cover:
+- Bloom filter membership
+- Rebuilding filters for modified files
+- Persistence across instances
+- Skipping files during literal content search
+"""
+
+import os
+import pickle
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+from features.content_index import ContentIndex, build_filter, filter_may_contain
+from features.search_engine import FileSearch, SearchOptions
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Test trigram bloom filter functions"""
+
+    def test_contained_substrings_always_match(self):
+        """Test every substring of the data passes the filter"""
+        data = b'def search_content(self, root_path, pattern):'
+        bits, num_bits = build_filter(data)
+
+        for start in range(len(data) - 3):
+            for end in range(start + 3, min(len(data), start + 12) + 1):
+                self.assertTrue(filter_may_contain(bits, num_bits, data[start:end]))
+
+    def test_absent_needle_rejected(self):
+        """Test a needle sharing no trigrams with the data is rejected"""
+        bits, num_bits = build_filter(b'hello world')
+
+        self.assertFalse(filter_may_contain(bits, num_bits, b'zzqqxx'))
+
+
+class TestContentIndex(unittest.TestCase):
+    """Test ContentIndex persistence and invalidation"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir)
+        self.index_path = self.root / 'index' / 'content.idx'
+        self.file = self.root / 'a.txt'
+        self.file.write_text('alpha beta gamma')
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_modified_file_rebuilt(self):
+        """Test a changed file gets a fresh filter"""
+        index = ContentIndex(self.index_path)
+        self.assertFalse(index.may_contain(self.file, self.file.stat(), b'delta'))
+
+        self.file.write_text('alpha beta gamma delta')
+        os.utime(self.file, ns=(0, 10**9))
+
+        self.assertTrue(index.may_contain(self.file, self.file.stat(), b'delta'))
+
+    def test_saved_index_reloaded(self):
+        """Test filters survive a save and reload without rereading files"""
+        index = ContentIndex(self.index_path)
+        index.may_contain(self.file, self.file.stat(), b'beta')
+        index.save()
+
+        reloaded = ContentIndex(self.index_path)
+        self.assertEqual(len(reloaded), 1)
+
+        with mock.patch.object(Path, 'read_bytes') as read_bytes:
+            self.assertTrue(reloaded.may_contain(self.file, self.file.stat(), b'beta'))
+        read_bytes.assert_not_called()
+
+    def test_foreign_pickle_ignored(self):
+        """Test a saved index holding arbitrary objects is not loaded"""
+        self.index_path.parent.mkdir()
+        self.index_path.write_bytes(pickle.dumps({str(self.file): self.file}))
+
+        index = ContentIndex(self.index_path)
+        self.assertEqual(len(index), 0)
+
+    def test_large_file_not_indexed(self):
+        """Test files over the size limit are never read for a filter"""
+        index = ContentIndex(self.index_path)
+        file_stat = mock.Mock(st_size=11 * 1024 * 1024, st_mtime_ns=0)
+
+        with mock.patch.object(Path, 'read_bytes') as read_bytes:
+            self.assertTrue(index.may_contain(self.file, file_stat, b'delta'))
+        read_bytes.assert_not_called()
+        self.assertEqual(len(index), 0)
+
+    def test_prune_keeps_unvisited_existing_files(self):
+        """Test pruning only drops filters of files that are gone"""
+        index = ContentIndex(self.index_path)
+        index.may_contain(self.file, self.file.stat(), b'beta')
+        index.save()
+
+        reloaded = ContentIndex(self.index_path)
+        self.assertEqual(reloaded.prune(self.root), 0)
+
+        self.file.unlink()
+        self.assertEqual(reloaded.prune(self.root), 1)
+        self.assertEqual(len(reloaded), 0)
+
+    def test_corrupt_index_ignored(self):
+        """Test an unreadable index file starts an empty index"""
+        self.index_path.parent.mkdir()
+        self.index_path.write_bytes(b'not a pickle')
+
+        index = ContentIndex(self.index_path)
+        self.assertEqual(len(index), 0)
+
+
+class TestIndexedContentSearch(unittest.TestCase):
+    """Test FileSearch with a content index"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir) / 'tree'
+        self.root.mkdir()
+        self.index_path = Path(self.temp_dir) / 'content.idx'
+
+        (self.root / 'match.txt').write_text('needle in a haystack')
+        for i in range(5):
+            (self.root / f'other{i}.txt').write_text(f'nothing to see {i}')
+
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_index_skips_files_without_literal(self):
+        """Test only files that may contain the literal are searched"""
+        searcher = FileSearch(index_path=self.index_path)
+        options = SearchOptions(case_sensitive=True)
+
+        with mock.patch.object(
+            FileSearch, '_search_file_content', autospec=True,
+            side_effect=FileSearch._search_file_content
+        ) as search_file:
+            results = list(searcher.search_content(self.root, 'needle', options))
+
+        self.assertEqual([r.path.name for r in results], ['match.txt'])
+        self.assertEqual(search_file.call_count, 1)
+        self.assertTrue(self.index_path.exists())
+
+    def test_deleted_files_pruned_and_unchanged_index_not_rewritten(self):
+        """Test filters of removed files are dropped and clean indexes kept"""
+        searcher = FileSearch(index_path=self.index_path)
+        options = SearchOptions(case_sensitive=True)
+        list(searcher.search_content(self.root, 'needle', options))
+        self.assertEqual(len(searcher.content_index), 6)
+
+        os.utime(self.index_path, ns=(0, 0))
+        list(searcher.search_content(self.root, 'needle', options))
+        self.assertEqual(self.index_path.stat().st_mtime_ns, 0)
+
+        (self.root / 'other0.txt').rename(self.root / 'renamed.txt')
+        (self.root / 'other1.txt').unlink()
+        list(searcher.search_content(self.root, 'needle', options))
+
+        reloaded = ContentIndex(self.index_path)
+        self.assertEqual(len(reloaded), 5)
+        self.assertNotEqual(self.index_path.stat().st_mtime_ns, 0)
+
+    def test_binary_files_not_indexed(self):
+        """Test binary files are skipped before the index reads them"""
+        (self.root / 'blob.dat').write_bytes(b'\x00needle' * 100)
+        searcher = FileSearch(index_path=self.index_path)
+
+        list(searcher.search_content(
+            self.root, 'needle', SearchOptions(case_sensitive=True)
+        ))
+
+        self.assertEqual(len(searcher.content_index), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,12 +4,13 @@ Tests LRU caching with TTL for directory listings including
 cache operations, expiration, threading, and statistics.
 """
 
+import os
 import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
 from time import sleep
 from threading import Thread
-from src.utils.directory_cache import DirectoryCache, CacheEntry
+from src.utils.directory_cache import DirectoryCache, CacheEntry, FrequencySketch
 
 
 class TestCacheEntry:
@@ -439,6 +440,153 @@ class TestCacheInvalidation:
         assert cache.get(path2) is None
 
 
+class TestModificationInvalidation:
+    """Test automatic invalidation when a directory changes."""
+
+    def test_get_or_load_reloads_modified_directory(self, tmp_path):
+        """Test get_or_load reloads after the directory mtime changes."""
+        cache = DirectoryCache()
+        calls = []
+
+        def loader(path):
+            calls.append(path)
+            return [f"load{len(calls)}"]
+
+        assert cache.get_or_load(tmp_path, loader) == ["load1"]
+        assert cache.get_or_load(tmp_path, loader) == ["load1"]
+
+        # Simulate an entry being added to the directory
+        st = tmp_path.stat()
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert cache.get_or_load(tmp_path, loader) == ["load2"]
+        assert len(calls) == 2
+
+    def test_get_without_mtime_ignores_modification(self, tmp_path):
+        """Test plain get does not validate against mtime."""
+        cache = DirectoryCache()
+
+        cache.put(tmp_path, ["data"], mtime_ns=1)
+
+        assert cache.get(tmp_path) == ["data"]
+        assert cache.get(tmp_path, mtime_ns=2) is None
+
+
+class TestAdmissionFilter:
+    """Test TinyLFU admission policy."""
+
+    def test_cold_entry_rejected_when_full(self, tmp_path):
+        """Test a one-off directory does not evict a popular one."""
+        cache = DirectoryCache(maxsize=1, admission_filter=True)
+        hot = tmp_path / "hot"
+        cold = tmp_path / "cold"
+
+        cache.put(hot, ["hot"])
+        for _ in range(3):
+            cache.get(hot)
+
+        cache.get(cold)  # Miss, recorded once
+        assert cache.put(cold, ["cold"]) is False
+
+        assert cache.get(hot) == ["hot"]
+        assert cache.size == 1
+
+    def test_frequent_entry_admitted_when_full(self, tmp_path):
+        """Test a directory requested more often replaces the victim."""
+        cache = DirectoryCache(maxsize=1, admission_filter=True)
+        old = tmp_path / "old"
+        new = tmp_path / "new"
+
+        cache.put(old, ["old"])
+        for _ in range(3):
+            cache.get(new)
+
+        assert cache.put(new, ["new"]) is True
+        assert cache.get(new) == ["new"]
+        assert cache.get(old) is None
+
+    def test_update_existing_entry_never_rejected(self, tmp_path):
+        """Test overwriting a cached path bypasses admission."""
+        cache = DirectoryCache(maxsize=1, admission_filter=True)
+
+        cache.put(tmp_path, ["old"])
+        assert cache.put(tmp_path, ["new"]) is True
+        assert cache.get(tmp_path) == ["new"]
+
+
+class TestPrefetch:
+    """Test speculative cache loading."""
+
+    def test_prefetch_loads_without_touching_stats(self, tmp_path):
+        """Test prefetch stores data without counting hits or misses."""
+        cache = DirectoryCache()
+
+        assert cache.prefetch(tmp_path, lambda p: ["data"]) is True
+        assert cache.get_stats()["hits"] == 0
+        assert cache.get_stats()["misses"] == 0
+
+        assert cache.get_or_load(tmp_path, lambda p: ["fresh"]) == ["data"]
+
+    def test_prefetch_skips_fresh_entry(self, tmp_path):
+        """Test prefetch does not reload an up-to-date entry."""
+        cache = DirectoryCache()
+        calls = []
+
+        def loader(path):
+            calls.append(path)
+            return ["data"]
+
+        cache.prefetch(tmp_path, loader)
+        assert cache.prefetch(tmp_path, loader) is False
+        assert len(calls) == 1
+
+    def test_prefetch_rejected_by_admission_filter(self, tmp_path):
+        """Test speculative loads cannot evict a popular entry."""
+        cache = DirectoryCache(maxsize=1, admission_filter=True)
+        hot = tmp_path / "hot"
+        hot.mkdir()
+
+        cache.put(hot, ["hot"])
+        cache.get(hot)
+
+        assert cache.prefetch(tmp_path, lambda p: ["cold"]) is False
+        assert cache.get(hot) == ["hot"]
+
+
+class TestFrequencySketch:
+    """Test count-min frequency sketch."""
+
+    def test_increment_and_frequency(self):
+        """Test frequency counts increments."""
+        sketch = FrequencySketch(width=64)
+
+        for _ in range(5):
+            sketch.increment("a")
+        sketch.increment("b")
+
+        assert sketch.frequency("a") >= 5
+        assert sketch.frequency("b") >= 1
+        assert sketch.frequency("a") > sketch.frequency("b")
+
+    def test_aging_halves_counters(self):
+        """Test counters decay after the sample period."""
+        sketch = FrequencySketch(width=16)
+
+        for _ in range(160):
+            sketch.increment("a")
+
+        assert sketch.frequency("a") <= 80
+
+    def test_clear(self):
+        """Test clear resets counters."""
+        sketch = FrequencySketch()
+        sketch.increment("a")
+
+        sketch.clear()
+
+        assert sketch.frequency("a") == 0
+
+
 class TestCacheStatistics:
     """Test cache statistics and metrics."""
 
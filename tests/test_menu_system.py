@@ -83,6 +83,16 @@ class TestMenuCategory:
         assert category.title == "Empty"
         assert len(category.actions) == 0
 
+    def test_menu_category_empty_navigation(self):
+        """Test navigating an empty category is a no-op."""
+        category = MenuCategory(title="Empty", actions=[])
+
+        category.select_next()
+        category.select_previous()
+
+        assert category.selected_index == 0
+        assert category.get_selected_action() is None
+
     def test_menu_category_select_next(self):
         """Test selecting next item in category."""
         actions = [
@@ -4,11 +4,13 @@ Comprehensive Test Suite for Plugin System
 Tests plugin loading, lifecycle, security, and integration.
 """
 
+import logging
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock
 import tempfile
 import shutil
+import types
 
 from src.plugins.plugin_interface import PluginInterface, PluginMetadata
 from src.plugins.action_registry import ActionRegistry, ActionInfo
@@ -16,6 +18,35 @@ from src.plugins.plugin_loader import PluginLoader, PluginLoadError
 from src.plugins.plugin_manager import PluginManager, PluginState
 
 
+# Shared metadata for tests that only need *some* valid plugin metadata.
+# Tests asserting specific field values construct their own instances.
+_VALID_META = PluginMetadata(
+    name="test",
+    version="1.0.0",
+    author="test",
+    description="test"
+)
+
+
+# Safe plugin source, compiled once so in-memory tests skip the parser.
+_SAFE_PLUGIN_SRC = """
+from src.plugins.plugin_interface import PluginInterface, PluginMetadata
+
+class TestPlugin(PluginInterface):
+    @property
+    def metadata(self):
+        return PluginMetadata(name="test", version="1.0", author="test", description="test")
+
+    def initialize(self, app):
+        pass
+
+    def shutdown(self):
+        pass
+"""
+
+_SAFE_PLUGIN_CODE = compile(_SAFE_PLUGIN_SRC, "<safe_plugin>", "exec")
+
+
 # Test fixtures
 
 @pytest.fixture
@@ -76,6 +107,18 @@ def create_test_plugin(
     return plugin_file
 
 
+def make_safe_plugin_module() -> types.ModuleType:
+    """
+    Create a fresh module namespace holding the safe test plugin.
+
+    Returns:
+        Module executed from the precompiled safe plugin code
+    """
+    module = types.ModuleType("safe_plugin")
+    exec(_SAFE_PLUGIN_CODE, module.__dict__)
+    return module
+
+
 # Test PluginMetadata
 
 class TestPluginMetadata:
@@ -213,7 +256,7 @@ class TestActionRegistry:
 
         all_actions = action_registry.list_actions()
         assert len(all_actions) == 3
-        assert set(all_actions) == {"action1", "action2", "action3"}
+        assert sorted(all_actions) == ["action1", "action2", "action3"]
 
     def test_list_actions_by_plugin(self, action_registry):
         """Test listing actions filtered by plugin."""
@@ -223,7 +266,7 @@ class TestActionRegistry:
 
         plugin1_actions = action_registry.list_actions("plugin1")
         assert len(plugin1_actions) == 2
-        assert set(plugin1_actions) == {"action1", "action3"}
+        assert sorted(plugin1_actions) == ["action1", "action3"]
 
     def test_register_command_mapping(self, action_registry):
         """Test registering command mapping."""
@@ -304,12 +347,16 @@ class TestActionRegistry:
         result = action_registry.execute_action("nonexistent")
         assert result is False
 
-    def test_execute_action_handler_error(self, action_registry):
+    def test_execute_action_handler_error(self, action_registry, caplog):
         """Test executing action that raises exception."""
-        handler = Mock(side_effect=Exception("Handler error"))
+        def handler():
+            raise Exception("Handler error")
+
         action_registry.register_action("test_action", handler, "test_plugin")
 
-        result = action_registry.execute_action("test_action")
+        # The expected error log is noise here; keep it from being formatted
+        with caplog.at_level(logging.CRITICAL, logger="src.plugins.action_registry"):
+            result = action_registry.execute_action("test_action")
 
         assert result is False
 
@@ -326,10 +373,9 @@ class TestPluginLoader:
 
     def test_discover_plugins_with_files(self, temp_plugins_dir, plugin_loader):
         """Test discovering plugin files."""
-        create_test_plugin(temp_plugins_dir, "plugin1.py", "# Test plugin 1")
-        create_test_plugin(temp_plugins_dir, "plugin2.py", "# Test plugin 2")
-        create_test_plugin(temp_plugins_dir, "_hidden.py", "# Hidden")
-        create_test_plugin(temp_plugins_dir, "__init__.py", "# Init")
+        # Discovery only filters on name and size, so empty files suffice
+        for filename in ("plugin1.py", "plugin2.py", "_hidden.py", "__init__.py"):
+            (temp_plugins_dir / filename).touch()
 
         plugins = plugin_loader.discover_plugins()
 
@@ -348,44 +394,37 @@ class TestPluginLoader:
 
     def test_validate_plugin_security_safe_plugin(self, temp_plugins_dir, plugin_loader):
         """Test security validation for safe plugin."""
-        safe_code = """
-from src.plugins.plugin_interface import PluginInterface, PluginMetadata
-
-class TestPlugin(PluginInterface):
-    @property
-    def metadata(self):
-        return PluginMetadata(name="test", version="1.0", author="test", description="test")
-
-    def initialize(self, app):
-        pass
-
-    def shutdown(self):
-        pass
-"""
-        plugin_file = create_test_plugin(temp_plugins_dir, "safe.py", safe_code)
+        plugin_file = create_test_plugin(temp_plugins_dir, "safe.py", _SAFE_PLUGIN_SRC)
 
         result = plugin_loader.validate_plugin_security(plugin_file)
         assert result is True
 
-    def test_validate_plugin_security_dangerous_import(self, temp_plugins_dir, plugin_loader):
-        """Test security validation rejects dangerous imports."""
-        dangerous_code = """
-import subprocess
-class BadPlugin:
-    pass
-"""
-        plugin_file = create_test_plugin(temp_plugins_dir, "bad.py", dangerous_code)
-
-        result = plugin_loader.validate_plugin_security(plugin_file)
-        assert result is False
-
-    def test_validate_plugin_security_eval_pattern(self, temp_plugins_dir, plugin_loader):
-        """Test security validation rejects eval pattern."""
-        dangerous_code = """
-class BadPlugin:
-    def do_something(self):
-        eval("malicious code")
-"""
+    @pytest.mark.parametrize("dangerous_code", [
+        pytest.param(
+            "import subprocess\nclass BadPlugin:\n    pass\n",
+            id="dangerous_import",
+        ),
+        pytest.param(
+            "class BadPlugin:\n    def do_something(self):\n        eval(\"malicious code\")\n",
+            id="eval_pattern",
+        ),
+        pytest.param(
+            "class BadPlugin:\n    def do_something(self):\n        exec(\"malicious code\")\n",
+            id="exec_pattern",
+        ),
+        pytest.param(
+            "import os\nclass BadPlugin:\n    def do_something(self):\n        os.system(\"ls\")\n",
+            id="os_system",
+        ),
+        pytest.param(
+            "class BadPlugin:\n    def do_something(self):\n        __import__(\"os\")\n",
+            id="dunder_import",
+        ),
+    ])
+    def test_validate_plugin_security_rejects_dangerous_code(
+        self, temp_plugins_dir, plugin_loader, dangerous_code
+    ):
+        """Test security validation rejects dangerous imports and patterns."""
         plugin_file = create_test_plugin(temp_plugins_dir, "bad.py", dangerous_code)
 
         result = plugin_loader.validate_plugin_security(plugin_file)
@@ -414,7 +453,7 @@ test_value = "loaded"
 
         assert module1 is module2
 
-    def test_find_plugin_class_success(self, plugin_loader):
+    def test_find_plugin_class_success(self, plugin_loader, monkeypatch):
         """Test finding plugin class in module."""
         # Create mock module
         module = Mock()
@@ -422,7 +461,7 @@ test_value = "loaded"
         class TestPlugin(PluginInterface):
             @property
             def metadata(self):
-                return PluginMetadata(name="test", version="1.0", author="test", description="test")
+                return _VALID_META
 
             def initialize(self, app):
                 pass
@@ -433,21 +472,32 @@ test_value = "loaded"
         # Add class to module
         module.TestPlugin = TestPlugin
 
-        # Mock inspect.getmembers
-        with patch('inspect.getmembers', return_value=[("TestPlugin", TestPlugin)]):
-            plugin_class = plugin_loader.find_plugin_class(module)
+        # Stub inspect.getmembers
+        monkeypatch.setattr(
+            "inspect.getmembers",
+            lambda obj, predicate=None: [("TestPlugin", TestPlugin)]
+        )
+        plugin_class = plugin_loader.find_plugin_class(module)
 
         assert plugin_class == TestPlugin
 
-    def test_find_plugin_class_not_found(self, plugin_loader):
+    def test_find_plugin_class_not_found(self, plugin_loader, monkeypatch):
         """Test finding plugin class when none exists."""
         module = Mock()
 
-        with patch('inspect.getmembers', return_value=[]):
-            plugin_class = plugin_loader.find_plugin_class(module)
+        monkeypatch.setattr("inspect.getmembers", lambda obj, predicate=None: [])
+        plugin_class = plugin_loader.find_plugin_class(module)
 
         assert plugin_class is None
 
+    def test_find_plugin_class_in_module(self, plugin_loader):
+        """Test finding plugin class in a real module namespace."""
+        module = make_safe_plugin_module()
+
+        plugin_class = plugin_loader.find_plugin_class(module)
+
+        assert plugin_class is module.TestPlugin
+
     def test_validate_dependencies_satisfied(self, plugin_loader):
         """Test dependency validation when all satisfied."""
         # Create mock plugins
@@ -570,7 +620,7 @@ class TestPluginManager:
         class TestPlugin(PluginInterface):
             @property
             def metadata(self):
-                return PluginMetadata(name="test", version="1.0", author="test", description="test")
+                return _VALID_META
 
             def initialize(self, app):
                 pass
@@ -594,7 +644,7 @@ class TestPluginManager:
         class TestPlugin(PluginInterface):
             @property
             def metadata(self):
-                return PluginMetadata(name="test", version="1.0.0", author="test", description="test")
+                return _VALID_META
 
             def initialize(self, app):
                 pass
@@ -647,6 +697,7 @@ class TestPluginManager:
 
 # Integration tests
 
+@pytest.mark.integration
 class TestPluginIntegration:
     """Integration tests for plugin system."""
 
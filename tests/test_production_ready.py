@@ -179,6 +179,64 @@ class TestFilePanelCore:
             assert 'size' in stats
             assert 'maxsize' in stats
 
+    def test_file_panel_cached_resolve_follows_symlinks(self, tmp_path):
+        """Test path resolution fast path still resolves symlinked entries."""
+        FilePanel.clear_cache()
+        real = tmp_path / "real"
+        real.mkdir()
+        plain = tmp_path / "plain"
+        plain.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(real)
+
+        base = FilePanel._cached_resolve(tmp_path)
+
+        assert FilePanel._cached_resolve(base / "plain") == plain.resolve()
+        assert FilePanel._cached_resolve(base / "link") == real.resolve()
+        assert FilePanel._cached_resolve(base.parent) == tmp_path.resolve().parent
+
+    def test_file_panel_prefetch_pool_started_on_demand(self):
+        """Test the prefetch pool is created on first use and can be stopped."""
+        FilePanel.shutdown_prefetch()
+        assert FilePanel._prefetch_pool is None
+
+        pool = FilePanel._get_prefetch_pool()
+        assert FilePanel._get_prefetch_pool() is pool
+
+        FilePanel.shutdown_prefetch()
+        assert FilePanel._prefetch_pool is None
+
+    def test_file_panel_resolve_cache_bounded(self, tmp_path):
+        """Test resolved paths are evicted past the cache size."""
+        FilePanel.clear_cache()
+        base = FilePanel._cached_resolve(tmp_path)
+
+        for i in range(FilePanel.RESOLVE_CACHE_SIZE + 50):
+            FilePanel._cached_resolve(base / f"dir{i}")
+
+        assert len(FilePanel._resolve_cache) == FilePanel.RESOLVE_CACHE_SIZE
+
+    def test_file_panel_navigate_follows_repointed_symlink(self, tmp_path):
+        """Test navigation re-resolves a symlink whose old target is gone."""
+        FilePanel.clear_cache()
+        old = tmp_path / "old"
+        old.mkdir()
+        new = tmp_path / "new"
+        new.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(old)
+        panel = FilePanel(path=tmp_path)
+
+        with patch.object(FilePanel, "clear_selection"):
+            panel.navigate_to(link)
+            assert panel.current_path == old.resolve()
+
+            old.rmdir()
+            link.unlink()
+            link.symlink_to(new)
+            panel.navigate_to(link)
+            assert panel.current_path == new.resolve()
+
 
 class TestMenuSystem:
     """Test menu system functionality."""
@@ -617,6 +675,19 @@ class TestGroupSelection:
         assert len(matches) == 2
         assert all(item.name.endswith('.txt') for item in matches)
 
+    def test_group_selector_select_matching_case(self, tmp_path):
+        """Test pattern case sensitivity."""
+        selector = GroupSelector()
+
+        items = [
+            FileItem("FILE1.TXT", tmp_path / "FILE1.TXT", 100, datetime.now(), False),
+            FileItem("file2.txt", tmp_path / "file2.txt", 100, datetime.now(), False),
+        ]
+
+        assert len(selector.select_matching(items, "*.txt")) == 2
+        matches = selector.select_matching(items, "*.txt", case_sensitive=True)
+        assert [item.name for item in matches] == ["file2.txt"]
+
     def test_group_selector_deselect_matching(self, tmp_path):
         """Test deselecting files by pattern."""
         selector = GroupSelector()
@@ -655,6 +726,19 @@ class TestGroupSelection:
         assert len(new_selected) == 1
         assert str(items[2].path) in new_selected
 
+    def test_group_selector_invert_skips_parent_and_stale(self, tmp_path):
+        """Test inversion ignores the parent entry and paths no longer listed."""
+        selector = GroupSelector()
+
+        items = [
+            FileItem("..", tmp_path.parent, 0, datetime.now(), True, is_parent=True),
+            FileItem("file1.txt", tmp_path / "file1.txt", 100, datetime.now(), False),
+        ]
+
+        new_selected = selector.invert_selection(items, {str(tmp_path / "gone.txt")})
+
+        assert new_selected == {str(tmp_path / "file1.txt")}
+
 
 class TestQuickSearch:
     """Test quick search functionality."""
@@ -733,6 +817,47 @@ class TestQuickSearch:
         assert index is not None
         assert index == 1  # file1.txt
 
+    def test_quick_search_prefix_index_wraps_and_rebuilds(self, tmp_path):
+        """Test indexed search wraps around and follows list changes."""
+        search = QuickSearch()
+        search.activate()
+        search.add_char('f')
+
+        items = [
+            FileItem("..", tmp_path, 0, datetime.now(), True, is_parent=True),
+            FileItem("File2.txt", tmp_path / "File2.txt", 100, datetime.now(), False),
+            FileItem("data.txt", tmp_path / "data.txt", 100, datetime.now(), False),
+            FileItem("file1.txt", tmp_path / "file1.txt", 100, datetime.now(), False),
+        ]
+
+        assert search.find_next_match(items, 1) == 3
+        assert search.find_next_match(items, 3) == 1  # wraps
+        assert search.find_next_match(items, 0, case_sensitive=True) == 3
+        assert [r.index for r in search.find_all_matches(items)] == [1, 3]
+
+        other = [FileItem("foo", tmp_path / "foo", 0, datetime.now(), False)]
+        assert search.find_next_match(other, 0) == 0
+
+    def test_quick_search_follows_in_place_reorder(self, tmp_path):
+        """Test re-priming picks up a list changed in place."""
+        search = QuickSearch()
+        search.activate()
+        search.add_char('f')
+
+        items = [
+            FileItem("data.txt", tmp_path / "data.txt", 100, datetime.now(), False),
+            FileItem("file1.txt", tmp_path / "file1.txt", 100, datetime.now(), False),
+        ]
+        assert search.find_next_match(items, 0) == 1
+
+        items.reverse()
+        search.prime(items)
+        assert search.find_next_match(items, 1) == 0
+
+        items[0] = FileItem("zeta.txt", tmp_path / "zeta.txt", 100, datetime.now(), False)
+        search.prime(items)
+        assert search.find_next_match(items, 0) is None
+
 
 class TestFileItemModel:
     """Test FileItem model."""
@@ -771,6 +896,21 @@ class TestFileItemModel:
         assert item.is_dir
         assert item.is_parent
 
+    def test_file_item_sort_name(self, tmp_path):
+        """Test FileItem precomputes a lowercase sort name."""
+        item = FileItem("ReadMe.MD", tmp_path / "ReadMe.MD", 1, datetime.now(), False)
+
+        assert item.sort_name == "readme.md"
+        assert item == FileItem("ReadMe.MD", tmp_path / "ReadMe.MD", 1, item.modified, False)
+
+    def test_file_item_has_no_instance_dict(self, tmp_path):
+        """Test FileItem uses slots instead of a per-instance __dict__."""
+        item = FileItem("a.txt", tmp_path / "a.txt", 1, datetime.now(), False)
+
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.extra = True
+
     def test_file_item_directory(self, tmp_path):
         """Test directory FileItem."""
         dir_path = tmp_path / "subdir"
@@ -10,9 +10,12 @@ Tests cover:
 - Search history
 """
 
+import heapq
+import sys
 import unittest
 import time
 from pathlib import Path
+from unittest import mock
 
 from features.search_cache import (
     SearchResultCache, CacheEntry, QueryCache, SearchHistoryCache
@@ -27,8 +30,8 @@ class TestCacheEntry(unittest.TestCase):
         entry = CacheEntry(
             key='test',
             value=[1, 2, 3],
-            created_at=time.time(),
-            ttl=60.0
+            created_at_ns=time.monotonic_ns(),
+            ttl_ns=60 * 10**9
         )
 
         self.assertEqual(entry.key, 'test')
@@ -41,8 +44,8 @@ class TestCacheEntry(unittest.TestCase):
         entry = CacheEntry(
             key='test',
             value='data',
-            created_at=time.time(),
-            ttl=0.1
+            created_at_ns=time.monotonic_ns(),
+            ttl_ns=10**8
         )
 
         # Should not be expired immediately
@@ -57,8 +60,8 @@ class TestCacheEntry(unittest.TestCase):
         entry = CacheEntry(
             key='test',
             value='data',
-            created_at=time.time(),
-            ttl=60.0
+            created_at_ns=time.monotonic_ns(),
+            ttl_ns=60 * 10**9
         )
 
         initial_access = entry.last_access
@@ -70,6 +73,18 @@ class TestCacheEntry(unittest.TestCase):
         entry.touch()
         self.assertEqual(entry.access_count, 2)
 
+    def test_entry_has_no_instance_dict(self):
+        """Test entries use slots instead of a per-instance __dict__"""
+        entry = CacheEntry(
+            key='test',
+            value='data',
+            created_at_ns=time.monotonic_ns(),
+            ttl_ns=60 * 10**9
+        )
+
+        self.assertFalse(hasattr(entry, '__dict__'))
+        self.assertEqual(entry.expires_at, entry.created_at_ns + entry.ttl_ns)
+
 
 class TestSearchResultCache(unittest.TestCase):
     """Test SearchResultCache functionality"""
@@ -135,6 +150,107 @@ class TestSearchResultCache(unittest.TestCase):
         self.assertIsNotNone(cache.get('key3'))
         self.assertIsNotNone(cache.get('key4'))
 
+    def test_overwrite_at_capacity_keeps_other_entries(self):
+        """Test replacing a key in a full cache does not evict another"""
+        cache = SearchResultCache(max_entries=2)
+
+        cache.set('key1', 'value1')
+        cache.set('key2', 'value2')
+        cache.set('key2', 'updated')
+
+        self.assertEqual(cache.get('key1'), 'value1')
+        self.assertEqual(cache.get('key2'), 'updated')
+        self.assertEqual(cache.get_stats()['evictions'], 0)
+
+    def test_keys_are_interned(self):
+        """Test stored keys are interned"""
+        cache = SearchResultCache()
+
+        key = ''.join(['dyn', 'amic:', 'key'])
+        cache.set(key, 'value')
+
+        stored = next(iter(cache._cache))
+        self.assertIs(stored, sys.intern('dynamic:key'))
+
+    def test_batch_eviction(self):
+        """Test overflow evicts a batch of the least recently used entries"""
+        cache = SearchResultCache(max_entries=100)
+
+        for i in range(101):
+            cache.set(f'key{i}', f'value{i}')
+
+        # 100 // 20 = 5 entries evicted to make room for key100
+        self.assertEqual(len(cache._cache), 96)
+        self.assertEqual(cache.get_stats()['evictions'], 5)
+        self.assertIsNone(cache.get('key4'))
+        self.assertEqual(cache.get('key5'), 'value5')
+
+        # The freed slots absorb the next inserts without evicting
+        for i in range(101, 105):
+            cache.set(f'key{i}', f'value{i}')
+        self.assertEqual(len(cache._cache), 100)
+        self.assertEqual(cache.get_stats()['evictions'], 5)
+
+    def test_expired_entries_evicted_before_live_ones(self):
+        """Test a full cache reclaims expired entries before evicting by LRU"""
+        cache = SearchResultCache(max_entries=3, cleanup_interval=None)
+
+        cache.set('short', 'value', ttl=0.05)
+        cache.set('live1', 'value1')
+        cache.set('live2', 'value2')
+        time.sleep(0.1)
+
+        cache.set('live3', 'value3')
+
+        self.assertNotIn('short', cache._cache)
+        self.assertEqual(cache.get('live1'), 'value1')
+        self.assertEqual(cache.get('live2'), 'value2')
+        self.assertEqual(cache.get('live3'), 'value3')
+        stats = cache.get_stats()
+        self.assertEqual(stats['evictions'], 0)
+        self.assertEqual(stats['expirations'], 1)
+
+    def test_expired_get_counts_expiration(self):
+        """Test an expired entry found by get is dropped and counted"""
+        cache = SearchResultCache(default_ttl=0.05)
+
+        cache.set('key1', 'value1')
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get('key1'))
+        self.assertNotIn('key1', cache._cache)
+        self.assertEqual(cache.get_stats()['expirations'], 1)
+
+    def test_l1_hits_stay_consistent(self):
+        """Test values served from the L1 front cache track updates"""
+        cache = SearchResultCache()
+
+        cache.set('key1', 'value1')
+        self.assertEqual(cache.get('key1'), 'value1')
+        self.assertEqual(cache.get('key1'), 'value1')  # L1 hit
+
+        cache.set('key1', 'updated')
+        self.assertEqual(cache.get('key1'), 'updated')
+
+        cache.invalidate('key1')
+        self.assertIsNone(cache.get('key1'))
+        self.assertEqual(cache.get_stats()['hits'], 3)
+
+    def test_l1_hit_entry_survives_eviction(self):
+        """Test an entry kept hot through L1 is not evicted as LRU"""
+        cache = SearchResultCache(max_entries=3)
+
+        cache.set('hot', 'value')
+        cache.get('hot')
+        cache.set('key2', 'value2')
+        cache.set('key3', 'value3')
+        cache.get('hot')  # L1 hit, no LRU reordering
+
+        cache.set('key4', 'value4')
+
+        self.assertEqual(cache.get('hot'), 'value')
+        self.assertIsNone(cache.get('key2'))
+
     def test_memory_limit_eviction(self):
         """Test eviction based on memory limit"""
         # Small memory limit
@@ -147,6 +263,17 @@ class TestSearchResultCache(unittest.TestCase):
         # Should have evicted some entries
         self.assertLess(len(cache._cache), 20)
 
+    def test_oversized_value_not_cached(self):
+        """Test a value larger than the memory limit keeps existing entries"""
+        cache = SearchResultCache(max_entries=100, max_memory_mb=0.001)  # 1KB
+
+        cache.set('small', 'x' * 100)
+        cache.set('huge', 'x' * 5000)
+
+        self.assertIsNone(cache.get('huge'))
+        self.assertEqual(cache.get('small'), 'x' * 100)
+        self.assertLessEqual(cache.get_stats()['memory_bytes'], cache.max_memory_bytes)
+
     def test_invalidation(self):
         """Test cache invalidation"""
         cache = SearchResultCache()
@@ -182,6 +309,43 @@ class TestSearchResultCache(unittest.TestCase):
         # content: entry should remain
         self.assertIsNotNone(cache.get('content:test1'))
 
+    def test_prefix_invalidation(self):
+        """Test prefix-based invalidation leaves other keys intact"""
+        cache = SearchResultCache(max_entries=3)
+
+        cache.set('content:file:1', 'value0')
+        cache.set('file:test1', 'value1')
+        cache.set('file:test2', 'value2')
+        cache.set('file:test3', 'value3')  # Evicts content:file:1
+
+        self.assertEqual(cache.invalidate_prefix('file:'), 3)
+        self.assertEqual(len(cache._cache), 0)
+        self.assertEqual(cache._sorted_keys, [])
+
+        cache.set('file:a', 'a')
+        cache.set('other', 'b')
+        self.assertEqual(cache.invalidate_prefix('file:'), 1)
+        self.assertEqual(cache.get('other'), 'b')
+        self.assertEqual(cache.get_stats()['memory_bytes'], 1)
+
+    def test_prefix_index_built_on_demand(self):
+        """Test writes leave the key index unsorted and removed keys are skipped"""
+        cache = SearchResultCache()
+
+        cache.set('file:b', 'b')
+        cache.set('file:a', 'a')
+        self.assertIsNone(cache._sorted_keys)
+
+        self.assertEqual(cache.invalidate_prefix('none:'), 0)
+        self.assertEqual(cache._sorted_keys, ['file:a', 'file:b'])
+
+        cache.invalidate('file:a')
+        cache.set('file:b', 'new')  # Replacing keeps the index valid
+        self.assertIsNotNone(cache._sorted_keys)
+
+        self.assertEqual(cache.invalidate_prefix('file:'), 1)
+        self.assertEqual(len(cache._cache), 0)
+
     def test_cleanup_expired(self):
         """Test expired entry cleanup"""
         cache = SearchResultCache(default_ttl=0.1)
@@ -198,6 +362,18 @@ class TestSearchResultCache(unittest.TestCase):
         self.assertIsNone(cache.get('key1'))
         self.assertIsNotNone(cache.get('key2'))
 
+    def test_cleanup_expired_ignores_overwritten_entries(self):
+        """Test cleanup skips stale expiry records of replaced entries"""
+        cache = SearchResultCache(default_ttl=0.1)
+
+        cache.set('key1', 'old')
+        cache.set('key1', 'new', ttl=60.0)  # Replaces short-lived entry
+
+        time.sleep(0.15)
+
+        self.assertEqual(cache.cleanup_expired(), 0)
+        self.assertEqual(cache.get('key1'), 'new')
+
     def test_clear(self):
         """Test cache clearing"""
         cache = SearchResultCache()
@@ -234,6 +410,53 @@ class TestSearchResultCache(unittest.TestCase):
         self.assertGreater(stats['hit_rate'], 0)
 
 
+    def test_statistics_avg_ttl_tracks_removals(self):
+        """Test average TTL follows inserts, overwrites and removals"""
+        cache = SearchResultCache(max_entries=2)
+
+        cache.set('key1', 'value1', ttl=10.0)
+        cache.set('key2', 'value2', ttl=30.0)
+        self.assertAlmostEqual(cache.get_stats()['avg_ttl'], 20.0)
+
+        cache.set('key2', 'value2', ttl=50.0)  # Overwrite
+        cache.set('key3', 'value3', ttl=70.0)  # Evicts key1
+        self.assertAlmostEqual(cache.get_stats()['avg_ttl'], 60.0)
+
+        cache.invalidate('key2')
+        self.assertAlmostEqual(cache.get_stats()['avg_ttl'], 70.0)
+
+        cache.clear()
+        self.assertEqual(cache.get_stats()['avg_ttl'], 0)
+
+
+    def test_background_cleanup(self):
+        """Test expired entries are swept by the background timer"""
+        cache = SearchResultCache(default_ttl=0.05, cleanup_interval=0.05)
+        self.addCleanup(cache.close)
+
+        cache.set('key1', 'value1')
+
+        deadline = time.monotonic() + 2.0
+        while cache._cache and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        self.assertEqual(len(cache._cache), 0)
+
+    def test_background_cleanup_off_by_default(self):
+        """Test caches start no cleanup timer unless asked to"""
+        self.assertIsNone(SearchResultCache()._cleanup_timer)
+        self.assertIsNone(QueryCache().cache._cleanup_timer)
+
+    def test_close_stops_background_cleanup(self):
+        """Test close cancels the cleanup timer"""
+        cache = SearchResultCache(cleanup_interval=60.0)
+        self.assertIsNotNone(cache._cleanup_timer)
+
+        cache.close()
+
+        self.assertIsNone(cache._cleanup_timer)
+
+
 class TestQueryCache(unittest.TestCase):
     """Test QueryCache functionality"""
 
@@ -298,6 +521,18 @@ class TestQueryCache(unittest.TestCase):
         self.assertIsNotNone(cache.get_results(Path('/path2'), 'test', 'filename'))
 
 
+    def test_path_index_pruned_after_eviction(self):
+        """Test path index does not grow past evicted entries"""
+        cache = QueryCache(max_entries=5)
+
+        for i in range(50):
+            cache.cache_results(Path('/path'), f'pattern{i}', 'filename', [i])
+
+        self.assertLessEqual(cache._indexed_keys, 2 * 5)
+        self.assertEqual(cache.invalidate_path(Path('/path')), 5)
+        self.assertEqual(len(cache.cache._cache), 0)
+
+
 class TestSearchHistoryCache(unittest.TestCase):
     """Test SearchHistoryCache functionality"""
 
@@ -355,6 +590,17 @@ class TestSearchHistoryCache(unittest.TestCase):
         completions = history.get_completions('TEST', max_results=10)
         self.assertEqual(len(completions), 1)
 
+    def test_completion_prefix_without_match(self):
+        """Test completion for a prefix that diverges from history"""
+        history = SearchHistoryCache()
+
+        history.add_search('test file')
+        history.add_search('Tester')
+        history.add_search('tester')
+
+        self.assertEqual(history.get_completions('tex'), [])
+        self.assertEqual(history.get_completions('test'), ['test file', 'Tester', 'tester'])
+
     def test_max_history_limit(self):
         """Test history size limit"""
         history = SearchHistoryCache(max_history=5)
@@ -368,14 +614,25 @@ class TestSearchHistoryCache(unittest.TestCase):
         # Should only keep max_history entries
         self.assertLessEqual(len(recent), 5)
 
+    def test_max_history_keeps_newest(self):
+        """Test history trimming keeps the most recent searches"""
+        history = SearchHistoryCache(max_history=5)
+
+        for i in range(23):
+            history.add_search(f'query {i}')
+
+        recent = [query for query, _ in history.get_recent(limit=100)]
+
+        self.assertEqual(recent, [f'query {i}' for i in range(22, 17, -1)])
+        self.assertLessEqual(len(history._queries), 10)
+
     def test_recent_searches(self):
         """Test getting recent searches"""
         history = SearchHistoryCache()
 
         queries = ['query1', 'query2', 'query3']
-        for q in queries:
-            history.add_search(q)
-            time.sleep(0.01)  # Ensure different timestamps
+        for i, q in enumerate(queries):
+            history.add_search(q, _ts=1_700_000_000.0 + i)
 
         recent = history.get_recent(limit=2)
 
@@ -383,6 +640,7 @@ class TestSearchHistoryCache(unittest.TestCase):
         self.assertEqual(len(recent), 2)
         self.assertEqual(recent[0][0], 'query3')
         self.assertEqual(recent[1][0], 'query2')
+        self.assertGreater(recent[0][1], recent[1][1])
 
     def test_clear_history(self):
         """Test clearing history"""
@@ -407,20 +665,24 @@ class TestPerformance(unittest.TestCase):
         """Test cache operation performance"""
         cache = SearchResultCache(max_entries=10000)
 
+        # Build keys up front so timings measure cache work only
+        keys = [f'key{i}' for i in range(1000)]
+        values = [f'value{i}' for i in range(1000)]
+
         # Set performance
-        start = time.time()
-        for i in range(1000):
-            cache.set(f'key{i}', f'value{i}')
-        set_time = time.time() - start
+        start = time.perf_counter()
+        for key, value in zip(keys, values):
+            cache.set(key, value)
+        set_time = time.perf_counter() - start
 
         # Should be fast
         self.assertLess(set_time, 0.1)
 
         # Get performance
-        start = time.time()
-        for i in range(1000):
-            cache.get(f'key{i}')
-        get_time = time.time() - start
+        start = time.perf_counter()
+        for key in keys:
+            cache.get(key)
+        get_time = time.perf_counter() - start
 
         # Should be very fast
         self.assertLess(get_time, 0.05)
@@ -429,15 +691,55 @@ class TestPerformance(unittest.TestCase):
         print(f"  Set 1000 entries: {set_time*1000:.2f}ms")
         print(f"  Get 1000 entries: {get_time*1000:.2f}ms")
 
+    def test_cleanup_expired_performance(self):
+        """Test cleanup cost follows expired entries, not cache size"""
+        cache = SearchResultCache(max_entries=20000, default_ttl=60.0)
+
+        for i in range(10000):
+            cache.set(f'live{i}', i)
+        for i in range(10):
+            cache.set(f'short{i}', i, ttl=0.05)
+
+        time.sleep(0.1)
+
+        with mock.patch.object(heapq, 'heappop', wraps=heapq.heappop) as heappop:
+            count = cache.cleanup_expired()
+
+        self.assertEqual(count, 10)
+        self.assertEqual(len(cache._cache), 10000)
+        # Only the expired entries are taken off the heap
+        self.assertEqual(heappop.call_count, 10)
+
+    def test_key_generation_performance(self):
+        """Test query key generation performance"""
+        cache = QueryCache()
+        root = Path('/path')
+        patterns = [f'pattern{i}' for i in range(10000)]
+
+        start = time.perf_counter()
+        keys = {
+            cache.make_key(root, pattern, 'filename', case_sensitive=True)
+            for pattern in patterns
+        }
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(keys), 10000)
+        self.assertLess(elapsed, 0.5)
+
+        print(f"\nKey generation: {elapsed*1000:.2f}ms for 10000 keys")
+
     def test_eviction_performance(self):
         """Test LRU eviction performance"""
         cache = SearchResultCache(max_entries=100)
 
+        keys = [f'key{i}' for i in range(500)]
+        values = [f'value{i}' for i in range(500)]
+
         # Fill beyond capacity
-        start = time.time()
-        for i in range(500):
-            cache.set(f'key{i}', f'value{i}')
-        elapsed = time.time() - start
+        start = time.perf_counter()
+        for key, value in zip(keys, values):
+            cache.set(key, value)
+        elapsed = time.perf_counter() - start
 
         # Should handle eviction efficiently
         self.assertLess(elapsed, 0.5)
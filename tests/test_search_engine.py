@@ -9,8 +9,11 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import asyncio
+import os
 import unittest
 import tempfile
+from unittest import mock
 import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -48,6 +51,17 @@ class TestSearchOptions(unittest.TestCase):
         self.assertTrue(options.should_exclude_file(Path('debug.log')))
         self.assertFalse(options.should_exclude_file(Path('test.py')))
 
+    def test_exclude_patterns_changed_after_use(self):
+        """Test exclusion follows edits to the pattern list"""
+        options = SearchOptions(exclude_patterns=['*.tmp'])
+        self.assertTrue(options.should_exclude_file(Path('a.tmp')))
+
+        options.exclude_patterns.append('*.bak')
+        self.assertTrue(options.should_exclude_file(Path('a.bak')))
+
+        options.exclude_patterns.clear()
+        self.assertFalse(options.should_exclude_file(Path('a.tmp')))
+
     def test_extension_filter(self):
         """Test extension filtering"""
         options = SearchOptions(file_extensions=['.py', '.txt'])
@@ -57,6 +71,29 @@ class TestSearchOptions(unittest.TestCase):
         self.assertFalse(options.matches_extension_filter(Path('image.jpg')))
 
 
+    def test_extension_filter_case_and_updates(self):
+        """Test extension matching ignores case and follows list edits"""
+        options = SearchOptions(file_extensions=['.PY'])
+        self.assertTrue(options.matches_extension_filter(Path('test.py')))
+        self.assertFalse(options.matches_extension_filter(Path('notes.md')))
+
+        options.file_extensions.append('.md')
+        self.assertTrue(options.matches_extension_filter(Path('NOTES.MD')))
+
+    def test_combined_name_filter_matches_separate_checks(self):
+        """Test the fused exclude and extension check agrees with both"""
+        names = ['a.py', 'A.PY', '.py', 'test_a.py', 'b.txt', 'c.txt.bak', 'README']
+        for extensions in (None, ['.py', '.TXT'], ['py'], ['']):
+            options = SearchOptions(
+                exclude_patterns=['test_*', '*.bak'], file_extensions=extensions
+            )
+            name_filter = options._file_name_filter()
+            for name in names:
+                expected = (not options.should_exclude_file(Path(name))
+                            and options.matches_extension_filter(Path(name)))
+                self.assertEqual(name_filter(name), expected, (extensions, name))
+
+
 class TestFileFilter(unittest.TestCase):
     """Test FileFilter operations"""
 
@@ -107,6 +144,14 @@ class TestFileFilter(unittest.TestCase):
         filter = FileFilter('size', FilterOperator.EQUALS, file_size)
         self.assertTrue(filter.matches(self.test_file))
 
+    def test_filter_value_change_after_use(self):
+        """Test a filter re-reads its value after being changed"""
+        filter = FileFilter('name', FilterOperator.REGEX, r'^test')
+        self.assertTrue(filter.matches(self.test_file))
+
+        filter.value = r'^other'
+        self.assertFalse(filter.matches(self.test_file))
+
     def test_extension_filter(self):
         """Test extension filter"""
         filter = FileFilter('extension', FilterOperator.EQUALS, '.txt')
@@ -160,6 +205,58 @@ class TestFilterCriteria(unittest.TestCase):
         )
         self.assertTrue(criteria.matches(self.test_file))
 
+    def test_stat_shared_across_filters(self):
+        """Test the file is stat'd once for several metadata filters"""
+        criteria = FilterCriteria(
+            filters=[
+                FileFilter('size', FilterOperator.GREATER, 0),
+                FileFilter('modified', FilterOperator.GREATER, datetime(2000, 1, 1))
+            ],
+            operator=LogicalOperator.AND
+        )
+
+        real_stat = Path.stat
+        with mock.patch.object(Path, 'stat', autospec=True,
+                               side_effect=real_stat) as stat:
+            self.assertTrue(criteria.matches(self.test_file))
+
+        self.assertEqual(stat.call_count, 1)
+
+    def test_cheap_filters_evaluated_first(self):
+        """Test a failing name check avoids stat() even when listed last"""
+        criteria = FilterCriteria(
+            filters=[
+                FileFilter('size', FilterOperator.GREATER, 0),
+                FileFilter('extension', FilterOperator.EQUALS, '.py')
+            ],
+            operator=LogicalOperator.AND
+        )
+
+        with mock.patch.object(Path, 'stat', autospec=True) as stat:
+            self.assertFalse(criteria.matches(self.test_file))
+        stat.assert_not_called()
+
+        criteria.preserve_order = True
+        real_stat = Path.stat
+        with mock.patch.object(Path, 'stat', autospec=True,
+                               side_effect=real_stat) as stat:
+            self.assertFalse(criteria.matches(self.test_file))
+        self.assertEqual(stat.call_count, 1)
+
+    def test_filter_replaced_in_place(self):
+        """Test swapping a filter in place takes effect on the next match"""
+        criteria = FilterCriteria(
+            filters=[
+                FileFilter('name', FilterOperator.CONTAINS, 'test'),
+                FileFilter('extension', FilterOperator.EQUALS, '.txt')
+            ],
+            operator=LogicalOperator.AND
+        )
+        self.assertTrue(criteria.matches(self.test_file))
+
+        criteria.filters[1] = FileFilter('extension', FilterOperator.EQUALS, '.py')
+        self.assertFalse(criteria.matches(self.test_file))
+
     def test_not_operator(self):
         """Test NOT operator"""
         criteria = FilterCriteria(
@@ -217,6 +314,13 @@ class TestFileSearch(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].path.name, 'README.md')
 
+    def test_search_exact_match_ignores_case(self):
+        """Test a pattern without wildcards matches names case-insensitively"""
+        searcher = FileSearch()
+        results = list(searcher.search_files(self.root, 'readme.MD'))
+
+        self.assertEqual([r.path.name for r in results], ['README.md'])
+
     def test_search_regex_pattern(self):
         """Test search with regex pattern"""
         searcher = FileSearch()
@@ -260,6 +364,22 @@ class TestFileSearch(unittest.TestCase):
         # Should not find cache.pyc in __pycache__
         self.assertEqual(len(results), 0)
 
+    def test_excluded_directories_not_opened(self):
+        """Test excluded directories are skipped without being listed"""
+        scanned = []
+        real_scandir = os.scandir
+
+        def tracking_scandir(path):
+            scanned.append(Path(path).name)
+            return real_scandir(path)
+
+        searcher = FileSearch(max_workers=1)
+        with mock.patch('features.search_engine.os.scandir', side_effect=tracking_scandir):
+            list(searcher.search_files(self.root, '*'))
+
+        self.assertIn('subdir', scanned)
+        self.assertNotIn('__pycache__', scanned)
+
     def test_search_max_depth(self):
         """Test max depth limitation"""
         # Create deeper structure
@@ -304,6 +424,62 @@ class TestFileSearch(unittest.TestCase):
             self.assertIsNotNone(result.matched_line)
             self.assertIn('hello', result.matched_line.lower())
 
+    def test_content_search_literal_skips_non_matching_files(self):
+        """Test case-sensitive literal search only decodes files containing it"""
+        searcher = FileSearch()
+        options = SearchOptions(case_sensitive=True)
+
+        with mock.patch.object(
+            FileSearch, '_search_small_file', autospec=True,
+            side_effect=FileSearch._search_small_file
+        ) as search_small:
+            results = list(searcher.search_content(self.root, 'hello', options))
+
+        self.assertEqual({r.path.name for r in results}, {'test1.txt', 'test2.py'})
+        self.assertEqual(search_small.call_count, 2)
+
+    def test_content_search_async_matches_sync(self):
+        """Test the aiofiles content search returns the same matches"""
+        (self.root / 'crlf.txt').write_bytes(b'one\r\nhello there\r\nthree')
+        searcher = FileSearch()
+
+        sync_results = list(searcher.search_content(self.root, 'hello', context_lines=1))
+        async_results = asyncio.run(
+            searcher.search_content_async(self.root, 'hello', context_lines=1)
+        )
+
+        def summary(results):
+            return sorted(
+                (r.path.name, r.line_number, r.matched_line, r.match_context)
+                for r in results
+            )
+
+        self.assertEqual(summary(async_results), summary(sync_results))
+        self.assertIn(('crlf.txt', 2, 'hello there', 'one\nhello there\nthree'),
+                      summary(async_results))
+
+    def test_content_search_async_stops_at_max_results(self):
+        """Test the async search reads no further files once the limit is met"""
+        for i in range(20):
+            (self.root / f'many{i}.txt').write_text('hello again')
+        searcher = FileSearch()
+        options = SearchOptions(max_results=3)
+
+        sync_results = list(searcher.search_content(self.root, 'hello', options))
+        with mock.patch.object(
+            FileSearch, '_search_file_content_async', autospec=True,
+            side_effect=FileSearch._search_file_content_async
+        ) as search_file:
+            async_results = asyncio.run(searcher.search_content_async(
+                self.root, 'hello', options, max_open_files=2
+            ))
+
+        self.assertEqual(
+            [(r.path, r.line_number) for r in async_results],
+            [(r.path, r.line_number) for r in sync_results]
+        )
+        self.assertLess(search_file.call_count, 10)
+
     def test_content_search_regex(self):
         """Test content search with regex"""
         searcher = FileSearch()
@@ -313,6 +489,18 @@ class TestFileSearch(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].path.name, 'test2.py')
 
+    def test_content_search_anchored_regex(self):
+        """Test anchors apply per line and line numbers are exact"""
+        lines_file = self.root / 'lines.txt'
+        lines_file.write_text('start a\nno start\nstart b\n\nstart c')
+
+        searcher = FileSearch()
+        options = SearchOptions(use_regex=True, file_extensions=['.txt'])
+        results = list(searcher.search_content(self.root, r'^start \w$', options))
+
+        found = sorted((r.line_number, r.matched_line) for r in results)
+        self.assertEqual(found, [(1, 'start a'), (3, 'start b'), (5, 'start c')])
+
     def test_content_search_with_context(self):
         """Test content search with context lines"""
         # Create file with multiple lines
@@ -328,6 +516,87 @@ class TestFileSearch(unittest.TestCase):
         self.assertIn('line2', result.match_context)
         self.assertIn('line4', result.match_context)
 
+    def test_search_files_batched(self):
+        """Test batches are capped by batch_size and max_results"""
+        for i in range(10):
+            (self.root / f'batch{i}.log').write_text('x')
+
+        searcher = FileSearch()
+        batches = list(searcher.search_files_batched(self.root, 'batch*', batch_size=4))
+        self.assertEqual([len(b) for b in batches], [4, 4, 2])
+
+        options = SearchOptions(max_results=5)
+        batches = list(searcher.search_files_batched(
+            self.root, 'batch*', options, batch_size=4
+        ))
+        self.assertEqual(sum(len(b) for b in batches), 5)
+
+    def test_parallel_walk_matches_serial(self):
+        """Test the threaded walk yields the same files in the same order"""
+        for i in range(5):
+            nested = self.root / f'dir{i}' / 'inner'
+            nested.mkdir(parents=True)
+            (nested / f'deep{i}.txt').write_text('deep')
+
+        serial = FileSearch(max_workers=1)
+        parallel = FileSearch(max_workers=4)
+
+        serial_paths = [r.path for r in serial.search_files(self.root, '*.txt')]
+        parallel_paths = [r.path for r in parallel.search_files(self.root, '*.txt')]
+
+        self.assertEqual(len(serial_paths), 7)
+        self.assertEqual(parallel_paths, serial_paths)
+
+        options = SearchOptions(max_results=3)
+        limited = [r.path for r in parallel.search_files(self.root, '*.txt', options)]
+        self.assertEqual(limited, serial_paths[:3])
+
+    def test_walk_pool_created_once_and_only_when_branching(self):
+        """Test shallow walks stay on the calling thread and the pool is reused"""
+        flat = self.root / 'flat'
+        flat.mkdir()
+        (flat / 'only.txt').write_text('x')
+        searcher = FileSearch(max_workers=4)
+        self.addCleanup(searcher.shutdown)
+
+        list(searcher.search_files(flat, '*.txt'))
+        self.assertIsNone(searcher._walk_pool)
+
+        for i in range(2):
+            (self.root / f'branch{i}').mkdir()
+        list(searcher.search_files(self.root, '*.txt'))
+        pool = searcher._walk_pool
+        self.assertIsNotNone(pool)
+
+        list(searcher.search_files(self.root, '*.txt'))
+        self.assertIs(searcher._walk_pool, pool)
+
+    def test_result_cache_reuses_identical_search(self):
+        """Test repeated searches are served from the result cache"""
+        searcher = FileSearch(cache_ttl=60.0)
+        first = list(searcher.search_files(self.root, '*.txt'))
+
+        with mock.patch.object(FileSearch, '_iter_files') as walk:
+            second = list(searcher.search_files(self.root, '*.txt'))
+        walk.assert_not_called()
+        self.assertEqual([r.path for r in second], [r.path for r in first])
+
+        # A change in the root directory invalidates the entry
+        (self.root / 'new.txt').write_text('new')
+        os.utime(self.root, ns=(0, 0))
+        third = list(searcher.search_files(self.root, '*.txt'))
+        self.assertIn('new.txt', {r.path.name for r in third})
+
+    def test_result_cache_disabled_by_default(self):
+        """Test searches walk the tree each time unless caching is enabled"""
+        searcher = FileSearch()
+        list(searcher.search_files(self.root, '*.txt'))
+
+        (self.root / 'subdir' / 'later.txt').write_text('later')
+        results = list(searcher.search_files(self.root, '*.txt'))
+
+        self.assertIn('later.txt', {r.path.name for r in results})
+
     def test_stop_search(self):
         """Test stopping search operation"""
         # Create many files
@@ -440,6 +709,25 @@ class TestConvenienceFunctions(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].name, 'test.txt')
 
+    def test_get_matching_files_stats_only_name_matches(self):
+        """Test files failing a name filter are never stat'd"""
+        criteria = FilterCriteria(
+            filters=[
+                FileFilter('size', FilterOperator.GREATER, 0),
+                FileFilter('extension', FilterOperator.EQUALS, '.txt')
+            ]
+        )
+
+        real_stat = Path.stat
+        with mock.patch.object(Path, 'stat', autospec=True,
+                               side_effect=real_stat) as stat:
+            results = get_matching_files(self.root, criteria)
+
+        self.assertEqual([p.name for p in results], ['test.txt'])
+        statted = [c.args[0].name for c in stat.call_args_list]
+        self.assertIn('test.txt', statted)
+        self.assertNotIn('data.json', statted)
+
 
 class TestSearchResult(unittest.TestCase):
     """Test SearchResult dataclass"""
@@ -462,6 +750,16 @@ class TestSearchResult(unittest.TestCase):
         self.assertIsNotNone(result.modified_time)
         self.assertGreater(result.file_size, 0)
 
+    def test_result_uses_given_stat(self):
+        """Test metadata is taken from a supplied stat result"""
+        stat = self.test_file.stat()
+        self.test_file.write_text('longer content now')
+
+        result = SearchResult(path=self.test_file, stat_result=stat)
+
+        self.assertEqual(result.file_size, stat.st_size)
+        self.assertEqual(result.modified_time, datetime.fromtimestamp(stat.st_mtime))
+
     def test_result_with_match_info(self):
         """Test result with match information"""
         result = SearchResult(
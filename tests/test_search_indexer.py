@@ -9,11 +9,14 @@ Tests cover:
 - Performance benchmarks
 """
 
+import dataclasses
+import pickle
 import unittest
 import tempfile
 import shutil
 import time
 from pathlib import Path
+from unittest import mock
 
 from features.search_indexer import FileIndexer, SearchIndex, IndexEntry
 
@@ -118,6 +121,20 @@ class TestSearchIndex(unittest.TestCase):
         self.assertIn('test1.txt', result_names)
         self.assertIn('test2.txt', result_names)
 
+    def test_prefix_search_sees_later_additions(self):
+        """Test names added after a prefix search are found by the next one"""
+        for file in self.files[:2]:
+            self.index.add_entry(IndexEntry.from_path(file))
+        self.assertEqual(len(self.index.search_prefix('te')), 2)
+
+        late = self.root / 'tea.txt'
+        late.write_text('content')
+        self.index.add_entry(IndexEntry.from_path(late))
+
+        result_names = {r.name for r in self.index.search_prefix('te')}
+        self.assertEqual(result_names, {'test1.txt', 'test2.txt', 'tea.txt'})
+        self.assertEqual(self.index.search_prefix('tex'), [])
+
     def test_fuzzy_search(self):
         """Test fuzzy search with trigrams"""
         for file in self.files:
@@ -137,6 +154,47 @@ class TestSearchIndex(unittest.TestCase):
         results = self.index.search_fuzzy('test')
         self.assertGreater(len(results), 0)
 
+    def test_fuzzy_search_min_score(self):
+        """Test min_score drops weak matches and keeps strong ones"""
+        for file in self.files:
+            self.index.add_entry(IndexEntry.from_path(file))
+
+        all_results = self.index.search_fuzzy('test1.txt')
+        strong = self.index.search_fuzzy('test1.txt', min_score=0.5)
+
+        self.assertEqual(strong, [r for r in all_results if r[1] >= 0.5])
+        self.assertEqual(strong[0][0].name, 'test1.txt')
+
+    def test_fuzzy_prefix_floor_keeps_top_results(self):
+        """Test prefix hits filling max_results give the same top scores"""
+        for i in range(5):
+            path = self.root / f'testfile{i}.txt'
+            path.write_text('content')
+            self.index.add_entry(IndexEntry.from_path(path))
+        for file in self.files:
+            self.index.add_entry(IndexEntry.from_path(file))
+
+        everything = self.index.search_fuzzy('testfile', max_results=1000)
+        top = self.index.search_fuzzy('testfile', max_results=3)
+
+        self.assertEqual([s for _, s in top], [s for _, s in everything[:3]])
+        self.assertTrue(all(e.name.startswith('testfile') for e, _ in top))
+
+    def test_repeated_queries_memoized(self):
+        """Test repeated queries reuse results until the index changes"""
+        for file in self.files:
+            self.index.add_entry(IndexEntry.from_path(file))
+
+        first = self.index.search_fuzzy('test1.txt')
+        first.clear()
+        with mock.patch.object(SearchIndex, '_search_fuzzy') as search:
+            second = self.index.search_fuzzy('test1.txt')
+        search.assert_not_called()
+        self.assertEqual(second[0][0].name, 'test1.txt')
+
+        self.index.remove_entry(self.files[0])
+        self.assertNotIn('test1.txt', {e.name for e, _ in self.index.search_fuzzy('test1.txt')})
+
     def test_extension_search(self):
         """Test search by extension"""
         for file in self.files:
@@ -185,6 +243,63 @@ class TestSearchIndex(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertNotEqual(results[0].modified, entry.modified)
 
+    def test_update_keeps_trigram_postings_unique(self):
+        """Test re-adding entries leaves each posting sorted without duplicates"""
+        for file in self.files:
+            self.index.add_entry(IndexEntry.from_path(file))
+        self.index.add_entry(IndexEntry.from_path(self.files[0]))
+
+        posting = self.index.trigram_index['tes']
+        self.assertEqual(list(posting), [0, 1])
+
+        self.index.remove_entry(self.files[0])
+        self.assertEqual(list(self.index.trigram_index['tes']), [1])
+
+    def test_pickle_round_trip(self):
+        """Test a pickled index keeps entries, removals and lookups"""
+        for file in self.files:
+            self.index.add_entry(IndexEntry.from_path(file))
+        self.index.remove_entry(self.files[0])
+
+        restored = pickle.loads(pickle.dumps(self.index))
+
+        self.assertEqual(restored.entries, self.index.entries)
+        self.assertEqual(restored.file_count, self.index.file_count)
+        self.assertEqual([r.name for r in restored.search_prefix('test')], ['test2.txt'])
+        self.assertEqual(restored.search_fuzzy('other.py'), self.index.search_fuzzy('other.py'))
+
+    def test_trigrams_generated_once_per_added_entry(self):
+        """Test indexing an entry generates its trigrams once and counts them"""
+        entries = [IndexEntry.from_path(file) for file in self.files]
+
+        with mock.patch.object(
+            IndexEntry, '_generate_trigrams', wraps=IndexEntry._generate_trigrams
+        ) as generate:
+            self.index.add_entries(entries)
+
+        self.assertEqual(generate.call_count, len(entries))
+        self.assertEqual(entries[0].trigram_count, len(entries[0].trigrams))
+
+        restored = pickle.loads(pickle.dumps(self.index))
+        self.assertEqual(
+            [e.trigram_count for e in restored.entries],
+            [e.trigram_count for e in entries]
+        )
+
+    def test_update_with_changed_name_moves_indices(self):
+        """Test an updated entry is moved between name, extension and trigram indices"""
+        entry = IndexEntry.from_path(self.files[0])
+        self.index.add_entry(entry)
+        self.index.add_entry(dataclasses.replace(
+            entry, name='notes.md', name_lower='notes.md', extension='.md'
+        ))
+
+        self.assertEqual(self.index.search_exact('test1.txt'), [])
+        self.assertEqual(len(self.index.search_exact('notes.md')), 1)
+        self.assertEqual(self.index.search_by_extension('.txt'), [])
+        self.assertEqual(list(self.index.trigram_index['st1']), [])
+        self.assertEqual(list(self.index.trigram_index['not']), [0])
+
     def test_statistics(self):
         """Test index statistics"""
         for file in self.files:
@@ -260,6 +375,30 @@ class TestFileIndexer(unittest.TestCase):
         results = index.search_exact('deep.txt')
         self.assertEqual(len(results), 0)
 
+    def test_parallel_build_matches_serial(self):
+        """Test the threaded walk indexes the same files as the serial one"""
+        for i in range(3):
+            nested = self.root / f'l1_{i}' / 'l2'
+            nested.mkdir(parents=True)
+            (nested / f'deep{i}.txt').write_text('deep')
+            (nested.parent / f'mid{i}.txt').write_text('mid')
+
+        for max_depth in (None, 1):
+            serial = FileIndexer(cache_dir=self.cache_dir, max_workers=1)
+            parallel = FileIndexer(cache_dir=self.cache_dir, max_workers=4)
+
+            serial_index = serial.build_index(
+                self.root, max_depth=max_depth, force_rebuild=True
+            )
+            parallel_index = parallel.build_index(
+                self.root, max_depth=max_depth, force_rebuild=True
+            )
+
+            self.assertEqual(
+                {e.path for e in parallel_index.entries if e},
+                {e.path for e in serial_index.entries if e}
+            )
+
     def test_incremental_update(self):
         """Test incremental file update"""
         index = self.indexer.build_index(self.root)
@@ -295,6 +434,45 @@ class TestFileIndexer(unittest.TestCase):
         # Should have same file count
         self.assertEqual(index2.file_count, index1.file_count)
 
+    def test_cached_index_loaded_without_walk(self):
+        """Test a saved index is reused with its lookups intact"""
+        index1 = self.indexer.build_index(self.root)
+
+        indexer2 = FileIndexer(cache_dir=self.cache_dir)
+        with mock.patch.object(FileIndexer, '_walk_and_index_parallel') as walk:
+            index2 = indexer2.build_index(self.root)
+        walk.assert_not_called()
+
+        self.assertEqual(
+            {e.path for e in index2.entries if e},
+            {e.path for e in index1.entries if e}
+        )
+        self.assertEqual(len(index2.search_exact('file3.txt')), 1)
+        self.assertEqual(index2.search_fuzzy('file1.txt')[0][0].name, 'file1.txt')
+
+    def test_cache_rebuilt_after_nested_change(self):
+        """Test files added or removed below the root invalidate the cache"""
+        sub = self.root / 'sub' / 'deeper'
+        sub.mkdir(parents=True)
+        (sub / 'old.txt').write_text('old')
+        self.indexer.build_index(self.root)
+
+        (sub / 'newfile.txt').write_text('new')
+        index = FileIndexer(cache_dir=self.cache_dir).build_index(self.root)
+        self.assertEqual(len(index.search_exact('newfile.txt')), 1)
+
+        (sub / 'old.txt').unlink()
+        index = FileIndexer(cache_dir=self.cache_dir).build_index(self.root)
+        self.assertEqual(len(index.search_exact('old.txt')), 0)
+
+    def test_cache_separate_per_max_depth(self):
+        """Test an index built with a depth limit isn't reused without one"""
+        shallow = self.indexer.build_index(self.root, max_depth=0)
+        self.assertEqual(len(shallow.search_exact('file3.txt')), 0)
+
+        full = FileIndexer(cache_dir=self.cache_dir).build_index(self.root)
+        self.assertEqual(len(full.search_exact('file3.txt')), 1)
+
     def test_cache_invalidation(self):
         """Test cache invalidation on file changes"""
         # Build index
@@ -396,16 +574,18 @@ class TestPerformance(unittest.TestCase):
 
     def test_memory_efficiency(self):
         """Test memory usage of index"""
-        import sys
-
-        index = self.indexer.build_index(self.root)
-
-        # Estimate memory usage (rough approximation)
-        entry_size = sys.getsizeof(index.entries[0]) if index.entries else 0
-        total_entries_size = len(index.entries) * entry_size
-        index_overhead = sys.getsizeof(index.name_index) + sys.getsizeof(index.trigram_index)
-
-        total_mb = (total_entries_size + index_overhead) / (1024 * 1024)
+        import tracemalloc
+
+        tracemalloc.start()
+        try:
+            index = self.indexer.build_index(self.root)
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        # Everything allocated by the build and still held, including the
+        # entries' paths and strings and the posting lists
+        total_mb = sum(stat.size for stat in snapshot.statistics('filename')) / (1024 * 1024)
 
         # Should be memory efficient
         # Target: <100MB for 100,000 files, so <1MB for 1,000 files
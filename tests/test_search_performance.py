@@ -9,11 +9,13 @@ Benchmarks:
 - Memory usage analysis
 """
 
+import gc
 import unittest
 import tempfile
 import shutil
 import time
 import sys
+import tracemalloc
 from pathlib import Path
 from typing import List, Tuple
 
@@ -26,17 +28,46 @@ class PerformanceBenchmark:
     """Performance benchmark helper"""
 
     @staticmethod
-    def measure_time(func, *args, **kwargs) -> Tuple[float, any]:
-        """Measure execution time of function"""
-        start = time.time()
-        result = func(*args, **kwargs)
-        elapsed = time.time() - start
-        return elapsed, result
+    def measure_time(func, *args, repeat: int = 1, **kwargs) -> Tuple[float, any]:
+        """
+        Measure execution time of function
+
+        Uses the high-resolution counter with garbage collection paused.
+        With repeat > 1 the best of that many runs is reported; only use it
+        for calls without side effects such as filling a cache.
+        """
+        best = None
+        result = None
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter_ns()
+                result = func(*args, **kwargs)
+                elapsed = time.perf_counter_ns() - start
+                if best is None or elapsed < best:
+                    best = elapsed
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return best / 1e9, result
 
     @staticmethod
-    def measure_memory(obj) -> float:
-        """Estimate memory usage in MB (rough approximation)"""
-        return sys.getsizeof(obj) / (1024 * 1024)
+    def measure_memory(func, *args, **kwargs) -> Tuple[float, any]:
+        """
+        Measure memory allocated by function and still held afterwards, in MB
+
+        Traces allocations with tracemalloc, so nested objects are counted
+        rather than only the shallow size of the returned object.
+        """
+        tracemalloc.start()
+        try:
+            result = func(*args, **kwargs)
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        total = sum(stat.size for stat in snapshot.statistics('filename'))
+        return total / (1024 * 1024), result
 
     @staticmethod
     def create_test_files(root: Path, count: int) -> List[Path]:
@@ -150,20 +181,24 @@ class TestIndexBuildPerformance(unittest.TestCase):
 class TestSearchQueryPerformance(unittest.TestCase):
     """Benchmark search query performance"""
 
-    def setUp(self):
-        """Set up test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.root = Path(self.temp_dir)
-        self.benchmark = PerformanceBenchmark()
+    @classmethod
+    def setUpClass(cls):
+        """Create the file tree once; the tests only read it"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.root = Path(cls.temp_dir)
+        cls.benchmark = PerformanceBenchmark()
 
         # Create test files
-        self.benchmark.create_test_files(self.root, 10000)
-
-        self.searcher = AdvancedFileSearch()
+        cls.benchmark.create_test_files(cls.root, 10000)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment"""
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        """Set up a fresh search engine per test"""
+        self.searcher = AdvancedFileSearch()
 
     def test_exact_search_performance(self):
         """Benchmark: Exact filename search"""
@@ -253,18 +288,23 @@ class TestSearchQueryPerformance(unittest.TestCase):
 class TestCachePerformance(unittest.TestCase):
     """Benchmark cache performance"""
 
-    def setUp(self):
-        """Set up test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.root = Path(self.temp_dir)
-        self.benchmark = PerformanceBenchmark()
+    @classmethod
+    def setUpClass(cls):
+        """Create the file tree once; the tests only read it"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.root = Path(cls.temp_dir)
+        cls.benchmark = PerformanceBenchmark()
 
-        self.benchmark.create_test_files(self.root, 1000)
-        self.searcher = AdvancedFileSearch()
+        cls.benchmark.create_test_files(cls.root, 1000)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment"""
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        """Set up a fresh search engine per test"""
+        self.searcher = AdvancedFileSearch()
 
     def test_cache_hit_performance(self):
         """Benchmark: Cache hit performance"""
@@ -279,7 +319,8 @@ class TestCachePerformance(unittest.TestCase):
         # Second search (cache hit)
         elapsed_hit, results2 = self.benchmark.measure_time(
             self.searcher.search_files,
-            self.root, 'file*.txt', options
+            self.root, 'file*.txt', options,
+            repeat=5
         )
 
         self.assertEqual(len(results1), len(results2))
@@ -307,7 +348,8 @@ class TestCachePerformance(unittest.TestCase):
 
         # Retrieve performance
         elapsed_get, _ = self.benchmark.measure_time(
-            lambda: [cache.get(f'key{i}') for i in range(1000)]
+            lambda: [cache.get(f'key{i}') for i in range(1000)],
+            repeat=5
         )
 
         print(f"\n📊 Cache Operations (1K entries):")
@@ -334,26 +376,12 @@ class TestMemoryUsage(unittest.TestCase):
         self.benchmark.create_test_files(self.root, 10000)
 
         indexer = FileIndexer(cache_dir=Path(self.temp_dir) / 'cache')
-        index = indexer.build_index(self.root)
-
-        # Estimate memory usage
-        entry_size = sys.getsizeof(index.entries[0]) if index.entries else 0
-        entries_mb = (len(index.entries) * entry_size) / (1024 * 1024)
-
-        indices_mb = (
-            sys.getsizeof(index.name_index) +
-            sys.getsizeof(index.extension_index) +
-            sys.getsizeof(index.trigram_index)
-        ) / (1024 * 1024)
-
-        total_mb = entries_mb + indices_mb
+        total_mb, index = self.benchmark.measure_memory(indexer.build_index, self.root)
 
         # Performance target: <10MB for 10K files
         self.assertLess(total_mb, 10)
 
-        print(f"\n📊 Memory Usage (10K files):")
-        print(f"   Entries: {entries_mb:.2f}MB")
-        print(f"   Indices: {indices_mb:.2f}MB")
+        print(f"\n📊 Memory Usage ({index.file_count} files):")
         print(f"   Total: {total_mb:.2f}MB")
         print(f"   ✅ Target: <10MB - {'PASS' if total_mb < 10 else 'FAIL'}")
 
@@ -492,6 +492,22 @@ class TestThemeManager:
 
         assert result is None
 
+    def test_get_available_themes_tracks_directory_changes(self, theme_manager, sample_theme):
+        """Test available theme list follows saves, deletes and external files."""
+        theme_manager.save_theme(sample_theme)
+        assert "test_theme" in theme_manager.get_available_themes()
+
+        theme_manager.save_custom_theme("custom1", sample_theme)
+        assert "custom1" in theme_manager.get_available_themes()
+
+        theme_manager.delete_custom_theme("custom1")
+        assert "custom1" not in theme_manager.get_available_themes()
+
+        (theme_manager.themes_dir / "test_theme.json").unlink()
+        theme_manager._invalidate_theme_names()
+        assert "test_theme" not in theme_manager.get_available_themes()
+        assert "test_theme" not in theme_manager._themes_cache
+
 
 # ============================================================================
 # Theme and ThemeMetadata Tests
@@ -647,6 +663,13 @@ class TestTheme:
         assert Theme._is_valid_color("") is False
         assert Theme._is_valid_color(None) is False
 
+    def test_is_valid_color_rejects_int_literal_forms(self):
+        """Test _is_valid_color rejects strings int() would parse as hex."""
+        assert Theme._is_valid_color("#0x1234") is False
+        assert Theme._is_valid_color("#12_456") is False
+        assert Theme._is_valid_color("# 12345") is False
+        assert Theme._is_valid_color("#+FF") is False
+
 
 class TestThemeMetadata:
     """Tests for ThemeMetadata class."""